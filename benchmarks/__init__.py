@@ -0,0 +1,3 @@
+"""
+성능 측정용 벤치마크 스크립트 모음 (`python -m benchmarks.<모듈명>`으로 실행)
+"""
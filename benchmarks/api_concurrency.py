@@ -0,0 +1,120 @@
+"""
+POST /daily-logs 동시 요청 부하 벤치마크
+
+쓰기 지연을 설정한 인메모리 Notion 에뮬레이터에 실제 NotionClientWrapper를 연결해
+동시 요청을 보내고, 요청들이 서로를 기다리며 직렬로 처리되는지(이벤트 루프 블로킹)
+아니면 스레드 풀에서 병렬로 처리되는지 측정한다.
+
+사용 예시:
+    python -m benchmarks.api_concurrency --requests 32 --concurrency 8 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from scripts.api.app import app, get_notion_client
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.notion_emulator import NotionEmulator
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+
+SAMPLE_PAYLOAD = {
+    "title": "부하 테스트 로그",
+    "context": "### Situation\n부하 테스트\n\n### Result\n응답 시간 측정",
+    "category": "기타",
+    "impact_level": "Low",
+    "tech_stack": ["Python"],
+}
+
+
+def build_notion(latency: float) -> NotionClientWrapper:
+    """요청마다 latency초가 걸리는 에뮬레이터에 연결한 래퍼 (클라이언트 측 속도 제한 없음)"""
+    emulator = NotionEmulator(latency=latency)
+    emulator.add_database("bench-db")
+    return NotionClientWrapper(
+        client=emulator,
+        scheduler=RequestScheduler(rate=1_000_000, burst=1_000_000),
+        settings=Settings(notion_daily_db="bench-db"),
+    )
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """정렬된 표본에서 근사 백분위 값을 계산"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_benchmark(requests: int, concurrency: int, latency: float) -> dict:
+    """동시 요청을 보내면서 /health 응답 시간을 함께 측정"""
+    notion = build_notion(latency)
+    app.dependency_overrides[get_notion_client] = lambda: notion
+    semaphore = asyncio.Semaphore(concurrency)
+    write_latencies: list[float] = []
+    health_latencies: list[float] = []
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+
+        async def post_one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/daily-logs", json=SAMPLE_PAYLOAD)
+                response.raise_for_status()
+                write_latencies.append(time.perf_counter() - started)
+
+        async def probe_health(stop: asyncio.Event):
+            while not stop.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.05)
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe_health(stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(post_one() for _ in range(requests)))
+        wall_time = time.perf_counter() - started
+        stop.set()
+        await prober
+
+    app.dependency_overrides.clear()
+    return {
+        "wall_time": wall_time,
+        "serial_time": requests * latency,
+        "write_p50": statistics.median(write_latencies),
+        "write_p95": percentile(write_latencies, 0.95),
+        "health_p50": statistics.median(health_latencies),
+        "health_max": max(health_latencies),
+    }
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="POST /daily-logs 동시성 벤치마크")
+    parser.add_argument("--requests", type=int, default=32, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="Notion 쓰기 지연(초)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args.requests, args.concurrency, args.latency))
+
+    print(f"요청 {args.requests}건 / 동시 {args.concurrency} / 지연 {args.latency}s")
+    print(f"  전체 소요 시간     : {result['wall_time']:.2f}s")
+    print(f"  직렬 처리 시 예상  : {result['serial_time']:.2f}s")
+    print(f"  병렬화 배수        : {result['serial_time'] / result['wall_time']:.1f}x")
+    print(f"  쓰기 p50 / p95     : {result['write_p50']:.3f}s / {result['write_p95']:.3f}s")
+    print(
+        f"  /health p50 / max  : {result['health_p50'] * 1000:.1f}ms"
+        f" / {result['health_max'] * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
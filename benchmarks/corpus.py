@@ -0,0 +1,414 @@
+"""
+Notion 일일 로그 형태의 합성 코퍼스 생성기
+
+시드를 고정하면 같은 순서로 같은 페이지가 나오는 일일 로그 fixture를 필요한 만큼 지연
+생성한다. 한국어/영어 컨텍스트(STAR 구성, 길이는 긴 꼬리 분포), daily_logger.py의
+카테고리/영향도/상태/기술 스택 선택지, 정량 지표와 이슈 URL을 섞어 만들며, 본문은 실제
+변환기(markdown_to_blocks)로 만든 Notion 블록과 get_page_content가 돌려줄 마크다운을
+함께 담는다.
+
+fixture는 JSONL로 스트리밍해 저장하거나, NotionEmulator.seed_pages로 에뮬레이터에,
+load_into_cache로 PageCache에 바로 적재할 수 있다.
+
+사용 예시:
+    python -m benchmarks.corpus --count 10000 --seed 7 --output data/corpus.jsonl
+    python -m benchmarks.corpus --count 1000 | head -n 3
+    python -m benchmarks.corpus --input data/corpus.jsonl --cache data/cache.db \\
+        --database-id <일일 로그 DB ID>
+"""
+
+import argparse
+import json
+import random
+import sys
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import IO, Any
+
+from scripts.daily_logger import (
+    CATEGORIES,
+    COMMON_TECH_STACK,
+    IMPACT_LEVELS,
+    STATUS_OPTIONS,
+)
+from scripts.utils.markdown_blocks import (
+    blocks_to_markdown,
+    markdown_to_blocks,
+    plain_rich_text,
+)
+from scripts.utils.notion_client import DEFAULT_MAX_BLOCK_DEPTH
+from scripts.utils.page_cache import PageCache
+
+DEFAULT_START = date(2025, 1, 6)
+
+# 선택지별 가중치 (daily_logger.py 선택지 순서와 같음)
+CATEGORY_WEIGHTS = (25, 30, 20, 8, 12, 5)
+IMPACT_WEIGHTS = (20, 50, 30)
+STATUS_WEIGHTS = (70, 20, 10)
+
+CONTEXT_HEADING = "📝 상세 컨텍스트"
+
+# (제목, 상황, 조치, 결과) — 결과의 {a}/{b}/{n}은 생성 시 숫자로 채움
+_KO_TOPICS = (
+    (
+        "API 응답 시간 개선",
+        "p95 응답 시간이 {a}00ms까지 늘어남",
+        "캐시 계층 추가",
+        "p95 {b}0ms",
+    ),
+    ("배포 자동화", "수동 배포에 {a}0분 소요", "CI 파이프라인 구성", "배포 {b}분"),
+    (
+        "장애 알림 정비",
+        "알림 누락으로 대응 지연",
+        "임계값/라우팅 재설계",
+        "MTTR {n}% 단축",
+    ),
+    (
+        "쿼리 최적화",
+        "리포트 쿼리 타임아웃",
+        "인덱스 및 배치 조회",
+        "실행 시간 {n}% 감소",
+    ),
+    (
+        "신규 결제 연동",
+        "결제 수단 확장 요청",
+        "웹훅 기반 연동 구현",
+        "전환율 {b}%p 상승",
+    ),
+    (
+        "로그인 오류 수정",
+        "세션 만료 후 재로그인 실패",
+        "토큰 갱신 로직 수정",
+        "관련 문의 {n}% 감소",
+    ),
+    (
+        "테스트 안정화",
+        "CI 플래키 테스트 {a}건",
+        "시간 의존 테스트 격리",
+        "CI 실패율 {n}% 감소",
+    ),
+    (
+        "모듈 구조 정리",
+        "순환 의존으로 빌드 {a}분",
+        "도메인별 패키지 분리",
+        "빌드 시간 {n}% 단축",
+    ),
+)
+_EN_TOPICS = (
+    (
+        "Cut checkout latency",
+        "p95 latency crept up to {a}00ms",
+        "added a read-through cache",
+        "p95 down to {b}0ms",
+    ),
+    (
+        "Automate deploys",
+        "manual deploys took {a}0 minutes",
+        "built a CI pipeline",
+        "deploys in {b} minutes",
+    ),
+    (
+        "Fix flaky alerts",
+        "alerts were dropped during incidents",
+        "reworked thresholds and routing",
+        "MTTR down {n}%",
+    ),
+    (
+        "Tune report queries",
+        "monthly reports timed out",
+        "added indexes and batched reads",
+        "runtime down {n}%",
+    ),
+    (
+        "Ship webhook integration",
+        "partners asked for push updates",
+        "implemented signed webhooks",
+        "{a} partners onboarded",
+    ),
+    (
+        "Harden session refresh",
+        "users were logged out randomly",
+        "fixed the token refresh race",
+        "support tickets down {n}%",
+    ),
+)
+_KO_DETAILS = (
+    "세부 변경 사항을 문서화하고 리뷰를 거쳤다.",
+    "스테이징에서 부하 테스트로 회귀가 없는지 확인했다.",
+    "관련 팀과 일정과 롤백 계획을 공유했다.",
+    "대시보드에 지표를 추가해 배포 후 추이를 관찰했다.",
+    "기존 동작과의 호환성을 위해 기능 플래그 뒤에 배포했다.",
+)
+_EN_DETAILS = (
+    "Documented the change and got it reviewed.",
+    "Load-tested on staging to rule out regressions.",
+    "Shared the rollout and rollback plan with the on-call team.",
+    "Added dashboard panels to watch the trend after release.",
+    "Shipped behind a feature flag to keep the old path available.",
+)
+_METRICS = (
+    "응답시간 {n}% 단축",
+    "에러율 {n}% 감소",
+    "DAU {b}% 증가",
+    "p95 {a}00ms → {b}0ms",
+    "throughput +{n}%",
+    "error rate -{n}%",
+)
+_TICKET_URLS = (
+    "https://jira.example.com/browse/{project}-{number}",
+    "https://github.com/example-org/{repo}/issues/{number}",
+    "https://github.com/example-org/{repo}/pull/{number}",
+)
+_PROJECTS = ("PAY", "OPS", "API", "WEB")
+_REPOS = ("api", "web", "infra", "worker")
+_CODE_SNIPPETS = (
+    ("python", "def warm_cache(keys):\n    for key in keys:\n        cache.get(key)"),
+    ("sql", "CREATE INDEX idx_orders_user ON orders (user_id, created_at);"),
+    ("bash", "kubectl rollout status deploy/api --timeout=120s"),
+)
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    return template.format(a=rng.randint(2, 12), b=rng.randint(2, 9), n=rng.randint(10, 90))
+
+
+def _detail_count(rng: random.Random) -> int:
+    """문단 길이를 정하는 긴 꼬리 분포 (대부분 짧고 가끔 아주 긴 로그)"""
+    return min(40, int(rng.lognormvariate(0.5, 0.9)) + 1)
+
+
+def build_context(rng: random.Random, english: bool) -> tuple[str, str, str]:
+    """
+    STAR 구성의 마크다운 컨텍스트를 만듦
+
+    Args:
+        rng: 난수 생성기
+        english: 영어 로그 여부
+
+    Returns:
+        (제목, 마크다운 컨텍스트, 정량 지표) 튜플
+    """
+    title, situation, action, result = rng.choice(_EN_TOPICS if english else _KO_TOPICS)
+    result = _fill(result, rng)
+    details = _EN_DETAILS if english else _KO_DETAILS
+    labels = (
+        ("Situation", "Task", "Action", "Result")
+        if english
+        else ("상황 (Situation)", "과제 (Task)", "조치 (Action)", "결과 (Result)")
+    )
+    task = (
+        f"Wrap up **{title.lower()}** this sprint."
+        if english
+        else f"이번 스프린트 안에 **{title}** 작업을 마무리해야 했다."
+    )
+
+    lines = [f"### {labels[0]}", _fill(situation, rng) + ".", "", f"### {labels[1]}"]
+    lines += [task, "", f"### {labels[2]}", f"- {action}"]
+    lines += [f"- {rng.choice(details)}" for _ in range(_detail_count(rng))]
+    if rng.random() < 0.3:
+        tech = rng.choice(COMMON_TECH_STACK[:-1])
+        lines.append(f"  - `{tech}` " + ("config change" if english else "설정 변경"))
+    if rng.random() < 0.2:
+        language, code = rng.choice(_CODE_SNIPPETS)
+        lines += ["", f"```{language}", code, "```"]
+    lines += ["", f"### {labels[3]}", f"> {result}"]
+    return title, "\n".join(lines), result
+
+
+def _ticket_url(rng: random.Random) -> str:
+    return rng.choice(_TICKET_URLS).format(
+        project=rng.choice(_PROJECTS),
+        repo=rng.choice(_REPOS),
+        number=rng.randint(100, 9999),
+    )
+
+
+def _payload_children(block: dict[str, Any]) -> list[dict[str, Any]]:
+    return (block.get(block["type"]) or {}).get("children", [])
+
+
+def _with_child_flags(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{**block, "has_children": bool(_payload_children(block))} for block in blocks]
+
+
+def render_content(children: list[dict[str, Any]], max_depth: int = DEFAULT_MAX_BLOCK_DEPTH) -> str:
+    """
+    생성 요청 형태의 블록 트리를 get_page_content와 같은 마크다운으로 변환
+
+    Args:
+        children: pages.create에 보낼 블록 리스트 (자식은 블록 본문의 children)
+        max_depth: 따라 내려갈 최대 중첩 깊이
+
+    Returns:
+        에뮬레이터에 적재한 뒤 get_page_content로 읽었을 때와 같은 문자열
+    """
+    return blocks_to_markdown(
+        _with_child_flags(children),
+        lambda block: _with_child_flags(_payload_children(block)),
+        max_depth,
+    )
+
+
+def iter_daily_log_fixtures(
+    count: int | None = None,
+    seed: int = 42,
+    start: date = DEFAULT_START,
+    logs_per_day: int = 3,
+    english_ratio: float = 0.3,
+) -> Iterator[dict[str, Any]]:
+    """
+    일일 로그 페이지 fixture를 한 건씩 생성
+
+    Args:
+        count: 생성할 건수 (None이면 끝없이 생성)
+        seed: 난수 시드 (같으면 같은 순서로 같은 fixture)
+        start: 첫 로그 날짜
+        logs_per_day: 하루에 기록하는 로그 수
+        english_ratio: 영어 컨텍스트 비율 (0~1)
+
+    Yields:
+        id, created_time, last_edited_time, properties, children(블록 리스트),
+        content(get_page_content와 같은 마크다운) 키를 가진 dict
+    """
+    rng = random.Random(seed)
+    index = 0
+    while count is None or index < count:
+        logged = start + timedelta(days=index // logs_per_day)
+        edited = datetime.combine(logged, time(9)) + timedelta(minutes=rng.randint(0, 9 * 60))
+        title, context, result = build_context(rng, rng.random() < english_ratio)
+
+        properties: dict[str, Any] = {
+            "Title": {"title": plain_rich_text(title)},
+            "Logged Date": {"date": {"start": logged.isoformat()}},
+            "Category": {"select": {"name": rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0]}},
+            "Impact Level": {"select": {"name": rng.choices(IMPACT_LEVELS, IMPACT_WEIGHTS)[0]}},
+            "Status": {"select": {"name": rng.choices(STATUS_OPTIONS, STATUS_WEIGHTS)[0]}},
+            "Tech Stack": {
+                "multi_select": [
+                    {"name": tech} for tech in rng.sample(COMMON_TECH_STACK, rng.randint(1, 4))
+                ]
+            },
+        }
+        if rng.random() < 0.8:
+            metrics = f"{result}, {_fill(rng.choice(_METRICS), rng)}"
+            properties["Metrics"] = {"rich_text": plain_rich_text(metrics)}
+        if rng.random() < 0.6:
+            properties["Ticket URL"] = {"url": _ticket_url(rng)}
+
+        children = [
+            {
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {"rich_text": plain_rich_text(CONTEXT_HEADING)},
+            },
+            *markdown_to_blocks(context),
+        ]
+        timestamp = edited.strftime("%Y-%m-%dT%H:%M:00.000Z")
+        yield {
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "created_time": timestamp,
+            "last_edited_time": timestamp,
+            "properties": properties,
+            "children": children,
+            "content": render_content(children),
+        }
+        index += 1
+
+
+def write_jsonl(fixtures: Iterable[dict[str, Any]], stream: IO[str]) -> int:
+    """fixture를 한 줄에 하나씩 JSON으로 기록하고 기록한 건수를 반환"""
+    written = 0
+    for fixture in fixtures:
+        stream.write(json.dumps(fixture, ensure_ascii=False) + "\n")
+        written += 1
+    return written
+
+
+def read_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    """write_jsonl로 저장한 파일을 한 줄씩 읽어 fixture로 반환"""
+    with open(path, encoding="utf-8") as corpus_file:
+        for line in corpus_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_into_cache(
+    cache: PageCache,
+    database_id: str,
+    fixtures: Iterable[dict[str, Any]],
+    batch_size: int = 500,
+) -> int:
+    """
+    fixture를 databases.query 결과 형태의 페이지로 바꿔 PageCache에 나눠 저장
+
+    Args:
+        cache: 대상 캐시
+        database_id: 페이지가 속한 데이터베이스 ID
+        fixtures: iter_daily_log_fixtures 또는 read_jsonl 결과
+        batch_size: 한 번에 저장할 페이지 수
+
+    Returns:
+        저장한 페이지 수
+    """
+    pages = (
+        {
+            "object": "page",
+            "id": fixture["id"],
+            "created_time": fixture.get("created_time"),
+            "last_edited_time": fixture["last_edited_time"],
+            "parent": {"type": "database_id", "database_id": database_id},
+            "archived": False,
+            "properties": fixture["properties"],
+            "content": fixture.get("content") or render_content(fixture.get("children", [])),
+        }
+        for fixture in fixtures
+    )
+    stored = 0
+    while batch := list(islice(pages, batch_size)):
+        cache.put_pages(batch, database_id)
+        stored += len(batch)
+    return stored
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="합성 일일 로그 코퍼스 생성기")
+    parser.add_argument("--count", type=int, default=1000, help="생성할 로그 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument(
+        "--start", type=date.fromisoformat, default=DEFAULT_START, help="첫 로그 날짜"
+    )
+    parser.add_argument("--logs-per-day", type=int, default=3, help="하루 로그 수")
+    parser.add_argument("--english-ratio", type=float, default=0.3, help="영어 컨텍스트 비율")
+    parser.add_argument("--input", help="생성 대신 읽어 올 JSONL 파일")
+    parser.add_argument("--output", help="JSONL 출력 경로 (미지정 시 표준 출력)")
+    parser.add_argument("--cache", help="적재할 PageCache SQLite 경로")
+    parser.add_argument("--database-id", help="--cache에 기록할 데이터베이스 ID")
+    args = parser.parse_args()
+
+    if args.input:
+        fixtures = read_jsonl(args.input)
+    else:
+        fixtures = iter_daily_log_fixtures(
+            args.count, args.seed, args.start, args.logs_per_day, args.english_ratio
+        )
+
+    if args.cache:
+        if not args.database_id:
+            parser.error("--cache에는 --database-id가 필요합니다.")
+        stored = load_into_cache(PageCache(args.cache), args.database_id, fixtures)
+        print(f"{args.cache}에 {stored}건 적재", file=sys.stderr)
+        return
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            written = write_jsonl(fixtures, output)
+        print(f"{args.output}에 {written}건 기록", file=sys.stderr)
+        return
+    write_jsonl(fixtures, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
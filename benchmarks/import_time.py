@@ -0,0 +1,171 @@
+"""
+API 서버와 CLI 진입점의 콜드 import 시간 벤치마크
+
+모듈마다 새 파이썬 프로세스를 띄워 `python -X importtime`으로 진입 모듈의 누적 import
+시간을 재고, 시작 시점에 Notion/LLM SDK나 httpx가 이미 로드되는지 함께 확인한다.
+--compare로 이전 커밋을 지정하면 임시 git worktree에서 같은 측정을 반복해 전후를 비교한다.
+
+사용 예시:
+    python -m benchmarks.import_time --repeat 7
+    python -m benchmarks.import_time --compare HEAD~1 --repeat 7
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_MODULES = (
+    "scripts.api.app",
+    "scripts.daily_logger",
+    "scripts.weekly_processor",
+    "scripts.monthly_processor",
+)
+
+# 시작 경로에 있으면 안 되는 무거운 의존성
+HEAVY_MODULES = (
+    "notion_client",
+    "httpx",
+    "dotenv",
+    "anthropic",
+    "openai",
+    "google.generativeai",
+)
+
+_LOADED_SCRIPT = (
+    "import importlib, json, sys; importlib.import_module(sys.argv[1]); "
+    "print(json.dumps([m for m in sys.argv[2:] if m in sys.modules]))"
+)
+
+
+def _run_python(root: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=root)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr: str, module: str) -> float:
+    """
+    -X importtime 출력에서 모듈의 누적 import 시간을 찾음
+
+    Args:
+        stderr: `python -X importtime` 표준 오류 출력
+        module: 찾을 모듈 이름
+
+    Returns:
+        누적 import 시간 (밀리초)
+    """
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        if name.strip() == module:
+            return int(cumulative_us) / 1000
+    raise ValueError(f"importtime 출력에서 {module}을 찾지 못했습니다.")
+
+
+def measure(root: str, module: str, repeat: int) -> dict:
+    """
+    새 프로세스에서 모듈을 import하는 시간을 repeat번 측정
+
+    Args:
+        root: 측정할 소스 트리 경로
+        module: 진입 모듈 이름
+        repeat: 반복 횟수
+
+    Returns:
+        중앙값/최솟값(ms)과 시작 시 로드된 무거운 의존성 목록
+    """
+    samples = [
+        parse_importtime(
+            _run_python(root, "-X", "importtime", "-c", f"import {module}").stderr,
+            module,
+        )
+        for _ in range(repeat)
+    ]
+    loaded = json.loads(_run_python(root, "-c", _LOADED_SCRIPT, module, *HEAVY_MODULES).stdout)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "heavy_modules": loaded,
+    }
+
+
+def measure_tree(root: str, modules: list[str], repeat: int) -> dict[str, dict]:
+    """소스 트리 하나에서 모든 진입 모듈을 측정"""
+    # 첫 실행의 바이트코드 컴파일 비용이 측정에 섞이지 않도록 미리 한 번 import
+    for module in modules:
+        _run_python(root, "-c", f"import {module}")
+    return {module: measure(root, module, repeat) for module in modules}
+
+
+def measure_ref(ref: str, modules: list[str], repeat: int) -> dict[str, dict]:
+    """git ref를 임시 worktree로 꺼내 측정한 뒤 정리"""
+    workdir = tempfile.mkdtemp(prefix="import-time-")
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", workdir, ref],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        check=True,
+    )
+    try:
+        return measure_tree(workdir, modules, repeat)
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", workdir],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            check=False,
+        )
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="진입 모듈 콜드 import 시간 벤치마크")
+    parser.add_argument(
+        "--modules",
+        default=",".join(DEFAULT_MODULES),
+        help="측정할 모듈 (쉼표 구분)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="모듈당 반복 횟수")
+    parser.add_argument("--compare", help="비교할 git ref (예: HEAD~1, main)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    modules = [name.strip() for name in args.modules.split(",") if name.strip()]
+    current = measure_tree(PROJECT_ROOT, modules, args.repeat)
+    baseline = measure_ref(args.compare, modules, args.repeat) if args.compare else {}
+
+    if args.json:
+        print(json.dumps({"current": current, "baseline": baseline}, indent=2))
+        return
+
+    print(f"콜드 import 시간 (중앙값, {args.repeat}회)")
+    for module in modules:
+        result = current[module]
+        line = f"  {module:<28} {result['median_ms']:7.1f}ms"
+        if module in baseline:
+            before = baseline[module]["median_ms"]
+            line += f"  (기준 {before:7.1f}ms, {before / result['median_ms']:.1f}x)"
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        line += f"  시작 시 로드: {heavy}"
+        if module in baseline:
+            line += f" (기준: {', '.join(baseline[module]['heavy_modules']) or '-'})"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
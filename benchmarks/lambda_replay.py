@@ -0,0 +1,176 @@
+"""
+Lambda 핸들러 로컬 이벤트 재생 하네스
+
+API Gateway HTTP API 페이로드 2.0 이벤트를 scripts.api.lambda_handler.handler에
+순서대로 넣어 컨테이너 여러 개의 수명을 흉내 낸다. 컨테이너마다 런타임과 Notion
+클라이언트가 정확히 한 번만 만들어지는지(웜 호출은 초기화를 전혀 하지 않는지) 확인하고
+콜드/웜 호출 지연을 비교한다. Notion 쓰기는 지정한 지연만큼 대기하는 스텁으로 대체한다.
+
+사용 예시:
+    python -m benchmarks.lambda_replay --containers 3 --invocations 20
+    python -m benchmarks.lambda_replay --events recorded_events.json --latency 0.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Any
+from unittest.mock import patch
+
+from scripts.api import lambda_handler
+from scripts.utils.notion_client import NotionClientWrapper
+
+SAMPLE_PAYLOAD = {
+    "title": "Lambda 재생 로그",
+    "context": "### Situation\n재생 하네스\n\n### Result\n웜 호출 지연 측정",
+    "category": "기타",
+    "impact_level": "Low",
+    "tech_stack": ["Python", "AWS Lambda"],
+}
+
+
+class ReplayNotionClient(NotionClientWrapper):
+    """생성 횟수를 세고 페이지 생성은 지연만 흉내 내는 Notion 클라이언트"""
+
+    instances = 0
+    latency = 0.0
+
+    def __init__(self, *args, **kwargs):
+        type(self).instances += 1
+        super().__init__(*args, **kwargs)
+
+    def create_daily_log(self, *_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        time.sleep(self.latency)
+        return {"id": str(uuid.uuid4())}
+
+
+def build_event(
+    method: str, path: str, body: dict | None = None, token: str | None = None
+) -> dict[str, Any]:
+    """
+    API Gateway HTTP API 페이로드 2.0 이벤트를 만듦
+
+    Args:
+        method: HTTP 메서드
+        path: 요청 경로
+        body: JSON 요청 본문
+        token: Bearer 토큰
+
+    Returns:
+        Lambda 이벤트
+    """
+    headers = {"host": "replay.execute-api.local", "content-type": "application/json"}
+    if token:
+        headers["authorization"] = f"Bearer {token}"
+    return {
+        "version": "2.0",
+        "routeKey": f"{method} {path}",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": headers,
+        "requestContext": {
+            "requestId": uuid.uuid4().hex,
+            "stage": "$default",
+            "http": {"method": method, "path": path, "sourceIp": "127.0.0.1"},
+        },
+        "body": json.dumps(body, ensure_ascii=False) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def default_events(invocations: int) -> list[dict[str, Any]]:
+    """헬스 체크 한 번 뒤에 일일 로그 저장 요청이 이어지는 기본 이벤트 목록"""
+    token = os.getenv("API_AUTH_TOKEN")
+    events = [build_event("GET", "/health")]
+    events += [
+        build_event("POST", "/daily-logs", SAMPLE_PAYLOAD, token) for _ in range(invocations - 1)
+    ]
+    return events
+
+
+def replay_container(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    새 컨테이너 하나에서 이벤트를 순서대로 처리
+
+    Returns:
+        호출별 지연(ms), 상태 코드, 런타임/Notion 클라이언트 생성 횟수
+    """
+    lambda_handler.reset_runtime()
+    runtime_inits = 0
+    client_inits = ReplayNotionClient.instances
+    original_runtime = lambda_handler.LambdaRuntime
+
+    def counting_runtime(*args, **kwargs):
+        nonlocal runtime_inits
+        runtime_inits += 1
+        return original_runtime(*args, **kwargs)
+
+    latencies: list[float] = []
+    statuses: list[int] = []
+    with patch.object(lambda_handler, "LambdaRuntime", counting_runtime):
+        for event in events:
+            started = time.perf_counter()
+            response = lambda_handler.handler(event, None)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses.append(response["statusCode"])
+
+    return {
+        "latencies_ms": latencies,
+        "statuses": statuses,
+        "runtime_inits": runtime_inits,
+        "client_inits": ReplayNotionClient.instances - client_inits,
+        "init_duration_ms": lambda_handler.get_runtime().init_duration_ms,
+    }
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="Lambda 핸들러 이벤트 재생 하네스")
+    parser.add_argument("--containers", type=int, default=3, help="재생할 컨테이너(콜드 스타트) 수")
+    parser.add_argument("--invocations", type=int, default=20, help="컨테이너당 호출 수")
+    parser.add_argument("--events", help="재생할 이벤트 JSON 파일 (이벤트 배열)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Notion 쓰기 지연(초)")
+    args = parser.parse_args()
+
+    # 로컬 재생에서는 실제 Notion에 연결하지 않으므로 자격 증명이 없어도 됨
+    os.environ.setdefault("NOTION_API_KEY", "replay-key")
+    os.environ.setdefault("NOTION_DB1_ID", "replay-db")
+    os.environ.setdefault("LOG_TARGET", "file")
+    ReplayNotionClient.latency = args.latency
+
+    if args.events:
+        with open(args.events, encoding="utf-8") as events_file:
+            events = json.load(events_file)
+    else:
+        events = default_events(args.invocations)
+
+    failed = False
+    print(f"컨테이너 {args.containers}개 x 호출 {len(events)}건")
+    with patch("scripts.api.app.NotionClientWrapper", ReplayNotionClient):
+        for idx in range(args.containers):
+            result = replay_container(events)
+            cold, *warm = result["latencies_ms"]
+            warm_p50 = statistics.median(warm) if warm else 0.0
+            print(
+                f"  #{idx + 1} 콜드 {cold:7.1f}ms (초기화 {result['init_duration_ms']:.1f}ms)"
+                f" | 웜 p50 {warm_p50:6.1f}ms"
+                f" | 런타임 생성 {result['runtime_inits']}회"
+                f" | Notion 클라이언트 생성 {result['client_inits']}회"
+                f" | 상태 코드 {sorted(set(result['statuses']))}"
+            )
+            if result["runtime_inits"] != 1 or result["client_inits"] != 1:
+                failed = True
+        lambda_handler.reset_runtime()
+
+    if failed:
+        print("웜 호출에서 초기화가 다시 수행되었습니다.")
+        sys.exit(1)
+    print("모든 컨테이너에서 초기화는 첫 호출에만 수행되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+LLM 제공자별 주간/월간 요약 품질·지연·비용 비교 벤치마크
+
+고정된 합성 일일 로그/주간 성과 코퍼스를 여러 크기로 만들어 각 BaseLLMClient 구현에
+generate_weekly_summary / generate_monthly_summary와 같은 요청을 스트리밍으로 보내고,
+지연 백분위, 첫 토큰 시간(TTFT), 입·출력 토큰(근사치), 예상 비용, 섹션 파싱 성공률을
+표로 정리한다.
+
+실제 API 응답을 카세트 파일로 녹화해 두면 네트워크 없이 같은 조건으로 재생할 수 있고,
+--stub 제공자는 녹화 없이도 하네스 자체를 점검할 수 있는 합성 응답을 만든다.
+
+사용 예시:
+    # 실제 API 호출 + 녹화
+    python -m benchmarks.llm_providers --providers claude,openai,gemini \\
+        --record benchmarks/cassettes/llm.json
+    # 녹화본 재생 (오프라인)
+    python -m benchmarks.llm_providers --providers claude,openai,gemini \\
+        --replay benchmarks/cassettes/llm.json --report report.md
+    # 합성 스텁으로 하네스 점검
+    python -m benchmarks.llm_providers --providers stub --sizes 5,20
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+from benchmarks.api_concurrency import percentile
+from benchmarks.corpus import iter_daily_log_fixtures
+from scripts.utils.llm_client import (
+    MONTHLY_SECTION_HEADINGS,
+    WEEKLY_SECTION_HEADINGS,
+    BaseLLMClient,
+    LLMClientFactory,
+    StreamCollector,
+)
+from scripts.utils.token_budget import estimate_tokens
+
+# 1M 토큰당 (입력, 출력) 달러 가격 (README의 제공자 비교표 기준)
+PRICING_PER_MILLION = {
+    "claude": (3.0, 15.0),
+    "openai": (2.5, 10.0),
+    "gemini": (0.0, 0.0),
+    "stub": (0.0, 0.0),
+}
+
+DEFAULT_SIZES = (5, 20, 60)
+
+_TOPICS = [
+    ("API 응답 시간 개선", "p95 응답 시간이 1.2초", "캐시 계층 추가", "p95 320ms"),
+    ("배포 자동화", "수동 배포에 30분 소요", "CI 파이프라인 구성", "배포 5분"),
+    (
+        "장애 알림 정비",
+        "알림 누락으로 대응 지연",
+        "임계값/라우팅 재설계",
+        "MTTR 40% 단축",
+    ),
+    (
+        "쿼리 최적화",
+        "리포트 쿼리 타임아웃",
+        "인덱스 및 배치 조회",
+        "실행 시간 85% 감소",
+    ),
+    ("신규 결제 연동", "결제 수단 확장 요청", "웹훅 기반 연동 구현", "전환율 3%p 상승"),
+]
+
+
+def build_daily_logs(count: int, seed: int = 42) -> list[dict]:
+    """Notion 일일 로그 형태의 합성 데이터를 고정 시드로 생성 (benchmarks.corpus 사용)"""
+    return [
+        {key: value for key, value in fixture.items() if key != "children"}
+        for fixture in iter_daily_log_fixtures(count, seed=seed, logs_per_day=1)
+    ]
+
+
+def build_weekly_achievements(count: int, seed: int = 42) -> list[dict]:
+    """Notion 주간 성과 형태의 합성 데이터를 고정 시드로 생성"""
+    rng = random.Random(seed)
+    weeks = []
+    for idx in range(count):
+        title, situation, action, result = rng.choice(_TOPICS)
+        weeks.append(
+            {
+                "id": f"week-{idx}",
+                "properties": {
+                    "Title": {"title": [{"text": {"content": f"2025년 {idx + 1}주차"}}]},
+                    "Key Highlights": {"rich_text": [{"text": {"content": f"{title}: {result}"}}]},
+                    "Source Logs": {"relation": [{"id": f"log-{idx}-{n}"} for n in range(5)]},
+                },
+                "content": (
+                    f"• ### Situation\n  {situation}\n  ### Task\n  {title}\n"
+                    f"  ### Action\n  {action}\n  ### Result\n  {result}"
+                ),
+            }
+        )
+    return weeks
+
+
+class StubLLMClient(BaseLLMClient):
+    """입력 크기에 비례한 지연 후 형식에 맞는 합성 응답을 스트리밍하는 스텁"""
+
+    provider_name = "stub"
+
+    def __init__(self, seconds_per_1k_tokens: float = 0.02, ttft: float = 0.05):
+        self.model = "stub-model"
+        self.max_tokens = 4096
+        self.seconds_per_1k_tokens = seconds_per_1k_tokens
+        self.ttft = ttft
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        return "".join(self._stream(system_prompt, user_prompt))
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        time.sleep(self.ttft)
+        weekly = "경력기술서" not in system_prompt
+        headings = WEEKLY_SECTION_HEADINGS if weekly else MONTHLY_SECTION_HEADINGS
+        body = "• ### Situation\n  합성 상황\n  ### Result\n  합성 결과 30% 개선\n"
+        delay = estimate_tokens(user_prompt) / 1000 * self.seconds_per_1k_tokens
+        for heading in headings:
+            time.sleep(delay / len(headings))
+            yield f"{heading}\n"
+            yield body
+
+
+class CassetteStore:
+    """프롬프트 지문을 키로 응답 조각과 타이밍을 저장하는 JSON 카세트"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as cassette:
+                self.entries = json.load(cassette).get("entries", {})
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key: str, entry: dict):
+        with self._lock:
+            self.entries[key] = entry
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._lock, open(self.path, "w", encoding="utf-8") as cassette:
+            json.dump(
+                {"version": 1, "entries": self.entries},
+                cassette,
+                ensure_ascii=False,
+                indent=1,
+            )
+
+
+class RecordingLLMClient(BaseLLMClient):
+    """실제 제공자 호출을 그대로 전달하면서 응답 조각과 타이밍을 카세트에 기록"""
+
+    def __init__(self, inner: BaseLLMClient, cassette: CassetteStore):
+        self.inner = inner
+        self.cassette = cassette
+        self.provider_name = inner.provider_name
+        self.max_tokens = getattr(inner, "max_tokens", None)
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        return "".join(self._stream(system_prompt, user_prompt))
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        started = time.perf_counter()
+        ttft = None
+        deltas = []
+        for delta in self.inner._stream(system_prompt, user_prompt):
+            if ttft is None:
+                ttft = time.perf_counter() - started
+            deltas.append(delta)
+            yield delta
+
+        key = self._cache_key(system_prompt, user_prompt)
+        self.cassette.put(
+            key,
+            {
+                "provider": self.provider_name,
+                "model": self.model_name,
+                "max_tokens": self.max_tokens,
+                "deltas": deltas,
+                "ttft": ttft or 0.0,
+                "latency": time.perf_counter() - started,
+            },
+        )
+
+
+class ReplayLLMClient(BaseLLMClient):
+    """카세트에 녹화된 응답을 녹화 당시 타이밍대로(또는 즉시) 재생하는 로컬 대역"""
+
+    def __init__(
+        self,
+        provider_name: str,
+        model_name: str,
+        cassette: CassetteStore,
+        realtime: bool = True,
+        max_tokens: int | None = None,
+    ):
+        self.provider_name = provider_name
+        self.model = model_name
+        self.cassette = cassette
+        self.realtime = realtime
+        self.max_tokens = max_tokens
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        return "".join(self._stream(system_prompt, user_prompt))
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        entry = self.cassette.get(self._cache_key(system_prompt, user_prompt))
+        if entry is None:
+            raise KeyError(
+                f"{self.provider_name} 녹화본에 없는 요청입니다. --record로 먼저 녹화하세요."
+            )
+
+        deltas = entry["deltas"] or [""]
+        gap = max(0.0, entry["latency"] - entry["ttft"]) / len(deltas)
+        for idx, delta in enumerate(deltas):
+            if self.realtime:
+                time.sleep(entry["ttft"] if idx == 0 else gap)
+            yield delta
+
+
+class MeteredLLMClient(BaseLLMClient):
+    """모든 제공자 호출(map-reduce 중간 단계 포함)의 입·출력 토큰을 집계하는 래퍼"""
+
+    def __init__(self, inner: BaseLLMClient):
+        self.inner = inner
+        self.provider_name = inner.provider_name
+        self.max_tokens = getattr(inner, "max_tokens", None)
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    def reset(self):
+        with self._lock:
+            self.input_tokens = self.output_tokens = self.calls = 0
+
+    def _count(self, system_prompt: str, user_prompt: str, output: str):
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += estimate_tokens(system_prompt + user_prompt)
+            self.output_tokens += estimate_tokens(output)
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        content = self.inner._complete(system_prompt, user_prompt)
+        self._count(system_prompt, user_prompt, content)
+        return content
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        deltas = []
+        for delta in self.inner._stream(system_prompt, user_prompt):
+            deltas.append(delta)
+            yield delta
+        self._count(system_prompt, user_prompt, "".join(deltas))
+
+
+def _sections_parsed(content: str, headings: tuple[str, str]) -> bool:
+    """두 번째 섹션 헤딩(핵심 하이라이트/경력기술서용 요약)이 파싱 가능한지 확인"""
+    parts = content.split(headings[1])
+    return len(parts) > 1 and bool(parts[1].strip())
+
+
+def run_case(client: MeteredLLMClient, kind: str, size: int, repeat: int) -> dict:
+    """
+    한 제공자·요약 종류·입력 크기 조합을 repeat번 실행해 지표를 집계
+
+    Args:
+        client: 토큰 집계 래퍼로 감싼 클라이언트
+        kind: 'weekly' 또는 'monthly'
+        size: 입력 항목 수 (일일 로그 또는 주간 성과)
+        repeat: 반복 횟수
+
+    Returns:
+        지연/TTFT 백분위, 평균 토큰, 예상 비용, 파싱 성공률을 담은 dict
+    """
+    stream: Callable[[list[dict]], Iterator[str]]
+    if kind == "weekly":
+        data, headings = build_daily_logs(size), WEEKLY_SECTION_HEADINGS
+        stream = client.stream_weekly_summary
+    else:
+        data, headings = build_weekly_achievements(size), MONTHLY_SECTION_HEADINGS
+        stream = client.stream_monthly_summary
+
+    latencies, ttfts, parsed = [], [], 0
+    client.reset()
+    for _ in range(repeat):
+        collector = StreamCollector(headings)
+        started = time.perf_counter()
+        content = collector.consume(stream(data))
+        latencies.append(time.perf_counter() - started)
+        ttfts.append(collector.ttft or 0.0)
+        parsed += _sections_parsed(content, headings)
+
+    input_price, output_price = PRICING_PER_MILLION.get(client.provider_name, (0, 0))
+    input_tokens = client.input_tokens / repeat
+    output_tokens = client.output_tokens / repeat
+    return {
+        "provider": client.provider_name,
+        "model": client.model_name,
+        "kind": kind,
+        "size": size,
+        "runs": repeat,
+        "latency_p50": statistics.median(latencies),
+        "latency_p95": percentile(latencies, 0.95),
+        "ttft_p50": statistics.median(ttfts),
+        "ttft_p95": percentile(ttfts, 0.95),
+        "calls": client.calls / repeat,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost_usd": (input_tokens * input_price + output_tokens * output_price) / 1e6,
+        "parse_rate": parsed / repeat,
+    }
+
+
+def build_clients(
+    providers: list[str],
+    record: str | None,
+    replay: str | None,
+    realtime: bool,
+) -> tuple[list[MeteredLLMClient], CassetteStore | None]:
+    """CLI 옵션에 맞춰 실제/녹화/재생/스텁 클라이언트를 구성"""
+    cassette_path = record or replay
+    cassette = CassetteStore(cassette_path) if cassette_path else None
+    clients = []
+    for name in providers:
+        inner: BaseLLMClient
+        if replay and cassette is not None:
+            recorded = [entry for entry in cassette.entries.values() if entry["provider"] == name]
+            if not recorded:
+                raise SystemExit(f"{replay}에 {name} 녹화본이 없습니다.")
+            inner = ReplayLLMClient(
+                name,
+                recorded[0]["model"],
+                cassette,
+                realtime=realtime,
+                max_tokens=recorded[0].get("max_tokens"),
+            )
+        else:
+            if name == "stub":
+                inner = StubLLMClient()
+            else:
+                inner = LLMClientFactory.create_client(name, use_cache=False)
+            if record and cassette is not None:
+                inner = RecordingLLMClient(inner, cassette)
+        clients.append(MeteredLLMClient(inner))
+    return clients, cassette
+
+
+def format_report(results: list[dict]) -> str:
+    """결과를 마크다운 비교표로 변환"""
+    lines = [
+        "| 제공자 | 모델 | 종류 | 입력 수 | p50 (s) | p95 (s) | TTFT p50 (s) "
+        "| 호출 수 | 입력 토큰 | 출력 토큰 | 예상 비용 ($) | 섹션 파싱 |",
+        "| --- | --- | --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['provider']} | {r['model']} | {r['kind']} | {r['size']} "
+            f"| {r['latency_p50']:.2f} | {r['latency_p95']:.2f} | {r['ttft_p50']:.2f} "
+            f"| {r['calls']:.1f} | {r['input_tokens']:,.0f} | {r['output_tokens']:,.0f} "
+            f"| {r['cost_usd']:.4f} | {r['parse_rate']:.0%} |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="LLM 제공자 비교 벤치마크")
+    parser.add_argument(
+        "--providers",
+        default="stub",
+        help="쉼표로 구분한 제공자 목록 (claude, openai, gemini, stub)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="입력 항목 수 목록 (쉼표 구분)",
+    )
+    parser.add_argument("--kinds", default="weekly,monthly", help="weekly, monthly 중 실행할 종류")
+    parser.add_argument("--repeat", type=int, default=3, help="조합별 반복 횟수")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--record", help="실제 응답을 녹화할 카세트 경로")
+    source.add_argument("--replay", help="재생할 카세트 경로 (네트워크 미사용)")
+    parser.add_argument(
+        "--no-delay",
+        action="store_true",
+        help="재생 시 녹화된 지연을 흉내 내지 않고 즉시 반환",
+    )
+    parser.add_argument("--report", help="마크다운 보고서를 저장할 경로")
+    parser.add_argument("--json", dest="json_path", help="원본 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    providers = [name.strip() for name in args.providers.split(",") if name.strip()]
+    sizes = [int(size) for size in args.sizes.split(",")]
+    kinds = [kind.strip() for kind in args.kinds.split(",")]
+
+    clients, cassette = build_clients(
+        providers, args.record, args.replay, realtime=not args.no_delay
+    )
+
+    results = []
+    try:
+        for client in clients:
+            for kind in kinds:
+                for size in sizes:
+                    result = run_case(client, kind, size, args.repeat)
+                    results.append(result)
+                    print(
+                        f"{result['provider']:>8} {kind:>7} {size:>4}건: "
+                        f"p50 {result['latency_p50']:.2f}s, "
+                        f"TTFT {result['ttft_p50']:.2f}s, "
+                        f"파싱 {result['parse_rate']:.0%}"
+                    )
+    finally:
+        if args.record and cassette is not None:
+            cassette.save()
+
+    report = format_report(results)
+    print()
+    print(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as report_file:
+            report_file.write("# LLM 제공자 벤치마크\n\n" + report + "\n")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+긴 본문 페이지 저장(pages.create + blocks.children.append) 왕복 횟수/순서 벤치마크
+
+markdown_blocks 벤치마크와 같은 마크다운을 여러 크기로 만들어 인메모리 Notion 에뮬레이터에
+NotionClientWrapper._create_page로 저장하고, 요청 수가 묶음 수(최소 왕복 횟수)와 같은지,
+저장된 최상위 블록 순서가 입력과 같은지 확인한다.
+
+비교용으로 첫 묶음 이후의 append를 동시에 보내는 방식(--compare-concurrent)도 함께 잰다.
+Notion의 blocks.children.append는 요청이 도착한 순서대로 페이지 끝에 붙이므로, 지연에
+지터가 있으면 동시 append는 벽시계 시간은 줄지만 본문 순서가 뒤섞인다. _create_page가
+append를 차례대로 보내는 이유를 이 비교로 보여준다.
+
+사용 예시:
+    python -m benchmarks.page_write --sizes 25,100,400 --latency 0.05 --jitter 0.03
+    python -m benchmarks.page_write --sizes 100 --compare-concurrent
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from benchmarks.markdown_blocks import build_markdown
+from scripts.utils.markdown_blocks import markdown_to_blocks
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.notion_emulator import NotionEmulator
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+
+DATABASE_ID = "bench-daily-db"
+PROPERTIES = {"Title": {"title": [{"text": {"content": "긴 본문 벤치마크"}}]}}
+
+
+def _signature(block: dict[str, Any]) -> tuple[str, str]:
+    """블록 종류와 텍스트로 순서 비교용 서명을 만듦 (저장 시 붙는 응답 필드는 무시)"""
+    payload = block.get(block.get("type", ""), {})
+    text = "".join(item["text"]["content"] for item in payload.get("rich_text", []))
+    return block.get("type", ""), text
+
+
+def _build_notion(
+    latency: float, jitter: float, seed: int
+) -> tuple[NotionClientWrapper, NotionEmulator]:
+    emulator = NotionEmulator(latency=latency, jitter=jitter, seed=seed)
+    emulator.add_database(DATABASE_ID)
+    notion = NotionClientWrapper(
+        client=emulator,
+        scheduler=RequestScheduler(rate=10_000, burst=10_000),
+        settings=Settings(notion_daily_db=DATABASE_ID),
+    )
+    return notion, emulator
+
+
+def _write_concurrently(emulator: NotionEmulator, children: list[dict[str, Any]]) -> dict[str, Any]:
+    """비교용: 첫 묶음으로 페이지를 만든 뒤 나머지 append를 한꺼번에 보냄"""
+    batches = list(NotionClientWrapper._batch_children(children))
+    page = emulator.pages.create(
+        parent={"database_id": DATABASE_ID}, properties=PROPERTIES, children=batches[0]
+    )
+    with ThreadPoolExecutor(max_workers=max(1, len(batches) - 1)) as executor:
+        futures = [
+            executor.submit(emulator.blocks.children.append, block_id=page["id"], children=batch)
+            for batch in batches[1:]
+        ]
+        for future in futures:
+            future.result()
+    return page
+
+
+def measure(
+    size_kb: int, latency: float, jitter: float, seed: int, concurrent: bool = False
+) -> dict[str, Any]:
+    """
+    한 크기의 본문을 저장하고 요청 수, 시간, 순서 보존 여부를 집계
+
+    Args:
+        size_kb: 본문 마크다운 크기 (KB)
+        latency: 요청당 기본 지연(초)
+        jitter: 지연 편차(초)
+        seed: 에뮬레이터 난수 시드
+        concurrent: True면 첫 묶음 이후 append를 동시에 보냄 (비교용)
+
+    Returns:
+        블록/묶음 수, 요청 수, 벽시계 시간(ms), 순서 보존 여부
+    """
+    children = markdown_to_blocks(build_markdown(size_kb))
+    notion, emulator = _build_notion(latency, jitter, seed)
+
+    started = time.perf_counter()
+    if concurrent:
+        page = _write_concurrently(emulator, children)
+    else:
+        page = notion._create_page(DATABASE_ID, PROPERTIES, children)
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    stored = [emulator.blocks_by_id[block_id] for block_id in emulator.children_ids[page["id"]]]
+    return {
+        "size_kb": size_kb,
+        "mode": "concurrent" if concurrent else "sequential",
+        "blocks": len(children),
+        "batches": sum(1 for _ in NotionClientWrapper._batch_children(children)),
+        "requests": emulator.calls["pages.create"] + emulator.calls["blocks.children.append"],
+        "wall_ms": wall_ms,
+        "order_preserved": [_signature(b) for b in stored] == [_signature(b) for b in children],
+    }
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="긴 본문 페이지 저장 왕복 횟수/순서 벤치마크")
+    parser.add_argument("--sizes", default="25,100,400", help="본문 크기 목록 (KB, 쉼표 구분)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Notion 요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.03, help="지연 편차(초)")
+    parser.add_argument("--seed", type=int, default=7, help="에뮬레이터 난수 시드")
+    parser.add_argument(
+        "--compare-concurrent",
+        action="store_true",
+        help="append를 동시에 보내는 방식도 함께 측정 (순서가 뒤섞이는지 비교)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    modes = [False, True] if args.compare_concurrent else [False]
+    results = [
+        measure(int(size), args.latency, args.jitter, args.seed, concurrent)
+        for size in args.sizes.split(",")
+        for concurrent in modes
+    ]
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        print(
+            f"{result['size_kb']:>5} KB {result['mode']:<10}: 블록 {result['blocks']}개, "
+            f"묶음 {result['batches']}개, 요청 {result['requests']}회, "
+            f"{result['wall_ms']:8.1f} ms, 순서 {'유지' if result['order_preserved'] else '뒤섞임'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
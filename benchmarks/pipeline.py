@@ -0,0 +1,466 @@
+"""
+WeeklyProcessor.run / MonthlyProcessor.run 단계별 종단 간 벤치마크
+
+합성 일일 로그 코퍼스(benchmarks.corpus, 기본 10, 100, 1,000, 10,000건)를 인메모리
+Notion 에뮬레이터에 적재하고 지연을 설정한 스텁 LLM으로 두 프로세서의 run()을 실제 코드
+경로 그대로 실행한다.
+프로세서와 클라이언트의 메서드를 감싸 단계(fetch/enrich/format/llm/save)별로 벽시계 시간,
+Notion API 호출 수, 단계 중 최대 메모리 할당(tracemalloc), 최대 RSS를 집계한다.
+
+크기별 실행은 매번 새 프로세스에서 하므로 최대 RSS가 이전 실행의 영향을 받지 않는다.
+--save-baseline으로 결과를 기준선(JSON)으로 저장해 두면 이후 실행은 기준선과 비교해
+허용 범위를 넘는 단계가 하나라도 있으면 목록을 출력하고 종료 코드 1로 끝난다.
+기준선에는 측정한 머신 정보도 함께 남기며, 현재 머신과 다르면 머신에 따라 달라지는
+벽시계 시간은 비교하지 않고 Notion 호출 수와 메모리 할당만 비교한다.
+
+사용 예시:
+    python -m benchmarks.pipeline --save-baseline
+    python -m benchmarks.pipeline --sizes 10,100,1000,10000 --tolerance 0.5
+    python -m benchmarks.pipeline --processors weekly --sizes 1000 --llm-latency 0.2
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from benchmarks.corpus import iter_daily_log_fixtures
+from benchmarks.llm_providers import StubLLMClient
+from scripts.monthly_processor import MonthlyProcessor
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.notion_emulator import NotionEmulator
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+from scripts.weekly_processor import WeeklyProcessor
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, "benchmarks", "baselines", "pipeline.json")
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000)
+PROCESSORS = ("weekly", "monthly")
+STAGES = ("fetch", "enrich", "format", "llm", "save")
+
+DAILY_DB = "bench-daily-db"
+WEEKLY_DB = "bench-weekly-db"
+MONTHLY_DB = "bench-monthly-db"
+CORPUS_START = date(2025, 1, 6)
+LOGS_PER_DAY = 3
+
+# 기준선과 비교할 지표와 노이즈를 흡수할 절대 여유분 (RSS는 프로세스 전체 값이라 보고만 함)
+COMPARED_METRICS = {"wall_ms": 20.0, "alloc_peak_kb": 256.0, "http_calls": 0.0}
+# 측정한 머신이 같을 때만 비교할 지표
+HOST_DEPENDENT_METRICS = ("wall_ms",)
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (Linux는 KB, macOS는 바이트 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StageProfiler:
+    """감싼 메서드가 실행되는 구간을 단계별로 묶어 시간/호출 수/메모리를 집계"""
+
+    def __init__(self, emulator: NotionEmulator):
+        self.emulator = emulator
+        self.stages: dict[str, dict[str, float]] = {
+            stage: {"wall_ms": 0.0, "http_calls": 0, "alloc_peak_kb": 0.0} for stage in STAGES
+        }
+        self._active: dict[str, int] = {}
+        self._entered: dict[str, tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def _http_calls(self) -> int:
+        return sum(self.emulator.calls.values())
+
+    def _enter(self, stage: str):
+        # 같은 단계가 여러 스레드에서 겹치면(LLM map 요청 등) 전체를 한 구간으로 셈
+        with self._lock:
+            self._active[stage] = self._active.get(stage, 0) + 1
+            if self._active[stage] > 1:
+                return
+            tracemalloc.reset_peak()
+            current, _peak = tracemalloc.get_traced_memory()
+            self._entered[stage] = (time.perf_counter(), self._http_calls(), current)
+
+    def _exit(self, stage: str):
+        with self._lock:
+            self._active[stage] -= 1
+            if self._active[stage]:
+                return
+            started, calls, current = self._entered.pop(stage)
+            _current, peak = tracemalloc.get_traced_memory()
+            record = self.stages[stage]
+            record["wall_ms"] += (time.perf_counter() - started) * 1000
+            record["http_calls"] += self._http_calls() - calls
+            record["alloc_peak_kb"] = max(record["alloc_peak_kb"], (peak - current) / 1024)
+            record["rss_peak_mb"] = _max_rss_mb()
+
+    def instrument(self, target: Any, name: str, stage: str):
+        """
+        인스턴스 메서드를 단계 측정 래퍼로 교체 (제너레이터는 next() 구간만 측정)
+
+        Args:
+            target: 메서드를 가진 객체
+            name: 메서드 이름
+            stage: 집계할 단계 이름
+        """
+        method = getattr(target, name)
+
+        if inspect.isgeneratorfunction(method):
+
+            @functools.wraps(method)
+            def generator_wrapper(*args, **kwargs) -> Iterator[Any]:
+                iterator = method(*args, **kwargs)
+                while True:
+                    self._enter(stage)
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                    finally:
+                        self._exit(stage)
+                    yield item
+
+            setattr(target, name, generator_wrapper)
+            return
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            self._enter(stage)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._exit(stage)
+
+        setattr(target, name, wrapper)
+
+
+def _logged_date(index: int) -> date:
+    return CORPUS_START + timedelta(days=index // LOGS_PER_DAY)
+
+
+def _text_block(block_type: str, text: str) -> dict[str, Any]:
+    return {
+        "type": block_type,
+        block_type: {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+
+
+def weekly_fixtures(daily_ids: list[str]) -> Iterable[dict[str, Any]]:
+    """
+    일일 로그 코퍼스를 ISO 주 단위로 묶은 주간 성과 페이지 fixture를 만듦
+
+    Args:
+        daily_ids: 적재 순서대로의 일일 로그 페이지 ID (하루 LOGS_PER_DAY건)
+
+    Yields:
+        NotionEmulator.seed_pages에 넣을 주간 성과 fixture
+    """
+    weeks: dict[date, list[str]] = {}
+    for index, page_id in enumerate(daily_ids):
+        logged = _logged_date(index)
+        weeks.setdefault(logged - timedelta(days=logged.weekday()), []).append(page_id)
+
+    for monday, source_ids in weeks.items():
+        label = f"{monday.isoformat()} 주간 성과"
+        yield {
+            "properties": {
+                "Title": {"title": [{"text": {"content": label}}]},
+                "Period Start": {"date": {"start": monday.isoformat()}},
+                "Period End": {"date": {"start": (monday + timedelta(days=6)).isoformat()}},
+                "Key Highlights": {
+                    "rich_text": [{"text": {"content": f"{len(source_ids)}건 처리, 지표 개선"}}]
+                },
+                "Source Logs": {"relation": [{"id": log_id} for log_id in source_ids]},
+            },
+            "children": [
+                _text_block("heading_2", "🎯 주간 성과 요약"),
+                *[
+                    _text_block("paragraph", f"• {label} 항목 {idx}: 처리 결과 정리")
+                    for idx in range(5)
+                ],
+            ],
+        }
+
+
+def build_notion(emulator: NotionEmulator) -> NotionClientWrapper:
+    """에뮬레이터에 연결한 래퍼 (클라이언트 측 속도 제한 없음)"""
+    return NotionClientWrapper(
+        client=emulator,
+        scheduler=RequestScheduler(rate=1_000_000, burst=1_000_000),
+        settings=Settings(
+            notion_daily_db=DAILY_DB,
+            notion_weekly_db=WEEKLY_DB,
+            notion_monthly_db=MONTHLY_DB,
+        ),
+    )
+
+
+def run_case(processor: str, size: int, config: dict[str, Any]) -> dict[str, Any]:
+    """
+    코퍼스를 적재하고 프로세서 run()을 한 번 실행해 단계별 지표를 측정
+
+    Args:
+        processor: "weekly" 또는 "monthly"
+        size: 일일 로그 건수
+        config: notion_latency, llm_latency, llm_seconds_per_1k, seed 설정
+
+    Returns:
+        단계 이름(STAGES와 total)을 키로 하는 지표 dict
+    """
+    emulator = NotionEmulator(latency=config["notion_latency"], seed=config["seed"])
+    for database_id in (DAILY_DB, WEEKLY_DB, MONTHLY_DB):
+        emulator.add_database(database_id)
+    daily_ids = emulator.seed_pages(
+        DAILY_DB,
+        iter_daily_log_fixtures(
+            size, seed=config["seed"], start=CORPUS_START, logs_per_day=LOGS_PER_DAY
+        ),
+    )
+
+    notion = build_notion(emulator)
+    llm = StubLLMClient(
+        seconds_per_1k_tokens=config["llm_seconds_per_1k"], ttft=config["llm_latency"]
+    )
+    profiler = StageProfiler(emulator)
+    profiler.instrument(notion, "_enrich_with_content", "enrich")
+    profiler.instrument(llm, "_generate", "llm")
+
+    first_day = datetime.combine(CORPUS_START, datetime.min.time())
+    last_day = datetime.combine(_logged_date(size - 1), datetime.min.time())
+    if processor == "weekly":
+        target: Any = WeeklyProcessor(notion_client=notion, llm_client=llm)
+        profiler.instrument(notion, "iter_daily_logs", "fetch")
+        profiler.instrument(llm, "_format_daily_log_parts", "format")
+        profiler.instrument(notion, "create_weekly_achievement", "save")
+        run = functools.partial(target.run, first_day, last_day)
+    else:
+        emulator.seed_pages(WEEKLY_DB, weekly_fixtures(daily_ids))
+        target = MonthlyProcessor(notion_client=notion, llm_client=llm)
+        profiler.instrument(notion, "iter_weekly_achievements", "fetch")
+        profiler.instrument(llm, "_format_weekly_achievement_parts", "format")
+        profiler.instrument(target, "build_stats_text", "format")
+        profiler.instrument(notion, "create_monthly_highlight", "save")
+        last_sunday = last_day + timedelta(days=6 - last_day.weekday())
+        run = functools.partial(target.run, first_day, last_sunday, last_day.year, last_day.month)
+
+    calls_before = sum(emulator.calls.values())
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        if run() is None:
+            raise RuntimeError(f"{processor} 처리 결과가 없습니다 (size={size}).")
+        wall_ms = (time.perf_counter() - started) * 1000
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        notion.close()
+
+    stages = profiler.stages
+    stages["total"] = {
+        "wall_ms": wall_ms,
+        "http_calls": sum(emulator.calls.values()) - calls_before,
+        "alloc_peak_kb": max([peak / 1024, *(stage["alloc_peak_kb"] for stage in stages.values())]),
+        "rss_peak_mb": _max_rss_mb(),
+    }
+    return stages
+
+
+def run_isolated(processor: str, size: int, config: dict[str, Any]) -> dict[str, Any]:
+    """run_case를 새 프로세스에서 실행 (최대 RSS와 tracemalloc 측정을 실행마다 분리)"""
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(run_case, processor, size, config).result()
+
+
+def host_info() -> dict[str, Any]:
+    """벽시계 시간에 영향을 주는 현재 머신 정보 (기준선 비교 가능 여부 판단용)"""
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, dict]],
+    baseline: dict[str, Any],
+    tolerance: float,
+    metrics: Iterable[str] = tuple(COMPARED_METRICS),
+) -> list[str]:
+    """
+    결과를 기준선과 비교해 허용 범위를 넘은 항목을 찾음
+
+    wall_ms와 alloc_peak_kb는 기준선 × (1 + tolerance)에 절대 여유분을 더한 값까지,
+    http_calls는 기준선과 같거나 적을 때까지 허용한다.
+
+    Args:
+        results: {프로세서: {크기: {단계: 지표}}}
+        baseline: 저장된 기준선 (results 키에 같은 구조)
+        tolerance: 허용 비율 (0.5면 50%)
+        metrics: 비교할 지표 이름 (기본값은 COMPARED_METRICS 전체)
+
+    Returns:
+        회귀 설명 문자열 리스트 (비어 있으면 통과)
+    """
+    compared = {metric: COMPARED_METRICS[metric] for metric in metrics}
+    regressions = []
+    for processor, sizes in results.items():
+        for size, stages in sizes.items():
+            expected = baseline["results"].get(processor, {}).get(size)
+            if expected is None:
+                continue
+            for stage, measured in stages.items():
+                for metric, slack in compared.items():
+                    before = expected.get(stage, {}).get(metric)
+                    if before is None:
+                        continue
+                    allowed = before * (1 + tolerance) + slack
+                    if metric == "http_calls":
+                        allowed = before
+                    if measured[metric] > allowed:
+                        regressions.append(
+                            f"{processor} size={size} {stage}.{metric}: "
+                            f"{measured[metric]:.1f} > 허용치 {allowed:.1f} "
+                            f"(기준 {before:.1f})"
+                        )
+    return regressions
+
+
+def print_table(processor: str, size: str, stages: dict[str, dict]):
+    """한 실행의 단계별 지표를 표로 출력"""
+    print(f"\n{processor} (일일 로그 {size}건)")
+    print(
+        f"  {'stage':<8} {'wall_ms':>10} {'http_calls':>10} "
+        f"{'alloc_peak_kb':>14} {'rss_peak_mb':>13}"
+    )
+    for stage in (*STAGES, "total"):
+        metrics = stages[stage]
+        rss = metrics.get("rss_peak_mb")
+        print(
+            f"  {stage:<8} {metrics['wall_ms']:>10.1f} {metrics['http_calls']:>10} "
+            f"{metrics['alloc_peak_kb']:>14.1f} "
+            f"{f'{rss:.1f}' if rss is not None else '-':>13}"
+        )
+
+
+def main():
+    """CLI 엔트리 포인트"""
+    parser = argparse.ArgumentParser(description="주간/월간 프로세서 단계별 종단 간 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="일일 로그 코퍼스 크기 (쉼표 구분)",
+    )
+    parser.add_argument(
+        "--processors", default=",".join(PROCESSORS), help="weekly, monthly (쉼표 구분)"
+    )
+    parser.add_argument("--notion-latency", type=float, default=0.0, help="Notion 요청당 지연(초)")
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.05, help="LLM 요청당 첫 토큰 지연(초)"
+    )
+    parser.add_argument(
+        "--llm-seconds-per-1k",
+        type=float,
+        default=0.002,
+        help="LLM 입력 1K 토큰당 추가 지연(초)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="코퍼스 난수 시드")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="비교 대신 결과를 기준선으로 저장"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.5, help="시간/할당 허용 증가 비율")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    config = {
+        "notion_latency": args.notion_latency,
+        "llm_latency": args.llm_latency,
+        "llm_seconds_per_1k": args.llm_seconds_per_1k,
+        "seed": args.seed,
+    }
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    processors = [name.strip() for name in args.processors.split(",") if name.strip()]
+    unknown = set(processors) - set(PROCESSORS)
+    if unknown:
+        parser.error(f"지원하지 않는 프로세서: {', '.join(sorted(unknown))}")
+
+    results: dict[str, dict[str, dict]] = {}
+    for processor in processors:
+        for size in sizes:
+            stages = run_isolated(processor, size, config)
+            results.setdefault(processor, {})[str(size)] = stages
+            if not args.json:
+                print_table(processor, str(size), stages)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(
+                {"version": 1, "config": config, "host": host_info(), "results": results},
+                baseline_file,
+                ensure_ascii=False,
+                indent=2,
+            )
+            baseline_file.write("\n")
+        print(f"\n기준선 저장: {args.baseline}", file=sys.stderr)
+        return
+
+    if not os.path.exists(args.baseline):
+        print(
+            f"\n기준선 없음: {args.baseline} (--save-baseline으로 생성)",
+            file=sys.stderr,
+        )
+        return
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("config") != config:
+        print(
+            f"\n기준선과 측정 조건이 다릅니다: 기준 {baseline.get('config')}, 현재 {config}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    metrics = list(COMPARED_METRICS)
+    host = host_info()
+    if baseline.get("host") != host:
+        metrics = [metric for metric in metrics if metric not in HOST_DEPENDENT_METRICS]
+        print(
+            f"\n기준선을 측정한 머신이 다릅니다 (기준 {baseline.get('host')}, 현재 {host}). "
+            f"{', '.join(HOST_DEPENDENT_METRICS)}은 비교하지 않습니다. "
+            "이 머신에서 --save-baseline으로 기준선을 다시 만들면 함께 비교합니다.",
+            file=sys.stderr,
+        )
+
+    regressions = compare(results, baseline, args.tolerance, metrics)
+    if regressions:
+        print(f"\n기준선 대비 회귀 {len(regressions)}건:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+    print(f"\n기준선 대비 회귀 없음 (허용 {args.tolerance:.0%})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,12 @@ resource "aws_lambda_function" "this" {
   memory_size   = 512
   timeout       = 30
 
+  # 이미지 기본 CMD(uvicorn) 대신 Lambda 런타임 클라이언트로 핸들러 실행
+  image_config {
+    entry_point = ["python", "-m", "awslambdaric"]
+    command     = ["scripts.api.lambda_handler.handler"]
+  }
+
   environment {
     variables = local.merged_environment
   }
@@ -2,20 +2,62 @@
 일일 업무 기록을 REST API로 제공하는 FastAPI 애플리케이션
 """
 
+import asyncio
+import contextvars
 import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
+from typing import Any, TypeVar
 
-from fastapi import Depends, FastAPI, Header, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field, validator
 
-from scripts.utils.notion_client import NotionClientWrapper
-
-app = FastAPI(
-    title="Work Logging API",
-    summary="Cursor/Claude와 연동해 Notion Daily Work Logs를 생성하는 REST API",
-    version="1.0.0",
+from scripts.api.metrics import registry as metrics
+from scripts.api.outbox import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    OutboxStore,
+    OutboxWorker,
 )
+from scripts.utils.logging_setup import (
+    execution_logger,
+    new_request_id,
+    request_context,
+)
+from scripts.utils.notion_client import (
+    NotionClientWrapper,
+    create_pooled_http_client,
+)
+from scripts.utils.settings import get_settings
+
+T = TypeVar("T")
+
+# Notion 동기 호출을 이벤트 루프 밖에서 실행할 스레드 수 기본값
+DEFAULT_NOTION_WORKERS = 8
+
+# 배치 요청 한 번에 받을 수 있는 최대 로그 수
+MAX_BATCH_SIZE = 50
+
+# 비동기 저장 모드에서 요청을 보관할 아웃박스 기본 경로
+DEFAULT_OUTBOX_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "outbox.sqlite3")
+
+# 프로세스 전체에서 재사용하는 Notion 클라이언트 (커넥션 풀 공유)
+_notion_client: NotionClientWrapper | None = None
+_notion_client_lock = threading.Lock()
+
+# Notion 호출 전용 스레드 풀 (API_NOTION_WORKERS로 상한 조절)
+_notion_executor: ThreadPoolExecutor | None = None
+_notion_executor_lock = threading.Lock()
+
+# 비동기 저장 모드의 아웃박스 워커 (최초 사용 시 생성)
+_outbox_worker: OutboxWorker | None = None
+_outbox_lock = threading.Lock()
 
 
 class DailyLogRequest(BaseModel):
@@ -54,15 +96,60 @@ class DailyLogResponse(BaseModel):
     url: str = Field(..., description="생성된 Notion 페이지 URL")
 
 
-def write_execution_log(status_text: str, message: str):
-    """API 처리 결과를 로그 파일에 남김"""
-    logs_dir = os.path.join(os.path.dirname(__file__), "..", "..", "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    log_path = os.path.join(logs_dir, "execution.log")
+class DailyLogBatchRequest(BaseModel):
+    """여러 일일 업무 로그를 한 번에 생성하기 위한 요청 본문"""
+
+    items: list[DailyLogRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description=f"생성할 일일 로그 목록 (최대 {MAX_BATCH_SIZE}건)",
+    )
+
+
+class DailyLogBatchItemResult(BaseModel):
+    """배치 요청 내 개별 로그의 처리 결과"""
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_path, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[{timestamp}] [{status_text}] api_server - {message}\n")
+    index: int = Field(..., description="요청 items 내 순번 (0부터 시작)")
+    success: bool = Field(..., description="Notion 저장 성공 여부")
+    page_id: str | None = Field(None, description="생성된 Notion 페이지 ID")
+    url: str | None = Field(None, description="생성된 Notion 페이지 URL")
+    error: str | None = Field(None, description="실패 사유")
+
+
+class DailyLogBatchResponse(BaseModel):
+    """배치 생성 결과 응답 (부분 성공 허용)"""
+
+    total: int = Field(..., description="요청된 로그 수")
+    succeeded: int = Field(..., description="저장에 성공한 로그 수")
+    failed: int = Field(..., description="저장에 실패한 로그 수")
+    results: list[DailyLogBatchItemResult] = Field(
+        ..., description="요청 순서와 같은 순서의 개별 결과"
+    )
+
+
+class JobAcceptedResponse(BaseModel):
+    """비동기 저장 모드에서 큐 등록 결과 응답"""
+
+    job_id: str = Field(..., description="발급된 작업 ID")
+    status: str = Field(..., description="작업 상태 (queued)")
+    status_url: str = Field(..., description="작업 상태 조회 경로")
+
+
+class JobStatusResponse(BaseModel):
+    """비동기 저장 작업의 상태 조회 응답"""
+
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued/processing/succeeded/failed)")
+    attempts: int = Field(..., description="Notion 저장 시도 횟수")
+    page_id: str | None = Field(None, description="생성된 Notion 페이지 ID")
+    url: str | None = Field(None, description="생성된 Notion 페이지 URL")
+    error: str | None = Field(None, description="마지막 실패 사유")
+    created_at: str = Field(..., description="작업 등록 시각 (ISO 8601)")
+    updated_at: str = Field(..., description="마지막 상태 변경 시각 (ISO 8601)")
+
+
+write_execution_log = execution_logger("api_server")
 
 
 def get_auth_token() -> str | None:
@@ -71,8 +158,214 @@ def get_auth_token() -> str | None:
 
 
 def get_notion_client() -> NotionClientWrapper:
-    """요청마다 Notion 클라이언트를 생성"""
-    return NotionClientWrapper()
+    """
+    프로세스 공용 Notion 클라이언트를 반환 (최초 호출 시 생성)
+
+    keep-alive 커넥션 풀을 요청 간에 재사용해 매 요청마다 TLS 연결을 새로 맺지 않는다.
+    """
+    global _notion_client
+    with _notion_client_lock:
+        if _notion_client is None:
+            # .env의 풀 크기 설정이 반영되도록 설정을 먼저 읽은 뒤 커넥션 풀을 만듦
+            settings = get_settings()
+            _notion_client = NotionClientWrapper(
+                http_client=create_pooled_http_client(settings=settings),
+                settings=settings,
+                observer=metrics.observe_notion,
+            )
+        return _notion_client
+
+
+def close_notion_client():
+    """공용 Notion 클라이언트의 커넥션 풀을 닫고 초기화"""
+    global _notion_client
+    with _notion_client_lock:
+        if _notion_client is not None:
+            _notion_client.close()
+            _notion_client = None
+
+
+def get_notion_executor() -> ThreadPoolExecutor:
+    """Notion 동기 호출 전용 스레드 풀을 반환 (최초 호출 시 생성)"""
+    global _notion_executor
+    with _notion_executor_lock:
+        if _notion_executor is None:
+            _notion_executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("API_NOTION_WORKERS", DEFAULT_NOTION_WORKERS)),
+                thread_name_prefix="notion-api",
+            )
+        return _notion_executor
+
+
+def shutdown_notion_executor():
+    """Notion 호출 스레드 풀을 정리"""
+    global _notion_executor
+    with _notion_executor_lock:
+        if _notion_executor is not None:
+            _notion_executor.shutdown(wait=True)
+            _notion_executor = None
+
+
+async def run_notion_call(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    동기 Notion 호출을 전용 스레드 풀에서 실행하고 결과를 기다림
+
+    이벤트 루프를 막지 않으므로 느린 Notion 쓰기 중에도 /health 등 다른 요청이 처리된다.
+    스레드 수가 제한되어 있어 요청이 몰려도 Notion 호출 동시성은 상한을 넘지 않는다.
+    요청 ID 등 컨텍스트 변수는 작업 스레드에도 그대로 전달된다.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_notion_executor(), partial(context.run, func, *args, **kwargs)
+    )
+
+
+def is_async_ingest_default() -> bool:
+    """API_INGEST_MODE=async이면 모든 POST /daily-logs를 비동기로 처리"""
+    return os.getenv("API_INGEST_MODE", "sync").lower() == "async"
+
+
+def _process_outbox_job(
+    notion_factory: Callable[[], NotionClientWrapper], payload: dict[str, Any]
+) -> tuple[str, str]:
+    """아웃박스 작업 하나를 Notion에 저장 (워커 스레드에서 실행)"""
+    result = save_daily_log(notion_factory(), DailyLogRequest(**payload))
+    write_execution_log("SUCCESS", f"아웃박스 작업으로 일일 로그 생성: {result.page_id}")
+    return result.page_id, result.url
+
+
+def _log_outbox_error(job_id: str, exc: Exception):
+    write_execution_log("ERROR", f"아웃박스 작업 {job_id} 처리 실패: {exc}")
+
+
+def get_outbox_worker(
+    notion_factory: Callable[[], NotionClientWrapper] = get_notion_client,
+) -> OutboxWorker:
+    """
+    아웃박스 저장소와 워커를 반환 (최초 호출 시 생성 후 워커 시작)
+
+    Args:
+        notion_factory: 워커가 작업마다 사용할 Notion 클라이언트를 반환하는 함수
+            (워커를 처음 만들 때만 사용)
+
+    Returns:
+        실행 중인 OutboxWorker
+    """
+    global _outbox_worker
+    with _outbox_lock:
+        if _outbox_worker is None:
+            path = os.getenv("API_OUTBOX_PATH", DEFAULT_OUTBOX_PATH)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            store = OutboxStore(path)
+            store.requeue_stale()
+            _outbox_worker = OutboxWorker(
+                store,
+                partial(_process_outbox_job, notion_factory),
+                max_attempts=int(os.getenv("API_OUTBOX_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+                on_error=_log_outbox_error,
+                lease_seconds=float(os.getenv("API_OUTBOX_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)),
+            )
+            _outbox_worker.start()
+        return _outbox_worker
+
+
+def find_outbox_job(job_id: str) -> dict[str, Any] | None:
+    """
+    워커를 시작하지 않고 아웃박스에서 작업 상태를 조회
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 상태 또는 작업(아웃박스 파일)이 없으면 None
+    """
+    with _outbox_lock:
+        worker = _outbox_worker
+    if worker is not None:
+        return worker.store.get(job_id)
+
+    path = os.getenv("API_OUTBOX_PATH", DEFAULT_OUTBOX_PATH)
+    if not os.path.exists(path):
+        return None
+    return OutboxStore(path).get(job_id)
+
+
+def stop_outbox_worker():
+    """진행 중인 아웃박스 작업을 마치고 워커를 종료"""
+    global _outbox_worker
+    with _outbox_lock:
+        if _outbox_worker is not None:
+            _outbox_worker.stop()
+            _outbox_worker = None
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """앱 시작 시 Notion 클라이언트를 미리 만들고 종료 시 커넥션 풀을 정리"""
+    try:
+        # SDK는 첫 사용 시 import되므로 서버 시작 단계에서 미리 로드해
+        # 첫 요청이 import 비용을 치르지 않게 함
+        _ = get_notion_client().client
+    except ValueError as exc:
+        # 환경 변수가 없어도 /health는 응답할 수 있도록 첫 요청 시점으로 미룸
+        write_execution_log("ERROR", f"Notion 클라이언트 사전 생성 실패: {exc}")
+
+    if is_async_ingest_default():
+        # 이전 프로세스가 남긴 작업을 바로 이어서 처리
+        get_outbox_worker()
+
+    yield
+
+    stop_outbox_worker()
+    shutdown_notion_executor()
+    close_notion_client()
+
+
+app = FastAPI(
+    title="Work Logging API",
+    summary="Cursor/Claude와 연동해 Notion Daily Work Logs를 생성하는 REST API",
+    version="1.0.0",
+    lifespan=lifespan,
+)
+
+
+@app.middleware("http")
+async def observe_requests(request: Request, call_next):
+    """
+    요청마다 요청 ID를 부여하고 처리 시간/상태 코드를 지표와 구조화 로그로 남김
+
+    경로는 /jobs/{job_id}처럼 라우트 템플릿으로 집계해 레이블 수가 늘지 않게 한다.
+    """
+    request_id = request.headers.get("X-Request-ID") or new_request_id()
+    started = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    metrics.add_gauge("http_requests_in_flight")
+    try:
+        with request_context(request_id):
+            response = await call_next(request)
+            status_code = response.status_code
+            response.headers["X-Request-ID"] = request_id
+            # 헬스 체크와 지표 수집은 호출 빈도가 높아 로그에서 제외
+            if request.url.path not in ("/health", "/metrics"):
+                write_execution_log(
+                    "REQUEST",
+                    f"{request.method} {request.url.path} {status_code}",
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    method=request.method,
+                    path=request.url.path,
+                    status_code=status_code,
+                )
+        return response
+    finally:
+        metrics.add_gauge("http_requests_in_flight", value=-1)
+        route = request.scope.get("route")
+        metrics.observe_request(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            status_code,
+            time.perf_counter() - started,
+        )
 
 
 async def verify_token(
@@ -104,50 +397,89 @@ async def verify_token(
         )
 
 
+def save_daily_log(notion: NotionClientWrapper, payload: DailyLogRequest) -> DailyLogResponse:
+    """
+    요청 본문 하나를 Notion 일일 로그 페이지로 저장 (동기, 스레드 풀에서 실행)
+
+    Args:
+        notion: Notion 클라이언트
+        payload: 검증된 요청 본문
+
+    Returns:
+        생성된 페이지 ID와 URL
+    """
+    logged_date = (
+        datetime.strptime(payload.logged_date, "%Y-%m-%d")
+        if payload.logged_date
+        else datetime.now()
+    )
+
+    page = notion.create_daily_log(
+        title=payload.title,
+        context=payload.context,
+        category=payload.category,
+        impact_level=payload.impact_level,
+        tech_stack=payload.tech_stack,
+        logged_date=logged_date,
+        status=payload.status,
+        metrics=payload.metrics,
+        ticket_url=payload.ticket_url,
+    )
+
+    page_id = page.get("id")
+    notion_url = f"https://notion.so/{page_id.replace('-', '')}" if page_id else ""
+    return DailyLogResponse(page_id=page_id, url=notion_url)
+
+
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict:
     """배포 상태 확인용 엔드포인트"""
     return {"status": "ok", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def get_metrics(_: None = Depends(verify_token)) -> PlainTextResponse:
+    """요청 지연/상태 코드/Notion 호출 지표를 Prometheus 텍스트 형식으로 반환"""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.post(
     "/daily-logs",
     response_model=DailyLogResponse,
     status_code=status.HTTP_201_CREATED,
     tags=["Daily Logs"],
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": JobAcceptedResponse,
+            "description": "비동기 모드: 큐에 등록됨 (GET /jobs/{job_id}로 확인)",
+        }
+    },
 )
 async def create_daily_log(
     payload: DailyLogRequest,
     _: None = Depends(verify_token),
+    prefer: str | None = Header(default=None),
     notion: NotionClientWrapper = Depends(get_notion_client),
 ) -> JSONResponse:
-    """일일 업무 로그를 Notion 데이터베이스에 저장"""
-    try:
-        logged_date = (
-            datetime.strptime(payload.logged_date, "%Y-%m-%d")
-            if payload.logged_date
-            else datetime.now()
-        )
+    """
+    일일 업무 로그를 Notion 데이터베이스에 저장
 
-        page = notion.create_daily_log(
-            title=payload.title,
-            context=payload.context,
-            category=payload.category,
-            impact_level=payload.impact_level,
-            tech_stack=payload.tech_stack,
-            logged_date=logged_date,
-            status=payload.status,
-            metrics=payload.metrics,
-            ticket_url=payload.ticket_url,
-        )
+    `Prefer: respond-async` 헤더를 보내거나 API_INGEST_MODE=async로 설정하면
+    요청을 로컬 아웃박스에 기록한 뒤 즉시 202와 작업 ID를 반환하고,
+    백그라운드 워커가 Notion 저장을 이어서 처리한다.
+    """
+    if is_async_ingest_default() or "respond-async" in (prefer or "").lower():
+        return await enqueue_daily_log(payload, notion)
 
-        page_id = page.get("id")
-        notion_url = f"https://notion.so/{page_id.replace('-', '')}" if page_id else ""
+    try:
+        result = await run_notion_call(save_daily_log, notion, payload)
 
-        write_execution_log("SUCCESS", f"API로 일일 로그 생성: {page_id}")
+        write_execution_log("SUCCESS", f"API로 일일 로그 생성: {result.page_id}")
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
-            content=DailyLogResponse(page_id=page_id, url=notion_url).dict(),
+            content=result.dict(),
         )
     except HTTPException:
         raise
@@ -157,3 +489,111 @@ async def create_daily_log(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="노션 저장 중 오류가 발생했습니다.",
         ) from exc
+
+
+async def enqueue_daily_log(payload: DailyLogRequest, notion: NotionClientWrapper) -> JSONResponse:
+    """요청 본문을 아웃박스에 기록하고 202 응답을 반환"""
+    try:
+        worker = await asyncio.to_thread(get_outbox_worker, lambda: notion)
+        job_id = await asyncio.to_thread(worker.store.enqueue, payload.dict())
+    except Exception as exc:  # pylint: disable=broad-except
+        write_execution_log("ERROR", f"아웃박스 등록 실패: {exc}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="요청을 대기열에 저장하지 못했습니다.",
+        ) from exc
+
+    worker.notify()
+    write_execution_log("INFO", f"API 일일 로그 비동기 접수: {job_id}")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobAcceptedResponse(
+            job_id=job_id, status="queued", status_url=f"/jobs/{job_id}"
+        ).dict(),
+        headers={"Location": f"/jobs/{job_id}"},
+    )
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse, tags=["Daily Logs"])
+async def get_job_status(job_id: str, _: None = Depends(verify_token)) -> dict:
+    """비동기 저장 작업의 진행 상태를 조회"""
+    job = await asyncio.to_thread(find_outbox_job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 작업을 찾을 수 없습니다.",
+        )
+
+    return JobStatusResponse(
+        job_id=job["id"],
+        status=job["status"],
+        attempts=job["attempts"],
+        page_id=job["page_id"],
+        url=job["url"],
+        error=job["error"],
+        created_at=datetime.fromtimestamp(job["created_at"]).isoformat(),
+        updated_at=datetime.fromtimestamp(job["updated_at"]).isoformat(),
+    ).dict()
+
+
+@app.post(
+    "/daily-logs/batch",
+    response_model=DailyLogBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Daily Logs"],
+    responses={status.HTTP_207_MULTI_STATUS: {"description": "일부 로그만 저장에 성공"}},
+)
+async def create_daily_logs_batch(
+    payload: DailyLogBatchRequest,
+    _: None = Depends(verify_token),
+    notion: NotionClientWrapper = Depends(get_notion_client),
+) -> JSONResponse:
+    """
+    여러 일일 업무 로그를 동시에 Notion 데이터베이스에 저장
+
+    각 로그는 Notion 호출 스레드 풀과 공용 속도 제한기를 거쳐 병렬로 저장된다.
+    일부가 실패해도 나머지는 저장되며, 모두 성공하면 201, 하나라도 실패하면 207을 반환한다.
+    """
+    outcomes = await asyncio.gather(
+        *(run_notion_call(save_daily_log, notion, item) for item in payload.items),
+        return_exceptions=True,
+    )
+
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, DailyLogResponse):
+            results.append(
+                DailyLogBatchItemResult(
+                    index=index,
+                    success=True,
+                    page_id=outcome.page_id,
+                    url=outcome.url,
+                    error=None,
+                )
+            )
+        else:
+            write_execution_log("ERROR", f"API 배치 항목 {index} 처리 실패: {outcome}")
+            results.append(
+                DailyLogBatchItemResult(
+                    index=index,
+                    success=False,
+                    page_id=None,
+                    url=None,
+                    error="노션 저장 중 오류가 발생했습니다.",
+                )
+            )
+
+    succeeded = sum(1 for result in results if result.success)
+    failed = len(results) - succeeded
+    write_execution_log(
+        "SUCCESS" if not failed else "ERROR",
+        f"API 배치 일일 로그 생성: 성공 {succeeded}건 / 실패 {failed}건",
+    )
+
+    response = DailyLogBatchResponse(
+        total=len(results), succeeded=succeeded, failed=failed, results=results
+    )
+    return JSONResponse(
+        status_code=(status.HTTP_201_CREATED if not failed else status.HTTP_207_MULTI_STATUS),
+        content=response.dict(),
+    )
@@ -0,0 +1,265 @@
+"""
+AWS Lambda 진입점 (API Gateway HTTP API 페이로드 2.0 이벤트 → FastAPI 앱)
+
+초기화는 컨테이너당 한 번만 수행한다. 이벤트 루프와 앱 lifespan(공용 Notion 클라이언트,
+커넥션 풀, Notion 호출 스레드 풀)을 모듈 전역에 보관하므로 웜 호출은 이벤트를 ASGI
+요청으로 바꿔 앱을 실행하는 일만 한다. 콜드 스타트 여부와 초기화 시간은 CloudWatch
+Embedded Metric Format(EMF) 로그 한 줄로 남겨 별도 API 호출 없이 지표로 집계된다.
+
+컨테이너 이미지 설정 (Terraform aws_api_lambda 모듈):
+    entry_point = ["python", "-m", "awslambdaric"]
+    command     = ["scripts.api.lambda_handler.handler"]
+"""
+
+import asyncio
+import base64
+import os
+import time
+from collections.abc import MutableMapping
+from typing import Any
+from urllib.parse import unquote
+
+from fastapi import FastAPI
+
+from scripts.api.app import app
+from scripts.utils.logging_setup import execution_logger, flush_logs
+
+# EMF 지표 네임스페이스 기본값
+DEFAULT_METRICS_NAMESPACE = "WorkLogging"
+
+# 응답 본문을 base64 없이 문자열로 돌려줄 Content-Type
+_TEXT_CONTENT_TYPES = ("text/", "application/json", "application/xml", "javascript")
+
+write_execution_log = execution_logger("lambda_handler")
+
+
+class LambdaRuntime:
+    """컨테이너 수명 동안 유지되는 이벤트 루프와 앱 lifespan"""
+
+    def __init__(self, asgi_app: FastAPI = app):
+        """
+        이벤트 루프를 만들고 앱 lifespan 시작 단계를 실행
+
+        Args:
+            asgi_app: 요청을 처리할 FastAPI 앱
+        """
+        started = time.perf_counter()
+        self.app = asgi_app
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._lifespan = asgi_app.router.lifespan_context(asgi_app)
+        self.loop.run_until_complete(self._lifespan.__aenter__())
+        self.init_duration_ms = (time.perf_counter() - started) * 1000
+        self.invocations = 0
+
+    def invoke(self, event: dict[str, Any]) -> dict[str, Any]:
+        """
+        이벤트 하나를 앱에 전달하고 API Gateway 응답 형식으로 변환
+
+        Args:
+            event: API Gateway HTTP API 페이로드 2.0 이벤트
+
+        Returns:
+            statusCode/headers/cookies/body/isBase64Encoded 응답
+        """
+        scope, body = event_to_scope(event)
+        return self.loop.run_until_complete(_call_asgi(self.app, scope, body))
+
+    def close(self):
+        """앱 lifespan 종료 단계를 실행하고 이벤트 루프를 닫음"""
+        self.loop.run_until_complete(self._lifespan.__aexit__(None, None, None))
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+
+# 컨테이너 공용 런타임 (웜 호출에서 재사용)
+_runtime: LambdaRuntime | None = None
+
+
+def get_runtime() -> LambdaRuntime:
+    """컨테이너 공용 런타임을 반환 (최초 호출 시 생성)"""
+    global _runtime
+    if _runtime is None:
+        _runtime = LambdaRuntime()
+    return _runtime
+
+
+def reset_runtime():
+    """공용 런타임을 정리 (로컬 재생/테스트에서 콜드 스타트를 다시 만들 때 사용)"""
+    global _runtime
+    if _runtime is not None:
+        _runtime.close()
+        _runtime = None
+
+
+def event_to_scope(event: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+    """
+    API Gateway HTTP API 페이로드 2.0 이벤트를 ASGI HTTP scope와 요청 본문으로 변환
+
+    Args:
+        event: Lambda가 전달한 이벤트
+
+    Returns:
+        (ASGI scope, 요청 본문 바이트)
+    """
+    if event.get("version") != "2.0":
+        raise ValueError("API Gateway HTTP API 페이로드 2.0 이벤트만 지원합니다.")
+
+    request_context = event.get("requestContext") or {}
+    http = request_context.get("http") or {}
+    headers = {key.lower(): value for key, value in (event.get("headers") or {}).items()}
+    if event.get("cookies"):
+        headers["cookie"] = "; ".join(event["cookies"])
+    # API Gateway 요청 ID를 그대로 써서 게이트웨이 로그와 앱 로그를 연결
+    if request_context.get("requestId"):
+        headers.setdefault("x-request-id", request_context["requestId"])
+
+    path = event.get("rawPath") or http.get("path") or "/"
+    stage = request_context.get("stage")
+    if stage and stage != "$default" and path.startswith(f"/{stage}/"):
+        path = path[len(stage) + 1 :]
+
+    body = event.get("body") or ""
+    body_bytes = base64.b64decode(body) if event.get("isBase64Encoded") else body.encode("utf-8")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": http.get("method", "GET").upper(),
+        "scheme": headers.get("x-forwarded-proto", "https"),
+        "path": unquote(path),
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": (event.get("rawQueryString") or "").encode("utf-8"),
+        "headers": [
+            (key.encode("latin-1"), value.encode("utf-8")) for key, value in headers.items()
+        ],
+        "client": (http.get("sourceIp", ""), 0),
+        "server": (
+            headers.get("host", "lambda"),
+            int(headers.get("x-forwarded-port", 443)),
+        ),
+    }
+    return scope, body_bytes
+
+
+async def _call_asgi(asgi_app: FastAPI, scope: dict[str, Any], body: bytes) -> dict[str, Any]:
+    """ASGI 앱을 한 번 실행하고 응답을 모아 API Gateway 응답으로 변환"""
+    response_done = asyncio.Event()
+    request_sent = False
+    status_code = 500
+    raw_headers: list[tuple[bytes, bytes]] = []
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # 응답을 다 보내기 전에 연결 종료를 알리면 스트리밍 응답이 취소되므로 대기
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: MutableMapping[str, Any]):
+        nonlocal status_code, raw_headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            raw_headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await asgi_app(scope, receive, send)
+    return _to_gateway_response(status_code, raw_headers, b"".join(chunks))
+
+
+def _to_gateway_response(
+    status_code: int, raw_headers: list[tuple[bytes, bytes]], body: bytes
+) -> dict[str, Any]:
+    headers: dict[str, str] = {}
+    cookies: list[str] = []
+    for raw_key, raw_value in raw_headers:
+        key = raw_key.decode("latin-1").lower()
+        value = raw_value.decode("latin-1")
+        if key == "set-cookie":
+            cookies.append(value)
+        elif key in headers:
+            headers[key] = f"{headers[key]},{value}"
+        else:
+            headers[key] = value
+
+    content_type = headers.get("content-type", "")
+    is_text = any(marker in content_type for marker in _TEXT_CONTENT_TYPES)
+    response: dict[str, Any] = {
+        "statusCode": status_code,
+        "headers": headers,
+        "body": body.decode("utf-8") if is_text else base64.b64encode(body).decode(),
+        "isBase64Encoded": not is_text,
+    }
+    if cookies:
+        response["cookies"] = cookies
+    return response
+
+
+def emit_invocation_metrics(cold_start: bool, init_duration_ms: float):
+    """
+    콜드 스타트 여부와 초기화 시간을 EMF 형식 로그로 기록
+
+    웜 호출에도 ColdStart=0을 남겨 콜드 스타트 비율을 계산할 수 있게 한다.
+
+    Args:
+        cold_start: 이번 호출이 컨테이너의 첫 호출인지 여부
+        init_duration_ms: 컨테이너 초기화에 걸린 시간 (콜드 스타트에서만 기록)
+    """
+    function_name = os.getenv("AWS_LAMBDA_FUNCTION_NAME", "local")
+    metric_definitions = [{"Name": "ColdStart", "Unit": "Count"}]
+    values: dict[str, Any] = {"ColdStart": int(cold_start)}
+    if cold_start:
+        metric_definitions.append({"Name": "InitDuration", "Unit": "Milliseconds"})
+        values["InitDuration"] = round(init_duration_ms, 1)
+
+    write_execution_log(
+        "METRIC",
+        "콜드 스타트" if cold_start else "웜 호출",
+        _aws={
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": os.getenv("LAMBDA_METRICS_NAMESPACE", DEFAULT_METRICS_NAMESPACE),
+                    "Dimensions": [["FunctionName"]],
+                    "Metrics": metric_definitions,
+                }
+            ],
+        },
+        FunctionName=function_name,
+        **values,
+    )
+
+
+def handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]:
+    """
+    Lambda 핸들러
+
+    Args:
+        event: API Gateway HTTP API 페이로드 2.0 이벤트
+        context: Lambda 컨텍스트 (사용하지 않음)
+
+    Returns:
+        API Gateway 응답
+    """
+    runtime = get_runtime()
+    cold_start = runtime.invocations == 0
+    runtime.invocations += 1
+    try:
+        emit_invocation_metrics(cold_start, runtime.init_duration_ms)
+        return runtime.invoke(event)
+    finally:
+        # 응답 직후 컨테이너가 멈출 수 있으므로 큐에 남은 로그를 먼저 내보냄
+        flush_logs()
+
+
+# Lambda 초기화 단계(모듈 import)에서 미리 준비해 첫 요청의 지연을 줄임
+if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+    get_runtime()
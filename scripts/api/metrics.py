@@ -0,0 +1,223 @@
+"""
+API 요청/Notion 호출 지표 수집기 (Prometheus 텍스트 형식 출력)
+
+기록 경로에는 락이 없다. 스레드마다 자기 전용 샤드(dict)에만 쓰고, /metrics
+조회 시에만 모든 샤드를 합산한다. 조회 시 dict 복사는 GIL 아래에서 원자적으로
+수행된다. 스레드가 끝나면 그 샤드를 종료된 스레드용 누적 샤드에 합치고 목록에서
+빼므로, 스레드가 계속 교체되어도(스레드 풀 크기 조정, Lambda 재초기화) 샤드 수는
+살아 있는 스레드 수 수준으로 유지된다.
+"""
+
+import bisect
+import threading
+import weakref
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+# 요청/호출 지연 히스토그램 버킷 경계(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = "work_logging"
+
+# (지표 이름, 타입, 설명)
+_METRICS = (
+    ("http_requests_total", "counter", "API 요청 수 (메서드/경로/상태 코드별)"),
+    (
+        "http_request_duration_seconds",
+        "histogram",
+        "API 요청 처리 시간 (메서드/경로별)",
+    ),
+    ("http_requests_in_flight", "gauge", "처리 중인 API 요청 수"),
+    ("notion_calls_total", "counter", "Notion API 호출 수 (엔드포인트/결과별)"),
+    (
+        "notion_call_duration_seconds",
+        "histogram",
+        "Notion API 호출 시간 (속도 제한 대기/재시도 포함, 엔드포인트별)",
+    ),
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class _Shard:
+    """한 스레드만 쓰는 지표 저장소"""
+
+    __slots__ = ("counters", "histograms", "gauges")
+
+    def __init__(self):
+        self.counters: dict[tuple[str, Labels], int] = {}
+        # 값: [버킷별 누적 전 개수..., 합계, 개수]
+        self.histograms: dict[tuple[str, Labels], list[float]] = {}
+        self.gauges: dict[tuple[str, Labels], int] = {}
+
+    def merge_into(self, target: "_Shard"):
+        """이 샤드의 값을 target에 더함"""
+        for key, value in list(self.counters.items()):
+            target.counters[key] = target.counters.get(key, 0) + value
+        for key, value in list(self.gauges.items()):
+            target.gauges[key] = target.gauges.get(key, 0) + value
+        for key, values in list(self.histograms.items()):
+            total = target.histograms.setdefault(key, [0.0] * len(values))
+            for idx, observed in enumerate(list(values)):
+                total[idx] += observed
+
+
+class _ThreadToken:
+    """스레드 로컬에만 보관해 스레드 종료 시점을 weakref로 감지하기 위한 객체"""
+
+
+class MetricsRegistry:
+    """스레드별 샤드에 지표를 기록하고 조회 시 합산하는 수집기"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: 히스토그램 버킷 경계(초, 오름차순)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        # 종료된 스레드의 샤드를 합쳐 둔 누적 샤드 (_lock 아래에서만 읽고 씀)
+        self._retired = _Shard()
+        # 종료됐지만 아직 누적 샤드에 합치지 않은 샤드 (deque.append는 원자적)
+        self._finished: deque[_Shard] = deque()
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            # 스레드가 끝나 스레드 로컬이 정리되면 토큰이 사라지면서 샤드를 누적 샤드로 합침
+            token = self._local.token = _ThreadToken()
+            # 종료 콜백은 GC 도중 아무 스레드에서나 불릴 수 있어 락 없이 큐에만 넣음
+            weakref.finalize(token, self._finished.append, shard)
+            with self._lock:
+                self._fold_finished()
+                self._shards.append(shard)
+        return shard
+
+    def _fold_finished(self):
+        """종료된 스레드의 샤드를 누적 샤드에 합치고 목록에서 제거 (_lock 보유 상태로 호출)"""
+        while self._finished:
+            shard = self._finished.popleft()
+            shard.merge_into(self._retired)
+            self._shards.remove(shard)
+
+    def inc(self, name: str, labels: Labels = (), value: int = 1):
+        """카운터 증가"""
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def add_gauge(self, name: str, labels: Labels = (), value: int = 1):
+        """게이지 증감 (스레드별 변화량을 조회 시 합산)"""
+        gauges = self._shard().gauges
+        key = (name, labels)
+        gauges[key] = gauges.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, labels: Labels = ()):
+        """히스토그램에 관측값 하나를 기록"""
+        histograms = self._shard().histograms
+        key = (name, labels)
+        values = histograms.get(key)
+        if values is None:
+            values = histograms[key] = [0.0] * (len(self.buckets) + 3)
+        # 마지막 두 칸은 합계와 개수, 그 앞 칸은 +Inf 버킷
+        values[bisect.bisect_left(self.buckets, seconds)] += 1
+        values[-2] += seconds
+        values[-1] += 1
+
+    def observe_request(self, method: str, route: str, status_code: int, seconds: float):
+        """
+        API 요청 한 건의 결과를 기록
+
+        Args:
+            method: HTTP 메서드
+            route: 경로 템플릿 (예: /jobs/{job_id})
+            status_code: 응답 상태 코드
+            seconds: 처리 시간(초)
+        """
+        labels = (("method", method), ("route", route))
+        self.inc("http_requests_total", labels + (("status", str(status_code)),))
+        self.observe("http_request_duration_seconds", seconds, labels)
+
+    def observe_notion(self, endpoint: str, seconds: float, ok: bool):
+        """
+        Notion API 호출 한 건의 결과를 기록 (NotionClientWrapper observer 훅)
+
+        Args:
+            endpoint: 호출한 엔드포인트 (예: pages.create)
+            seconds: 속도 제한 대기와 재시도를 포함한 호출 시간(초)
+            ok: 성공 여부
+        """
+        labels = (("endpoint", endpoint),)
+        outcome = (("outcome", "success" if ok else "error"),)
+        self.inc("notion_calls_total", labels + outcome)
+        self.observe("notion_call_duration_seconds", seconds, labels)
+
+    def snapshot(self) -> dict[str, dict[Labels, Any]]:
+        """모든 샤드를 합산한 지표 값"""
+        total = _Shard()
+        with self._lock:
+            self._fold_finished()
+            self._retired.merge_into(total)
+            for shard in self._shards:
+                shard.merge_into(total)
+
+        merged: dict[str, dict[Labels, Any]] = {}
+        for source in (total.counters, total.gauges, total.histograms):
+            for (name, labels), value in source.items():
+                merged.setdefault(name, {})[labels] = value
+        return merged
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 노출 형식(0.0.4)으로 변환
+
+        Returns:
+            /metrics 응답 본문
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name, metric_type, description in _METRICS:
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {description}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            series = snapshot.get(name, {})
+            if metric_type == "gauge" and not series:
+                series = {(): 0}
+            for labels in sorted(series):
+                value = series[labels]
+                if metric_type != "histogram":
+                    lines.append(f"{full_name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                cumulative = 0.0
+                bounds = [*(f"{bound:g}" for bound in self.buckets), "+Inf"]
+                for bound, count in zip(bounds, value[:-2], strict=True):
+                    cumulative += count
+                    bucket_labels = _format_labels(labels + (("le", bound),))
+                    lines.append(f"{full_name}_bucket{bucket_labels} {_format_value(cumulative)}")
+                label_text = _format_labels(labels)
+                lines.append(f"{full_name}_sum{label_text} {value[-2]:.6f}")
+                lines.append(f"{full_name}_count{label_text} {_format_value(value[-1])}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """정수 값은 지수 표기 없이 그대로 출력"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+# API 프로세스 전체에서 공유하는 수집기
+registry = MetricsRegistry()
@@ -0,0 +1,373 @@
+"""
+일일 로그 비동기 저장을 위한 SQLite 기반 아웃박스(write-behind 큐)
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import closing
+from typing import Any
+
+from scripts.utils.rate_limiter import RATE_LIMITED_STATUS
+
+# 작업 상태 값
+STATUS_QUEUED = "queued"
+STATUS_PROCESSING = "processing"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_POLL_INTERVAL = 1.0
+# 재시도 대기 상한(초)
+MAX_RETRY_DELAY = 300.0
+# 작업 임대 기간(초). 처리 중에는 이 기간의 1/3마다 갱신하며, 만료된 작업만 다른 워커가 가져감
+DEFAULT_LEASE_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    page_id TEXT,
+    url TEXT,
+    error TEXT,
+    claimed_by TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_available
+    ON jobs (status, available_at);
+"""
+
+# 임대 컬럼이 없던 이전 버전 파일에 추가할 컬럼
+_LEASE_COLUMNS = {"claimed_by": "TEXT", "lease_expires_at": "REAL"}
+
+
+def new_worker_id() -> str:
+    """프로세스와 워커를 구분하는 임대 소유자 ID (호스트:PID:난수)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def is_pre_write_error(exc: Exception) -> bool:
+    """
+    Notion에 아무것도 반영되지 않았음이 보장되는 오류인지 판단
+
+    429 응답과 연결 수립 실패만 해당한다. 그 밖의 오류는 페이지 생성이나 블록 추가가
+    이미 반영됐을 수 있어 다시 시도하면 같은 로그가 중복 저장될 수 있다.
+
+    Args:
+        exc: 처리 함수가 발생시킨 예외
+
+    Returns:
+        재시도해도 안전하면 True
+    """
+    if getattr(exc, "status", None) == RATE_LIMITED_STATUS:
+        return True
+
+    import httpx
+
+    return isinstance(exc, httpx.ConnectError | httpx.ConnectTimeout)
+
+
+class OutboxStore:
+    """요청 본문을 디스크에 먼저 기록해 두는 영속 작업 큐"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:'는 연결마다 초기화되므로 사용 불가)
+        """
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, column_type in _LEASE_COLUMNS.items():
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드마다 별도 연결을 사용 (연결 생성 비용은 파일 open 수준)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, payload: dict[str, Any]) -> str:
+        """
+        작업을 큐에 추가
+
+        Args:
+            payload: 일일 로그 요청 본문
+
+        Returns:
+            발급된 작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, payload, status, available_at, created_at,"
+                " updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    json.dumps(payload, ensure_ascii=False),
+                    STATUS_QUEUED,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+        return job_id
+
+    def claim_next(
+        self, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> tuple[str, dict[str, Any], int] | None:
+        """
+        처리 가능한 가장 오래된 작업 하나를 임대해 processing 상태로 가져옴
+
+        대기 중인 작업과, 처리하던 워커가 임대를 갱신하지 못해 만료된 작업이 대상이다.
+        다른 워커가 임대를 유지하고 있는 작업은 가져오지 않는다.
+
+        Args:
+            owner: 임대 소유자 ID (new_worker_id 결과)
+            lease_seconds: 임대 기간(초)
+
+        Returns:
+            (작업 ID, 요청 본문, 지금까지 시도 횟수) 또는 처리할 작업이 없으면 None
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, payload, attempts FROM jobs"
+                " WHERE (status = ? AND available_at <= ?)"
+                " OR (status = ? AND COALESCE(lease_expires_at, 0) <= ?)"
+                " ORDER BY created_at LIMIT 1",
+                (STATUS_QUEUED, now, STATUS_PROCESSING, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, claimed_by = ?, lease_expires_at = ?,"
+                " updated_at = ? WHERE id = ?",
+                (STATUS_PROCESSING, owner, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        return row["id"], json.loads(row["payload"]), row["attempts"]
+
+    def renew_lease(self, job_id: str, owner: str, lease_seconds: float) -> bool:
+        """
+        처리 중인 작업의 임대 기간을 연장
+
+        Args:
+            job_id: 작업 ID
+            owner: 임대 소유자 ID
+            lease_seconds: 지금부터 연장할 임대 기간(초)
+
+        Returns:
+            아직 이 소유자가 임대 중이라 연장했으면 True
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ?"
+                " WHERE id = ? AND status = ? AND claimed_by = ?",
+                (now + lease_seconds, now, job_id, STATUS_PROCESSING, owner),
+            )
+            return cursor.rowcount == 1
+
+    def mark_succeeded(self, job_id: str, page_id: str, url: str):
+        """작업을 성공 상태로 기록"""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, page_id = ?,"
+                " url = ?, error = NULL, claimed_by = NULL, lease_expires_at = NULL,"
+                " updated_at = ? WHERE id = ?",
+                (STATUS_SUCCEEDED, page_id, url, time.time(), job_id),
+            )
+
+    def mark_failed(self, job_id: str, error: str, retry_delay: float | None):
+        """
+        작업 실패를 기록
+
+        Args:
+            job_id: 작업 ID
+            error: 실패 사유
+            retry_delay: 재시도까지 대기할 초 (None이면 최종 실패 처리)
+        """
+        now = time.time()
+        if retry_delay is None:
+            status_value, available_at = STATUS_FAILED, now
+        else:
+            status_value, available_at = STATUS_QUEUED, now + retry_delay
+
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, error = ?,"
+                " available_at = ?, claimed_by = NULL, lease_expires_at = NULL,"
+                " updated_at = ? WHERE id = ?",
+                (status_value, error, available_at, now, job_id),
+            )
+
+    def requeue_stale(self) -> int:
+        """
+        임대가 만료된 processing 작업을 다시 큐에 넣음
+
+        처리하던 워커가 비정상 종료해 임대를 갱신하지 못한 작업만 되돌린다. 다른 프로세스가
+        아직 처리 중인(임대를 유지하는) 작업은 건드리지 않는다.
+
+        Returns:
+            되돌린 작업 수
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, claimed_by = NULL,"
+                " lease_expires_at = NULL, updated_at = ?"
+                " WHERE status = ? AND COALESCE(lease_expires_at, 0) <= ?",
+                (STATUS_QUEUED, now, now, STATUS_PROCESSING, now),
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """작업 상태를 조회 (요청 본문 제외)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, status, attempts, page_id, url, error, created_at,"
+                " updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def count(self, status_value: str) -> int:
+        """특정 상태의 작업 수"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (status_value,)
+            ).fetchone()
+        return row[0]
+
+
+class OutboxWorker:
+    """아웃박스 작업을 백그라운드 스레드에서 하나씩 꺼내 처리하는 워커"""
+
+    def __init__(
+        self,
+        store: OutboxStore,
+        handler: Callable[[dict[str, Any]], tuple[str, str]],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        on_error: Callable[[str, Exception], None] | None = None,
+        retryable: Callable[[Exception], bool] = is_pre_write_error,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
+        """
+        Args:
+            store: 작업 저장소
+            handler: 요청 본문을 받아 (page_id, url)을 반환하는 처리 함수
+            max_attempts: 최종 실패로 처리하기 전까지의 최대 시도 횟수
+            poll_interval: 큐가 비었을 때 다시 확인하기까지 대기할 초
+            on_error: 작업 실패 시 호출할 콜백 (작업 ID, 예외)
+            retryable: 실패한 작업을 다시 시도해도 되는지 판단하는 함수
+                (기본값은 쓰기 전에 실패한 경우만 허용)
+            lease_seconds: 작업 임대 기간(초). 처리 중에는 1/3 주기로 갱신
+        """
+        self.store = store
+        self.handler = handler
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+        self.retryable = retryable
+        self.lease_seconds = lease_seconds
+        self.worker_id = new_worker_id()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        """워커 스레드를 시작 (이미 실행 중이면 무시)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0):
+        """진행 중인 작업을 마친 뒤 워커를 종료"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def notify(self):
+        """새 작업이 들어왔음을 알려 대기 중인 워커를 즉시 깨움"""
+        self._wakeup.set()
+
+    def run_once(self) -> bool:
+        """
+        작업 하나를 처리
+
+        Returns:
+            처리한 작업이 있으면 True
+        """
+        claimed = self.store.claim_next(self.worker_id, self.lease_seconds)
+        if claimed is None:
+            return False
+
+        job_id, payload, attempts = claimed
+        done = threading.Event()
+        renewer = threading.Thread(
+            target=self._keep_lease, args=(job_id, done), name="outbox-lease", daemon=True
+        )
+        renewer.start()
+        try:
+            page_id, url = self.handler(payload)
+        except Exception as exc:  # pylint: disable=broad-except
+            attempt = attempts + 1
+            # 쓰기가 일부 반영됐을 수 있는 오류는 중복 저장을 막기 위해 바로 실패 처리
+            retry_delay = (
+                min(MAX_RETRY_DELAY, 2.0**attempt)
+                if attempt < self.max_attempts and self.retryable(exc)
+                else None
+            )
+            self.store.mark_failed(job_id, str(exc), retry_delay)
+            if self.on_error:
+                self.on_error(job_id, exc)
+        else:
+            self.store.mark_succeeded(job_id, page_id, url)
+        finally:
+            done.set()
+            renewer.join()
+        return True
+
+    def _keep_lease(self, job_id: str, done: threading.Event):
+        # 처리 함수가 끝날 때까지 임대를 갱신해 다른 워커가 같은 작업을 가져가지 않게 함
+        while not done.wait(self.lease_seconds / 3):
+            try:
+                self.store.renew_lease(job_id, self.worker_id, self.lease_seconds)
+            except sqlite3.Error as exc:
+                if self.on_error:
+                    self.on_error(job_id, exc)
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            # 큐를 비우기 전에 지워야 처리 도중 들어온 notify가 사라지지 않음
+            self._wakeup.clear()
+            try:
+                while not self._stopping.is_set() and self.run_once():
+                    pass
+            except sqlite3.Error as exc:
+                # DB 잠금 등 일시적 오류는 다음 주기에 다시 시도
+                if self.on_error:
+                    self.on_error("-", exc)
+            self._wakeup.wait(self.poll_interval)
@@ -15,8 +15,34 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from scripts.utils.logging_setup import execution_logger, request_context
 from scripts.utils.notion_client import NotionClientWrapper
 
+# 입력 선택지 (합성 코퍼스 생성기 benchmarks/corpus.py도 같은 값을 사용)
+CATEGORIES = ("성능개선", "신규기능", "버그픽스", "장애대응", "리팩토링", "기타")
+IMPACT_LEVELS = ("High", "Medium", "Low")
+STATUS_OPTIONS = ("Logged", "In Review", "Published")
+COMMON_TECH_STACK = (
+    "Python",
+    "JavaScript",
+    "TypeScript",
+    "React",
+    "Vue.js",
+    "Node.js",
+    "Django",
+    "FastAPI",
+    "PostgreSQL",
+    "MySQL",
+    "Redis",
+    "MongoDB",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "GCP",
+    "Git",
+    "기타",
+)
+
 
 class Colors:
     """터미널 출력을 위한 ANSI 색상 코드"""
@@ -216,21 +242,7 @@ def get_multi_select_input(prompt: str, options: list[str]) -> list[str]:
             print_error("올바른 형식으로 입력해주세요 (예: 1,3,5).")
 
 
-def write_execution_log(status: str, message: str):
-    """
-    스크립트 실행 결과를 로그 파일로 남김
-
-    Args:
-        status: SUCCESS, ERROR 등 상태 문자열
-        message: 상태에 대한 상세 메시지
-    """
-    logs_dir = os.path.join(os.path.dirname(__file__), "..", "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    log_path = os.path.join(logs_dir, "execution.log")
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_path, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[{timestamp}] [{status}] daily_logger - {message}\n")
+write_execution_log = execution_logger("daily_logger")
 
 
 def main():
@@ -254,41 +266,16 @@ def main():
 
     logged_date = get_date_input("🗓️ 기록 날짜 (YYYY-MM-DD)")
 
-    categories = ["성능개선", "신규기능", "버그픽스", "장애대응", "리팩토링", "기타"]
-    category = get_select_input("📂 카테고리", categories)
-
-    impact_levels = ["High", "Medium", "Low"]
-    impact_level = get_select_input("⭐ 영향도", impact_levels)
-
-    status_options = ["Logged", "In Review", "Published"]
-    status = get_select_input("📌 상태", status_options, default="Logged")
-
-    common_tech_stack = [
-        "Python",
-        "JavaScript",
-        "TypeScript",
-        "React",
-        "Vue.js",
-        "Node.js",
-        "Django",
-        "FastAPI",
-        "PostgreSQL",
-        "MySQL",
-        "Redis",
-        "MongoDB",
-        "Docker",
-        "Kubernetes",
-        "AWS",
-        "GCP",
-        "Git",
-        "기타",
-    ]
+    category = get_select_input("📂 카테고리", list(CATEGORIES))
+
+    impact_level = get_select_input("⭐ 영향도", list(IMPACT_LEVELS))
+
+    status = get_select_input("📌 상태", list(STATUS_OPTIONS), default="Logged")
+
     print_info("자주 사용하는 기술 스택:")
-    tech_stack_selections = get_multi_select_input("🛠️ 기술 스택", common_tech_stack)
+    tech_stack_selections = get_multi_select_input("🛠️ 기술 스택", list(COMMON_TECH_STACK))
 
-    custom_tech = get_input(
-        "🛠️ 추가 기술 스택 (쉼표로 구분, 없으면 Enter)", required=False
-    )
+    custom_tech = get_input("🛠️ 추가 기술 스택 (쉼표로 구분, 없으면 Enter)", required=False)
     if custom_tech:
         tech_stack = tech_stack_selections + [t.strip() for t in custom_tech.split(",")]
     else:
@@ -348,13 +335,15 @@ def main():
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print(f"\n\n{Colors.WARNING}작업이 취소되었습니다.{Colors.ENDC}")
-        write_execution_log("CANCELLED", "사용자가 Ctrl+C로 종료함")
-        sys.exit(0)
-    except Exception as e:
-        print_error(f"예상치 못한 오류 발생: {str(e)}")
-        write_execution_log("ERROR", f"예상치 못한 오류: {str(e)}")
-        sys.exit(1)
+    # 한 번의 실행에서 남긴 로그를 같은 요청 ID로 묶음
+    with request_context():
+        try:
+            main()
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.WARNING}작업이 취소되었습니다.{Colors.ENDC}")
+            write_execution_log("CANCELLED", "사용자가 Ctrl+C로 종료함")
+            sys.exit(0)
+        except Exception as e:
+            print_error(f"예상치 못한 오류 발생: {str(e)}")
+            write_execution_log("ERROR", f"예상치 못한 오류: {str(e)}")
+            sys.exit(1)
@@ -7,29 +7,27 @@ import argparse
 import calendar
 import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from scripts.utils.llm_client import BaseLLMClient, LLMClientFactory
-from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.llm_client import (
+    MONTHLY_SECTION_HEADINGS,
+    BaseLLMClient,
+    LLMClientFactory,
+    StreamCollector,
+)
+from scripts.utils.logging_setup import execution_logger, request_context
+from scripts.utils.notion_client import NotionClientWrapper, raise_for_content_errors
 
+# 범위 모드에서 동시에 요약할 월 수 기본값
+DEFAULT_RANGE_WORKERS = 3
 
-def write_execution_log(status: str, message: str):
-    """
-    스크립트 실행 결과를 로그 파일에 남김
 
-    Args:
-        status: SUCCESS, ERROR 등 상태 문자열
-        message: 상태에 대한 상세 설명
-    """
-    logs_dir = os.path.join(os.path.dirname(__file__), "..", "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    log_path = os.path.join(logs_dir, "execution.log")
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_path, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[{timestamp}] [{status}] monthly_processor - {message}\n")
+write_execution_log = execution_logger("monthly_processor")
 
 
 def parse_args() -> argparse.Namespace:
@@ -53,12 +51,36 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="직접 종료일을 지정하고 싶을 때 사용 (YYYY-MM-DD).",
     )
+    parser.add_argument(
+        "--range",
+        dest="month_range",
+        nargs=2,
+        metavar=("FROM", "TO"),
+        help="FROM~TO(YYYY-MM) 여러 달을 주간 성과 한 번 조회로 처리.",
+    )
+    parser.add_argument(
+        "--yearly",
+        action="store_true",
+        help="--range 결과로 연간 요약을 콘솔에 출력 (Notion 저장 안 함, 실패한 월이 있으면 생략).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"--range 시 동시에 요약할 월 수 (기본값 {DEFAULT_RANGE_WORKERS}).",
+    )
     parser.add_argument(
         "--dry-run",
         dest="dry_run",
         action="store_true",
         help="Notion에 저장하지 않고 콘솔에 결과만 출력.",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="LLM 응답 캐시를 사용하지 않고 항상 새로 생성.",
+    )
     return parser.parse_args()
 
 
@@ -96,6 +118,67 @@ def resolve_period(
     )
 
 
+def resolve_month_range(from_str: str, to_str: str) -> tuple[datetime, datetime]:
+    """
+    YYYY-MM 형식의 시작/종료 월을 집계 기간으로 변환
+
+    Args:
+        from_str: 시작 월 (YYYY-MM)
+        to_str: 종료 월 (YYYY-MM, 포함)
+
+    Returns:
+        (시작 월 1일, 종료 월 말일) 튜플
+    """
+    start = datetime.strptime(from_str, "%Y-%m")
+    end_month = datetime.strptime(to_str, "%Y-%m")
+    if start > end_month:
+        raise ValueError("시작 월은 종료 월보다 이후일 수 없습니다.")
+
+    _, last_day = calendar.monthrange(end_month.year, end_month.month)
+    return start, end_month.replace(day=last_day)
+
+
+def split_months(
+    start_date: datetime, end_date: datetime
+) -> list[tuple[int, int, datetime, datetime]]:
+    """
+    기간을 달력 월 단위로 분할
+
+    Args:
+        start_date: 시작 시각
+        end_date: 종료 시각
+
+    Returns:
+        (연도, 월, 월 시작일, 월 말일) 튜플 리스트
+    """
+    months = []
+    year, month = start_date.year, start_date.month
+    while (year, month) <= (end_date.year, end_date.month):
+        _, last_day = calendar.monthrange(year, month)
+        months.append((year, month, datetime(year, month, 1), datetime(year, month, last_day)))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _period_start(week: dict) -> date | None:
+    """주간 성과 페이지의 Period Start를 date로 변환"""
+    props = week.get("properties", {})
+    start = (props.get("Period Start", {}).get("date") or {}).get("start")
+    if not start:
+        return None
+    return date.fromisoformat(start[:10])
+
+
+def _year_month(page: dict) -> tuple[int, int] | None:
+    """월간 하이라이트 페이지의 Year-Month를 (연도, 월)로 변환"""
+    props = page.get("properties", {})
+    start = (props.get("Year-Month", {}).get("date") or {}).get("start")
+    if not start:
+        return None
+    value = date.fromisoformat(start[:10])
+    return value.year, value.month
+
+
 class MonthlyProcessor:
     """월간 자동 요약 및 저장을 담당하는 클래스"""
 
@@ -117,6 +200,25 @@ class MonthlyProcessor:
         """LLM API로 월간 요약을 생성"""
         return self.llm.generate_monthly_summary(weekly_data)
 
+    def stream_summary(self, weekly_data: list[dict]) -> dict:
+        """요약을 스트리밍으로 받으며 콘솔에 바로 출력 (dry-run용)"""
+        collector = StreamCollector(
+            MONTHLY_SECTION_HEADINGS,
+            on_delta=lambda delta: print(delta, end="", flush=True),
+        )
+        content = collector.consume(self.llm.stream_monthly_summary(weekly_data))
+        print()
+
+        summary = self.llm.parse_monthly_response(content)
+        write_execution_log(
+            "INFO",
+            f"LLM 스트리밍 완료: 첫 토큰 {collector.ttft or 0:.2f}s, "
+            f"전체 {collector.elapsed or 0:.2f}s",
+            duration_ms=(collector.elapsed or 0) * 1000,
+            ttft_ms=round((collector.ttft or 0) * 1000, 1),
+        )
+        return summary
+
     def build_stats_text(
         self, weekly_data: list[dict], start_date: datetime, end_date: datetime
     ) -> str:
@@ -166,6 +268,7 @@ class MonthlyProcessor:
         dry_run: bool = False,
     ) -> dict | None:
         """월간 요약 전체 흐름 실행"""
+        started = time.perf_counter()
         write_execution_log(
             "INFO", f"월간 처리 시작: {start_date.date()} ~ {end_date.date()}"
         )
@@ -174,25 +277,217 @@ class MonthlyProcessor:
         if not weekly_data:
             write_execution_log("INFO", "집계 기간에 해당하는 주간 성과가 없습니다.")
             return None
+        raise_for_content_errors(weekly_data)
+
+        if dry_run:
+            # 응답을 기다리는 동안 빈 화면이 되지 않도록 받는 대로 출력
+            write_execution_log("INFO", "Dry-run 모드로 실행됨. Notion 저장을 건너뜁니다.")
+            summary = self.stream_summary(weekly_data)
+            print("\n## 통계 요약")
+            print(self.build_stats_text(weekly_data, start_date, end_date))
+            return summary
 
         summary = self.summarize_weeks(weekly_data)
         stats_text = self.build_stats_text(weekly_data, start_date, end_date)
+        page = self.save_monthly_summary(year, month, summary, weekly_data, stats_text)
+        write_execution_log(
+            "SUCCESS",
+            f"월간 하이라이트 저장 완료: {page.get('id')}",
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+        return page
 
-        if dry_run:
+    def find_existing_months(
+        self, start_date: datetime, end_date: datetime
+    ) -> dict[tuple[int, int], dict]:
+        """
+        기간 안에 이미 월간 하이라이트 페이지가 있는 월을 조회
+
+        Args:
+            start_date: 시작 시각
+            end_date: 종료 시각
+
+        Returns:
+            {(연도, 월): 월간 하이라이트 페이지}
+        """
+        existing: dict[tuple[int, int], dict] = {}
+        for page in self.notion.iter_monthly_highlights(start_date, end_date):
+            key = _year_month(page)
+            if key:
+                existing.setdefault(key, page)
+        return existing
+
+    def _yearly_inputs(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        월별 결과를 연간 요약 입력으로 변환
+
+        이번 실행에서 요약한 월은 요약 결과를, 건너뛴 월은 저장된 페이지 본문을 사용한다.
+
+        Args:
+            results: run_range의 월별 결과 리스트
+
+        Returns:
+            year, month, summary, career_brief 키를 가진 리스트 (월 순서)
+        """
+        skipped = [result for result in results if result["status"] == "skipped"]
+        stored_content: dict[tuple[int, int], str] = {}
+        if skipped:
+            stored = self.notion.attach_content([result["page"] for result in skipped])
+            raise_for_content_errors(stored)
+            stored_content = {
+                (result["year"], result["month"]): page["content"]
+                for result, page in zip(skipped, stored, strict=True)
+            }
+
+        inputs = []
+        for result in results:
+            key = (result["year"], result["month"])
+            if "summary" in result:
+                summary = result["summary"].get("summary", "")
+                career_brief = result["summary"].get("career_brief", "")
+            elif key in stored_content:
+                # 저장된 본문에는 종합 성과와 경력기술서용 요약이 함께 들어 있음
+                summary, career_brief = stored_content[key], ""
+            else:
+                continue
+            inputs.append(
+                {
+                    "year": result["year"],
+                    "month": result["month"],
+                    "summary": summary,
+                    "career_brief": career_brief,
+                }
+            )
+        return inputs
+
+    def run_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        dry_run: bool = False,
+        max_workers: int | None = None,
+        yearly: bool = False,
+    ) -> dict:
+        """
+        여러 달을 한 번에 처리하고 선택적으로 연간 요약을 생성
+
+        주간 성과는 전체 기간의 속성만 한 번 조회해 Period Start 기준으로 월별로
+        나누고, 월간 하이라이트가 없는 월의 주간 성과만 본문을 채워 병렬로 생성한다.
+        연간 요약은 이번 실행에서 만든 월간 결과와 이미 저장된 월간 하이라이트 본문으로
+        생성하므로 주간 성과를 다시 읽지 않으며, 콘솔에만 출력하고 Notion에는 저장하지
+        않는다. 실패한 월이 있으면 일부 월이 빠진 연간 요약이 되므로 생성하지 않는다.
+
+        Args:
+            start_date: 시작 시각
+            end_date: 종료 시각
+            dry_run: Notion 저장 생략 여부
+            max_workers: 동시에 요약할 월 수
+            yearly: 연간 요약 생성 여부
+
+        Returns:
+            months(월별 결과 리스트)와 yearly(연간 요약 또는 None) 키를 가진 dict.
+            월별 결과의 status는 created/dry_run/skipped/empty/failed 중 하나이며,
+            실패한 월이 있으면 yearly는 None
+        """
+        months = split_months(start_date, end_date)
+        write_execution_log(
+            "INFO",
+            f"월간 범위 처리 시작: {start_date.date()} ~ {end_date.date()} ({len(months)}개월)",
+        )
+
+        existing = self.find_existing_months(start_date, end_date)
+
+        # 속성만 한 번에 조회해 월별로 나눈 뒤, 생성할 월의 주간 성과만 본문을 채움
+        weeks_by_month: dict[tuple[int, int], list[dict]] = {}
+        for week in self.notion.iter_weekly_achievements(start_date, end_date):
+            period_start = _period_start(week)
+            if period_start:
+                key = (period_start.year, period_start.month)
+                weeks_by_month.setdefault(key, []).append(week)
+
+        results: list[dict[str, Any]] = []
+        for year, month, month_start, month_end in months:
+            weeks = weeks_by_month.get((year, month), [])
+            result: dict[str, Any] = {
+                "year": year,
+                "month": month,
+                "status": "pending" if weeks else "empty",
+                "weeks": weeks,
+                "period": (month_start, month_end),
+            }
+            if (year, month) in existing:
+                result.update(status="skipped", page=existing[(year, month)])
+            results.append(result)
+
+        pending = [result for result in results if result["status"] == "pending"]
+        if pending:
+            enriched = iter(
+                self.notion.attach_content([week for result in pending for week in result["weeks"]])
+            )
+            for result in pending:
+                result["weeks"] = [next(enriched) for _ in result["weeks"]]
+
+        def process_month(result: dict[str, Any]):
+            weeks = result["weeks"]
+            try:
+                # 본문이 빠진 달은 불완전한 요약이 저장되지 않도록 실패 처리
+                raise_for_content_errors(weeks)
+                summary = self.summarize_weeks(weeks)
+                stats_text = self.build_stats_text(weeks, *result["period"])
+                result.update(summary=summary, stats_text=stats_text)
+                if dry_run:
+                    result["status"] = "dry_run"
+                    return
+                result["page"] = self.save_monthly_summary(
+                    result["year"], result["month"], summary, weeks, stats_text
+                )
+                result["status"] = "created"
+            except Exception as error:  # pylint: disable=broad-except
+                result.update(status="failed", error=str(error))
+
+        if pending:
+            workers = max(1, min(max_workers or DEFAULT_RANGE_WORKERS, len(pending)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="monthly-range"
+            ) as executor:
+                for future in [executor.submit(process_month, r) for r in pending]:
+                    future.result()
+
+        for result in results:
+            label = f"{result['year']}년 {result['month']:02d}월"
+            if result["status"] == "failed":
+                write_execution_log("ERROR", f"{label} 처리 실패: {result['error']}")
+            elif result["status"] == "created":
+                write_execution_log(
+                    "SUCCESS",
+                    f"{label} 월간 하이라이트 저장 완료: {result['page'].get('id')}",
+                )
+            elif result["status"] == "dry_run":
+                print(f"# {label}")
+                print("## 월간 종합 성과")
+                print(result["summary"].get("summary", ""))
+                print("\n## 경력기술서용 요약")
+                print(result["summary"].get("career_brief", ""))
+                print()
+
+        yearly_summary = None
+        failed = [f"{r['year']}-{r['month']:02d}" for r in results if r["status"] == "failed"]
+        if yearly and failed:
             write_execution_log(
-                "INFO", "Dry-run 모드로 실행됨. Notion 저장을 건너뜁니다."
+                "ERROR", f"실패한 월이 있어 연간 요약을 생성하지 않음: {', '.join(failed)}"
             )
-            print("## 월간 종합 성과")
-            print(summary.get("summary", ""))
+            print(f"실패한 월({', '.join(failed)})이 있어 연간 요약을 생성하지 않았습니다.")
+        monthly_inputs = self._yearly_inputs(results) if yearly and not failed else []
+        if monthly_inputs:
+            yearly_summary = self.llm.generate_yearly_summary(monthly_inputs)
+            write_execution_log("INFO", f"연간 요약 생성 완료 ({len(monthly_inputs)}개월 기준)")
+            print("# 연간 요약")
+            print("## 연간 종합 성과")
+            print(yearly_summary.get("summary", ""))
             print("\n## 경력기술서용 요약")
-            print(summary.get("career_brief", ""))
-            print("\n## 통계 요약")
-            print(stats_text)
-            return summary
+            print(yearly_summary.get("career_brief", ""))
 
-        page = self.save_monthly_summary(year, month, summary, weekly_data, stats_text)
-        write_execution_log("SUCCESS", f"월간 하이라이트 저장 완료: {page.get('id')}")
-        return page
+        return {"months": results, "yearly": yearly_summary}
 
 
 def main():
@@ -200,23 +495,42 @@ def main():
     args = parse_args()
 
     try:
-        start_date, end_date, year, month = resolve_period(
-            args.start_date, args.end_date, args.year, args.month
-        )
+        if args.yearly and not args.month_range:
+            raise ValueError("--yearly는 --range와 함께 사용해야 합니다.")
+        if args.month_range:
+            start_date, end_date = resolve_month_range(*args.month_range)
+            year, month = start_date.year, start_date.month
+        else:
+            start_date, end_date, year, month = resolve_period(
+                args.start_date, args.end_date, args.year, args.month
+            )
     except ValueError as error:
         write_execution_log("ERROR", f"기간 해석 실패: {error}")
         print(f"기간 설정 오류: {error}")
         sys.exit(1)
 
     try:
-        processor = MonthlyProcessor()
-        processor.run(
-            start_date=start_date,
-            end_date=end_date,
-            year=year,
-            month=month,
-            dry_run=args.dry_run,
+        processor = MonthlyProcessor(
+            llm_client=LLMClientFactory.create_client(use_cache=not args.no_cache)
         )
+        if args.month_range:
+            outcome = processor.run_range(
+                start_date=start_date,
+                end_date=end_date,
+                dry_run=args.dry_run,
+                max_workers=args.workers,
+                yearly=args.yearly,
+            )
+            if any(result["status"] == "failed" for result in outcome["months"]):
+                sys.exit(1)
+        else:
+            processor.run(
+                start_date=start_date,
+                end_date=end_date,
+                year=year,
+                month=month,
+                dry_run=args.dry_run,
+            )
     except KeyboardInterrupt:
         write_execution_log("CANCELLED", "사용자가 Ctrl+C로 종료함")
         print("사용자에 의해 중단되었습니다.")
@@ -228,4 +542,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # 한 번의 실행에서 남긴 로그를 같은 요청 ID로 묶음
+    with request_context():
+        main()
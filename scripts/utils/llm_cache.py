@@ -0,0 +1,170 @@
+"""
+프롬프트 지문(fingerprint)을 키로 LLM 응답을 보관하는 SQLite 캐시
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+DEFAULT_CACHE_PATH = os.path.join("data", "llm_cache.sqlite3")
+# 기본 보관 기간 7일
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+"""
+
+
+def fingerprint(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int | None = None,
+) -> str:
+    """
+    응답을 결정하는 입력값을 묶어 SHA-256 지문을 생성
+
+    Args:
+        provider: LLM 제공자 이름
+        model: 모델 이름
+        system_prompt: 시스템 프롬프트
+        user_prompt: 사용자 프롬프트
+        max_tokens: 최대 출력 토큰 수 (출력이 잘리는 길이가 달라지므로 포함)
+
+    Returns:
+        16진수 해시 문자열
+    """
+    material = json.dumps(
+        [provider, model, max_tokens, system_prompt, user_prompt],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def is_cache_bypassed() -> bool:
+    """LLM_CACHE_BYPASS 환경 변수로 캐시를 끈 상태인지 확인"""
+    return os.getenv("LLM_CACHE_BYPASS", "").lower() in {"1", "true", "yes"}
+
+
+class LLMResponseCache:
+    """TTL과 최대 항목 수(LRU 제거)를 가진 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_seconds: 응답 보관 기간(초), 0 이하면 만료 없음
+            max_entries: 보관할 최대 응답 수, 초과 시 오래 사용되지 않은 순으로 제거
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache | None":
+        """
+        LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES 환경 변수로 생성
+
+        Returns:
+            캐시 인스턴스 (LLM_CACHE_BYPASS가 설정되어 있으면 None)
+        """
+        if is_cache_bypassed():
+            return None
+
+        path = os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return cls(
+            path,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> str | None:
+        """
+        캐시된 응답을 조회 (만료된 항목은 삭제 후 None)
+
+        Args:
+            key: fingerprint()로 만든 키
+
+        Returns:
+            응답 본문 또는 None
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if self._is_expired(created_at, now):
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return response
+
+    def put(self, key: str, provider: str, model: str, response: str):
+        """
+        응답을 저장하고 만료/초과 항목을 정리
+
+        Args:
+            key: fingerprint()로 만든 키
+            provider: LLM 제공자 이름
+            model: 모델 이름
+            response: 응답 본문
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, model, response,"
+                " created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, model, response, now, now),
+            )
+            if self.ttl_seconds > 0:
+                conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+            conn.execute(
+                "DELETE FROM responses WHERE key NOT IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        """모든 캐시 항목을 삭제"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -3,17 +3,132 @@ LLM 클라이언트 추상 기본 클래스 및 Factory 패턴 구현
 """
 
 import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-from dotenv import load_dotenv
+from .llm_cache import LLMResponseCache, fingerprint
+from .settings import get_settings
+from .token_budget import (
+    estimate_tokens,
+    get_input_token_budget,
+    split_by_budget,
+    truncate_to_budget,
+)
 
-load_dotenv()
+# 입력이 예산을 넘어 나눠 요약할 때 동시에 보낼 요청 수 기본값
+DEFAULT_MAX_CONCURRENCY = 3
+
+# 스트리밍 중 섹션 전환을 감지할 때 사용하는 응답 헤딩
+WEEKLY_SECTION_HEADINGS = ("## 주간 성과 요약", "## 핵심 하이라이트")
+MONTHLY_SECTION_HEADINGS = ("## 월간 종합 성과", "## 경력기술서용 요약")
 
 
 class BaseLLMClient(ABC):
     """모든 LLM 클라이언트가 상속해야 하는 추상 기본 클래스"""
 
+    # 캐시 키와 로그에 사용할 제공자 이름
+    provider_name = "base"
+    # 응답 캐시 (LLMClientFactory가 주입, None이면 항상 API 호출)
+    cache: LLMResponseCache | None = None
+    # 요청당 입력 토큰 예산 (None이면 LLM_INPUT_TOKEN_BUDGET 환경 변수 사용)
+    input_token_budget: int | None = None
+
+    @property
+    def model_name(self) -> str:
+        """캐시 키에 사용할 모델 이름"""
+        return str(getattr(self, "model", ""))
+
     @abstractmethod
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        제공자 API를 호출해 응답 본문을 반환
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+
+        Returns:
+            모델이 생성한 텍스트
+        """
+        pass
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        제공자 스트리밍 API로 응답 텍스트 조각을 순서대로 반환
+
+        스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 조각으로 반환한다.
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+
+        Yields:
+            모델이 생성한 텍스트 조각
+        """
+        yield self._complete(system_prompt, user_prompt)
+
+    def _cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        return fingerprint(
+            self.provider_name,
+            self.model_name,
+            system_prompt,
+            user_prompt,
+            getattr(self, "max_tokens", None),
+        )
+
+    def _generate(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        캐시를 먼저 확인하고, 없으면 API를 호출해 결과를 캐시에 저장
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+
+        Returns:
+            모델이 생성한 텍스트
+        """
+        if self.cache is None:
+            return self._complete(system_prompt, user_prompt)
+
+        key = self._cache_key(system_prompt, user_prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        content = self._complete(system_prompt, user_prompt)
+        self.cache.put(key, self.provider_name, self.model_name, content)
+        return content
+
+    def _generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        _generate의 스트리밍 버전 (캐시 적중 시 저장된 응답을 한 조각으로 반환)
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+
+        Yields:
+            모델이 생성한 텍스트 조각
+        """
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(system_prompt, user_prompt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        deltas = []
+        for delta in self._stream(system_prompt, user_prompt):
+            deltas.append(delta)
+            yield delta
+
+        # 끝까지 받은 응답만 캐시에 저장 (중간에 끊긴 스트림은 저장하지 않음)
+        if self.cache is not None and key is not None:
+            self.cache.put(key, self.provider_name, self.model_name, "".join(deltas))
+
     def generate_weekly_summary(
         self, daily_logs: list[dict], system_prompt: str | None = None
     ) -> dict[str, str]:
@@ -27,9 +142,29 @@ class BaseLLMClient(ABC):
         Returns:
             bullet_points, key_highlights, raw_response를 포함한 딕셔너리
         """
-        pass
+        system_prompt, user_prompt = self._weekly_prompts(daily_logs, system_prompt)
+        content = self._generate(system_prompt, user_prompt)
+        return self.parse_weekly_response(content)
+
+    def stream_weekly_summary(
+        self, daily_logs: list[dict], system_prompt: str | None = None
+    ) -> Iterator[str]:
+        """
+        주간 성과 요약을 텍스트 조각 단위로 스트리밍
+
+        전체 텍스트를 이어 붙여 parse_weekly_response에 넘기면
+        generate_weekly_summary와 같은 결과를 얻는다.
+
+        Args:
+            daily_logs: 속성과 본문을 포함한 일일 로그 리스트
+            system_prompt: 커스텀 시스템 프롬프트 (선택)
+
+        Yields:
+            모델이 생성한 텍스트 조각
+        """
+        system_prompt, user_prompt = self._weekly_prompts(daily_logs, system_prompt)
+        yield from self._generate_stream(system_prompt, user_prompt)
 
-    @abstractmethod
     def generate_monthly_summary(
         self, weekly_achievements: list[dict], system_prompt: str | None = None
     ) -> dict[str, str]:
@@ -43,10 +178,198 @@ class BaseLLMClient(ABC):
         Returns:
             summary, career_brief, raw_response를 포함한 딕셔너리
         """
-        pass
+        system_prompt, user_prompt = self._monthly_prompts(weekly_achievements, system_prompt)
+        content = self._generate(system_prompt, user_prompt)
+        return self.parse_monthly_response(content)
+
+    def stream_monthly_summary(
+        self, weekly_achievements: list[dict], system_prompt: str | None = None
+    ) -> Iterator[str]:
+        """
+        월간 하이라이트를 텍스트 조각 단위로 스트리밍
+
+        Args:
+            weekly_achievements: 주간 성과 엔트리 리스트
+            system_prompt: 커스텀 시스템 프롬프트 (선택)
+
+        Yields:
+            모델이 생성한 텍스트 조각
+        """
+        system_prompt, user_prompt = self._monthly_prompts(weekly_achievements, system_prompt)
+        yield from self._generate_stream(system_prompt, user_prompt)
+
+    def generate_yearly_summary(
+        self, monthly_highlights: list[dict], system_prompt: str | None = None
+    ) -> dict[str, str]:
+        """
+        월간 하이라이트 묶음을 기반으로 연간 성과 요약을 생성
+
+        Args:
+            monthly_highlights: year, month, summary, career_brief 키를 가진 리스트
+            system_prompt: 커스텀 시스템 프롬프트 (선택)
+
+        Returns:
+            summary, career_brief, raw_response를 포함한 딕셔너리
+        """
+        from .prompts import YEARLY_SUMMARY_SYSTEM_PROMPT, YEARLY_SUMMARY_USER_TEMPLATE
+
+        if system_prompt is None:
+            system_prompt = YEARLY_SUMMARY_SYSTEM_PROMPT
+
+        user_prompt = self._plan_user_prompt(
+            system_prompt,
+            self._format_monthly_highlight_parts(monthly_highlights),
+            YEARLY_SUMMARY_USER_TEMPLATE,
+            "combined_months",
+        )
+        content = self._generate(system_prompt, user_prompt)
+        return self.parse_monthly_response(content, title="## 연간 종합 성과")
+
+    def _weekly_prompts(self, daily_logs: list[dict], system_prompt: str | None) -> tuple[str, str]:
+        """주간 요약의 (시스템 프롬프트, 최종 사용자 프롬프트)를 준비"""
+        from .prompts import WEEKLY_SUMMARY_SYSTEM_PROMPT, WEEKLY_SUMMARY_USER_TEMPLATE
+
+        if system_prompt is None:
+            system_prompt = WEEKLY_SUMMARY_SYSTEM_PROMPT
+
+        user_prompt = self._plan_user_prompt(
+            system_prompt,
+            self._format_daily_log_parts(daily_logs),
+            WEEKLY_SUMMARY_USER_TEMPLATE,
+            "combined_logs",
+        )
+        return system_prompt, user_prompt
+
+    def _monthly_prompts(
+        self, weekly_achievements: list[dict], system_prompt: str | None
+    ) -> tuple[str, str]:
+        """월간 요약의 (시스템 프롬프트, 최종 사용자 프롬프트)를 준비"""
+        from .prompts import (
+            MONTHLY_SUMMARY_SYSTEM_PROMPT,
+            MONTHLY_SUMMARY_USER_TEMPLATE,
+        )
+
+        if system_prompt is None:
+            system_prompt = MONTHLY_SUMMARY_SYSTEM_PROMPT
+
+        user_prompt = self._plan_user_prompt(
+            system_prompt,
+            self._format_weekly_achievement_parts(weekly_achievements),
+            MONTHLY_SUMMARY_USER_TEMPLATE,
+            "combined_weeks",
+        )
+        return system_prompt, user_prompt
+
+    def _plan_user_prompt(
+        self, system_prompt: str, parts: list[str], user_template: str, field: str
+    ) -> str:
+        """
+        입력 조각을 토큰 예산에 맞춰 마지막 요청의 사용자 프롬프트를 만듦
+
+        전체 입력이 예산 안에 들어가면 그대로 템플릿을 채우고, 넘치면 예산 단위로
+        나눈 묶음을 병렬로 요약(map)한 뒤 부분 결과를 합치는 프롬프트(reduce)를
+        반환한다. 마지막 요청은 호출하는 쪽에서 일반/스트리밍 중 골라 보낸다.
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            parts: 로그/주간 성과 등을 하나씩 포맷한 문자열 리스트
+            user_template: 사용자 프롬프트 템플릿
+            field: 템플릿에서 조각을 채울 자리표시자 이름
+
+        Returns:
+            마지막 요청에 사용할 사용자 프롬프트
+        """
+        budget = self.input_token_budget or get_input_token_budget()
+        available = budget - estimate_tokens(system_prompt + user_template)
+        chunks = split_by_budget(parts, available)
+        prompts = [user_template.format(**{field: "\n".join(c)}) for c in chunks]
+
+        if not prompts:
+            # 입력이 비어 있으면 나눌 묶음도 없으므로 빈 템플릿 한 번으로 처리
+            return user_template.format(**{field: ""})
+        if len(prompts) == 1:
+            return prompts[0]
+        return self._reduce_prompt(system_prompt, self._generate_many(system_prompt, prompts))
+
+    def _reduce_prompt(self, system_prompt: str, partials: list[str]) -> str:
+        """부분 요약들을 예산 안에서 합치는 프롬프트를 만듦 (필요 시 중간 단계 실행)"""
+        from .prompts import SUMMARY_REDUCE_USER_TEMPLATE
+
+        budget = self.input_token_budget or get_input_token_budget()
+        available = budget - estimate_tokens(system_prompt + SUMMARY_REDUCE_USER_TEMPLATE)
+        parts = [f"### 부분 요약 {idx}\n{partial}\n---" for idx, partial in enumerate(partials, 1)]
+        chunks = split_by_budget(parts, available)
+
+        if 1 < len(chunks) < len(parts):
+            prompts = [
+                SUMMARY_REDUCE_USER_TEMPLATE.format(partial_summaries="\n".join(c)) for c in chunks
+            ]
+            return self._reduce_prompt(system_prompt, self._generate_many(system_prompt, prompts))
+
+        if len(chunks) > 1:
+            # 부분 요약 하나하나가 예산을 채우면 더 묶을 수 없으므로 균등하게 줄임
+            share = max(1, available // len(parts))
+            parts = [truncate_to_budget(part, share) for part in parts]
+
+        return SUMMARY_REDUCE_USER_TEMPLATE.format(partial_summaries="\n".join(parts))
+
+    def _generate_many(self, system_prompt: str, user_prompts: list[str]) -> list[str]:
+        """여러 사용자 프롬프트를 병렬로 요청하고 입력 순서대로 결과를 반환"""
+        workers = int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(user_prompts))),
+            thread_name_prefix="llm-map",
+        ) as executor:
+            return list(
+                executor.map(lambda prompt: self._generate(system_prompt, prompt), user_prompts)
+            )
+
+    def parse_weekly_response(self, content: str) -> dict[str, str]:
+        """주간 요약 응답을 성과/핵심 하이라이트 구간으로 분리 (공통 로직)"""
+        parts = content.split("## 핵심 하이라이트")
+        bullet_points = parts[0].replace("## 주간 성과 요약", "").strip()
+        key_highlights = parts[1].strip() if len(parts) > 1 else ""
+
+        if not bullet_points:
+            bullet_points = content.strip()
+        if not key_highlights:
+            key_highlights = (
+                "출력에서 핵심 하이라이트 구간을 찾지 못했습니다. 프롬프트를 확인해주세요."
+            )
+
+        return {
+            "bullet_points": bullet_points,
+            "key_highlights": key_highlights,
+            "raw_response": content,
+        }
+
+    def parse_monthly_response(
+        self, content: str, title: str = "## 월간 종합 성과"
+    ) -> dict[str, str]:
+        """월간/연간 요약 응답을 종합 성과/경력기술서 구간으로 분리 (공통 로직)"""
+        parts = content.split("## 경력기술서용 요약")
+        summary = parts[0].replace(title, "").strip()
+        career_brief = parts[1].strip() if len(parts) > 1 else ""
+
+        if not summary:
+            summary = content.strip()
+        if not career_brief:
+            career_brief = (
+                "출력에서 경력기술서용 요약 구간을 찾지 못했습니다. 프롬프트를 확인해주세요."
+            )
+
+        return {
+            "summary": summary,
+            "career_brief": career_brief,
+            "raw_response": content,
+        }
 
     def _format_daily_logs(self, daily_logs: list[dict]) -> str:
         """일일 로그를 프롬프트용 문자열로 변환 (공통 로직)"""
+        return "\n".join(self._format_daily_log_parts(daily_logs))
+
+    def _format_daily_log_parts(self, daily_logs: list[dict]) -> list[str]:
+        """일일 로그를 한 건씩 프롬프트용 문자열로 변환"""
         formatted_parts = []
 
         for idx, log in enumerate(daily_logs, 1):
@@ -85,10 +408,14 @@ class BaseLLMClient(ABC):
 """
             )
 
-        return "\n".join(formatted_parts)
+        return formatted_parts
 
     def _format_weekly_achievements(self, weekly_achievements: list[dict]) -> str:
         """주간 성과 데이터를 프롬프트용 문자열로 변환 (공통 로직)"""
+        return "\n".join(self._format_weekly_achievement_parts(weekly_achievements))
+
+    def _format_weekly_achievement_parts(self, weekly_achievements: list[dict]) -> list[str]:
+        """주간 성과를 한 건씩 프롬프트용 문자열로 변환"""
         formatted_parts = []
 
         for idx, week in enumerate(weekly_achievements, 1):
@@ -117,19 +444,98 @@ class BaseLLMClient(ABC):
 """
             )
 
-        return "\n".join(formatted_parts)
+        return formatted_parts
+
+    def _format_monthly_highlight_parts(self, monthly_highlights: list[dict]) -> list[str]:
+        """월간 하이라이트를 한 건씩 프롬프트용 문자열로 변환 (공통 로직)"""
+        formatted_parts = []
+
+        for item in monthly_highlights:
+            formatted_parts.append(
+                f"""
+### {item.get("year")}년 {item.get("month", 0):02d}월
+**월간 종합 성과**:
+{item.get("summary", "")}
+
+**경력기술서용 요약**:
+{item.get("career_brief", "")}
+---
+"""
+            )
+
+        return formatted_parts
+
+
+class StreamCollector:
+    """스트리밍 응답을 모으면서 첫 토큰 시간(TTFT)과 섹션 진입 시각을 기록"""
+
+    def __init__(
+        self,
+        headings: Iterable[str] = (),
+        on_delta: Callable[[str], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            headings: 감지할 섹션 헤딩 (응답에 나타나는 순서와 무관)
+            on_delta: 텍스트 조각을 받을 때마다 호출할 콜백 (예: 콘솔 출력)
+            clock: 단조 증가 시계 (테스트 주입용)
+        """
+        self.headings = tuple(headings)
+        self.on_delta = on_delta
+        self._clock = clock
+        self.text = ""
+        self.ttft: float | None = None
+        self.elapsed: float | None = None
+        self.current_section: str | None = None
+        # 헤딩별로 처음 나타난 시점(요청 시작 기준 초)
+        self.section_times: dict[str, float] = {}
+
+    def consume(self, deltas: Iterable[str]) -> str:
+        """
+        텍스트 조각을 끝까지 읽어 전체 응답을 반환
+
+        Args:
+            deltas: stream_weekly_summary 등이 반환한 텍스트 조각 이터레이터
+
+        Returns:
+            이어 붙인 전체 응답
+        """
+        started = self._clock()
+        for delta in deltas:
+            if not delta:
+                continue
+            now = self._clock() - started
+            if self.ttft is None:
+                self.ttft = now
+
+            # 헤딩이 두 조각에 걸쳐 올 수 있으므로 직전 꼬리부터 다시 검색
+            search_from = max(0, len(self.text) - max(map(len, self.headings), default=0))
+            self.text += delta
+            for heading in self.headings:
+                if heading not in self.section_times and heading in self.text[search_from:]:
+                    self.section_times[heading] = now
+                    self.current_section = heading
+
+            if self.on_delta:
+                self.on_delta(delta)
+
+        self.elapsed = self._clock() - started
+        return self.text
 
 
 class LLMClientFactory:
     """LLM 클라이언트 인스턴스를 생성하는 Factory"""
 
     @staticmethod
-    def create_client(provider: str | None = None) -> BaseLLMClient:
+    def create_client(provider: str | None = None, use_cache: bool = True) -> BaseLLMClient:
         """
         환경 변수 또는 명시적 provider 값을 기반으로 LLM 클라이언트 생성
 
         Args:
-            provider: LLM 제공자 ('claude', 'openai', 'gemini'). None이면 환경 변수 참조
+            provider: LLM 제공자 ('claude', 'openai', 'gemini'). None이면 환경 변수 참조.
+                'claude,openai'처럼 쉼표로 나열하면 순서대로 헤지/전환하는 복합 클라이언트
+            use_cache: False면 응답 캐시를 사용하지 않음 (LLM_CACHE_BYPASS와 동일)
 
         Returns:
             BaseLLMClient 인스턴스
@@ -137,23 +543,36 @@ class LLMClientFactory:
         Raises:
             ValueError: 지원하지 않는 provider
         """
+        settings = get_settings()
         if provider is None:
-            provider = os.getenv("LLM_PROVIDER", "claude").lower()
+            provider = settings.llm_provider
 
-        if provider == "claude":
+        client: BaseLLMClient
+        names = [name.strip() for name in provider.split(",") if name.strip()]
+        if len(names) > 1:
+            from .llm_fallback import FallbackLLMClient
+
+            client = FallbackLLMClient(
+                [LLMClientFactory.create_client(name, use_cache=False) for name in names]
+            )
+        elif provider == "claude":
             from .claude_client import ClaudeClientWrapper
 
-            return ClaudeClientWrapper()
+            client = ClaudeClientWrapper()
         elif provider == "openai":
             from .openai_client import OpenAIClient
 
-            return OpenAIClient()
+            client = OpenAIClient()
         elif provider == "gemini":
             from .gemini_client import GeminiClient
 
-            return GeminiClient()
+            client = GeminiClient()
         else:
             raise ValueError(
                 f"지원하지 않는 LLM 제공자: {provider}. "
                 f"'claude', 'openai', 'gemini' 중 하나를 선택하세요."
             )
+
+        if use_cache:
+            client.cache = LLMResponseCache.from_env()
+        return client
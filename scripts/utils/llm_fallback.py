@@ -0,0 +1,267 @@
+"""
+여러 LLM 제공자를 순서대로 묶어 헤지 요청과 장애 차단(circuit breaker)을 적용하는 클라이언트
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from .llm_client import BaseLLMClient
+
+# 주 제공자가 이 시간(초) 안에 응답하지 않으면 다음 제공자에 같은 요청을 보냄
+DEFAULT_HEDGE_DELAY = 20.0
+# 연속 실패가 이 횟수에 도달하면 해당 제공자를 일정 시간 제외
+DEFAULT_BREAKER_FAILURES = 3
+DEFAULT_BREAKER_RESET = 300.0
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기준으로 열리고, 대기 시간이 지나면 한 번 시험 호출을 허용"""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURES,
+        reset_timeout: float = DEFAULT_BREAKER_RESET,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: 차단을 시작할 연속 실패 횟수
+            reset_timeout: 차단 후 시험 호출을 허용하기까지 대기할 초
+            clock: 단조 증가 시계 (테스트 주입용)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """현재 호출이 차단된 상태인지 여부"""
+        with self._lock:
+            return self._opened_at is not None and (
+                self._clock() - self._opened_at < self.reset_timeout
+            )
+
+    def is_available(self) -> bool:
+        """
+        지금 호출을 시도할 수 있는 상태인지 여부 (상태를 바꾸지 않음)
+
+        닫혀 있거나 대기 시간이 지나 시험 호출이 가능한 경우 True를 반환한다.
+        실제로 호출하기 직전에는 allow()로 시험 호출 기회를 확보해야 한다.
+        """
+        return not self.is_open
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부
+
+        대기 시간이 지난 뒤에는 시험 호출 한 번을 허용하고, 그 결과가 나올
+        때까지 다시 대기 시간을 적용한다 (half-open).
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                self._opened_at = self._clock()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+
+
+class FallbackLLMClient(BaseLLMClient):
+    """우선순위 순서의 제공자 목록으로 헤지 요청과 장애 전환을 수행하는 복합 클라이언트"""
+
+    provider_name = "fallback"
+
+    def __init__(
+        self,
+        providers: list[BaseLLMClient],
+        hedge_delay: float | None = None,
+        breaker_factory: Callable[[], CircuitBreaker] | None = None,
+    ):
+        """
+        Args:
+            providers: 우선순위 순서의 LLM 클라이언트 리스트
+            hedge_delay: 다음 제공자에 헤지 요청을 보내기까지 대기할 초
+                (미지정 시 LLM_HEDGE_DELAY 환경 변수 또는 기본값)
+            breaker_factory: 제공자별 CircuitBreaker 생성 함수 (테스트 주입용)
+        """
+        if not providers:
+            raise ValueError("providers는 최소 1개 이상이어야 합니다.")
+
+        self.providers = providers
+        self.hedge_delay = (
+            hedge_delay
+            if hedge_delay is not None
+            else float(os.getenv("LLM_HEDGE_DELAY", DEFAULT_HEDGE_DELAY))
+        )
+        failures = int(os.getenv("LLM_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURES))
+        reset = float(os.getenv("LLM_BREAKER_RESET", DEFAULT_BREAKER_RESET))
+        self.breakers = [
+            breaker_factory() if breaker_factory else CircuitBreaker(failures, reset)
+            for _ in providers
+        ]
+        self.max_tokens = getattr(providers[0], "max_tokens", None)
+        self._lock = threading.Lock()
+        self._stats = {"hedges": 0, "fallbacks": 0, "skipped_open": 0}
+        self.wins: dict[str, int] = {}
+
+    @property
+    def model_name(self) -> str:
+        """캐시 키에 사용할 모델 이름 (제공자 구성 전체)"""
+        return ",".join(f"{p.provider_name}:{p.model_name}" for p in self.providers)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """헤지/전환/차단 누적 카운터의 스냅샷"""
+        with self._lock:
+            return {**self._stats, "wins": dict(self.wins)}
+
+    def _record(self, key: str, value: int = 1):
+        with self._lock:
+            self._stats[key] += value
+
+    def _candidates(self) -> tuple[list[int], bool]:
+        """
+        호출을 시도할 제공자 인덱스를 우선순위 순서로 선택
+
+        차단기 상태만 확인하고 half-open 시험 호출 기회는 소비하지 않는다.
+        실제로 요청을 보낼 제공자만 _acquire()로 허용을 받는다.
+
+        Returns:
+            (제공자 인덱스 리스트, 차단 무시 여부). 모두 차단되면 전체를 순서대로
+            시도하도록 차단 무시 여부를 True로 반환
+        """
+        available = [idx for idx, breaker in enumerate(self.breakers) if breaker.is_available()]
+        self._record("skipped_open", len(self.providers) - len(available))
+        if available:
+            return available, False
+        return list(range(len(self.providers))), True
+
+    def _acquire(self, idx: int, forced: bool) -> bool:
+        """요청을 보내기 직전에 차단기 허용을 받음 (다른 요청이 시험 호출을 가져갔으면 False)"""
+        if forced or self.breakers[idx].allow():
+            return True
+        self._record("skipped_open")
+        return False
+
+    def _call_provider(self, idx: int, system_prompt: str, user_prompt: str) -> str:
+        # 이미 다른 제공자가 이겨 버려진 요청의 결과도 차단기 상태에 반영
+        try:
+            content = self.providers[idx]._complete(system_prompt, user_prompt)
+        except Exception:
+            self.breakers[idx].record_failure()
+            raise
+        self.breakers[idx].record_success()
+        return content
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        주 제공자에 먼저 요청하고, hedge_delay 안에 응답이 없거나 실패하면
+        다음 제공자에 같은 요청을 보내 가장 먼저 성공한 응답을 반환
+        """
+        candidates, forced = self._candidates()
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="llm-hedge")
+        pending: dict[Future, int] = {}
+        errors: list[str] = []
+        launched = 0
+
+        def launch() -> bool:
+            nonlocal launched
+            while launched < len(candidates):
+                idx = candidates[launched]
+                launched += 1
+                if self._acquire(idx, forced):
+                    future = executor.submit(self._call_provider, idx, system_prompt, user_prompt)
+                    pending[future] = idx
+                    return True
+            return False
+
+        try:
+            if not launch():
+                # 선택 이후 다른 요청이 시험 호출을 모두 가져갔으면 차단과 무관하게 시도
+                forced, launched = True, 0
+                launch()
+            while pending:
+                timeout = self.hedge_delay if launched < len(candidates) else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    self._record("hedges")
+                    launch()
+                    continue
+
+                for future in done:
+                    idx = pending.pop(future)
+                    provider = self.providers[idx]
+                    try:
+                        content = future.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        errors.append(f"{provider.provider_name}: {exc}")
+                        if launched < len(candidates):
+                            self._record("fallbacks")
+                            launch()
+                        continue
+
+                    with self._lock:
+                        self.wins[provider.provider_name] = (
+                            self.wins.get(provider.provider_name, 0) + 1
+                        )
+                    return content
+
+            raise RuntimeError("모든 LLM 제공자 호출이 실패했습니다: " + "; ".join(errors))
+        finally:
+            # 진 요청은 스레드를 강제로 멈출 수 없으므로 결과만 버리고 기다리지 않음
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        우선순위대로 스트리밍을 시도하고, 첫 조각을 받기 전에 실패하면 다음 제공자로 전환
+
+        이미 일부 조각을 출력한 뒤의 실패는 응답이 섞이지 않도록 그대로 전파한다.
+        """
+        errors: list[str] = []
+        candidates, forced = self._candidates()
+        attempted = 0
+        for idx in candidates:
+            if not self._acquire(idx, forced):
+                continue
+            if attempted:
+                self._record("fallbacks")
+            attempted += 1
+            provider = self.providers[idx]
+            started = False
+            try:
+                for delta in provider._stream(system_prompt, user_prompt):
+                    started = True
+                    yield delta
+            except Exception as exc:  # pylint: disable=broad-except
+                self.breakers[idx].record_failure()
+                if started:
+                    raise
+                errors.append(f"{provider.provider_name}: {exc}")
+                continue
+
+            self.breakers[idx].record_success()
+            with self._lock:
+                self.wins[provider.provider_name] = self.wins.get(provider.provider_name, 0) + 1
+            return
+
+        raise RuntimeError("모든 LLM 제공자 호출이 실패했습니다: " + "; ".join(errors))
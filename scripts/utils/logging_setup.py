@@ -0,0 +1,252 @@
+"""
+실행 로그 공용 파이프라인 (큐 기반 비차단 핸들러 + JSON Lines 출력 + 회전)
+
+호출 스레드는 로그 레코드를 큐에 넣기만 하고, 파일/표준 출력 쓰기는 백그라운드
+리스너 스레드 하나가 전담한다. 요청 ID는 contextvars로 전달되어 같은 요청(또는 같은
+CLI 실행)에서 남긴 로그를 한 번에 추적할 수 있다.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+from .settings import load_env
+
+LOGGER_NAME = "work_logging"
+
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "logs")
+DEFAULT_LOG_FILE = "execution.log"
+# 크기 기준 회전 기본값 (10MB, 백업 5개)
+DEFAULT_ROTATE_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# 실행 상태 문자열 → 로깅 레벨
+_STATUS_LEVELS = {
+    "ERROR": logging.ERROR,
+    "CANCELLED": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "DEBUG": logging.DEBUG,
+}
+
+_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
+
+_listener: logging.handlers.QueueListener | None = None
+# task_done()을 지원하는 Queue여야 flush_logs가 join()으로 처리 완료를 기다릴 수 있음
+_log_queue: queue.Queue[logging.LogRecord] | None = None
+_listener_lock = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON 객체로 직렬화"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "status": getattr(record, "status", record.levelname),
+            "component": getattr(record, "component", record.name),
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _log_target() -> str:
+    """LOG_TARGET(file/stdout/both), 미지정 시 서버리스·PaaS 환경이면 stdout"""
+    target = os.getenv("LOG_TARGET")
+    if target:
+        return target.lower()
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME") or os.getenv("RENDER"):
+        return "stdout"
+    return "file"
+
+
+def _build_handlers() -> list[logging.Handler]:
+    """환경 변수 설정에 맞는 실제 출력 핸들러 목록을 만듦"""
+    load_env()
+    target = _log_target()
+    handlers: list[logging.Handler] = []
+
+    if target in ("file", "both"):
+        log_dir = os.getenv("LOG_DIR", DEFAULT_LOG_DIR)
+        os.makedirs(log_dir, exist_ok=True)
+        path = os.path.join(log_dir, os.getenv("LOG_FILE", DEFAULT_LOG_FILE))
+        backups = int(os.getenv("LOG_BACKUP_COUNT", DEFAULT_BACKUP_COUNT))
+        when = os.getenv("LOG_ROTATE_WHEN")
+        if when:
+            handlers.append(
+                logging.handlers.TimedRotatingFileHandler(
+                    path, when=when, backupCount=backups, encoding="utf-8"
+                )
+            )
+        else:
+            handlers.append(
+                logging.handlers.RotatingFileHandler(
+                    path,
+                    maxBytes=int(os.getenv("LOG_ROTATE_BYTES", DEFAULT_ROTATE_BYTES)),
+                    backupCount=backups,
+                    encoding="utf-8",
+                )
+            )
+
+    if target in ("stdout", "both"):
+        handlers.append(logging.StreamHandler(sys.stdout))
+
+    formatter = JsonLinesFormatter()
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def configure_logging(force: bool = False) -> logging.Logger:
+    """
+    공용 로거에 큐 핸들러를 붙이고 백그라운드 리스너를 시작 (여러 번 호출해도 한 번만 설정)
+
+    Args:
+        force: True면 기존 리스너를 정리하고 환경 변수를 다시 읽어 재설정
+
+    Returns:
+        설정된 공용 로거
+    """
+    global _listener, _log_queue
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with _listener_lock:
+        if _listener is not None and not force:
+            return logger
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            logger.handlers.clear()
+
+        _log_queue = queue.Queue()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+        logger.propagate = False
+
+        _listener = logging.handlers.QueueListener(
+            _log_queue, *_build_handlers(), respect_handler_level=True
+        )
+        _listener.start()
+
+    return logger
+
+
+def flush_logs():
+    """
+    큐에 쌓인 로그를 모두 출력될 때까지 기다림
+
+    Lambda처럼 응답 직후 프로세스가 멈출 수 있는 환경에서 호출한다. 리스너 스레드는
+    그대로 둔 채, 이미 큐에 들어간 레코드가 모두 핸들러에 전달될 때까지만 기다린다.
+    """
+    with _listener_lock:
+        log_queue = _log_queue if _listener is not None else None
+    if log_queue is not None:
+        log_queue.join()
+
+
+@atexit.register
+def _shutdown_logging():
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+def new_request_id() -> str:
+    """새 요청 ID (32자리 16진수)"""
+    return uuid.uuid4().hex
+
+
+def get_request_id() -> str | None:
+    """현재 컨텍스트의 요청 ID"""
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id: str | None = None) -> Iterator[str]:
+    """
+    블록 안에서 남기는 로그에 요청 ID를 붙임
+
+    Args:
+        request_id: 사용할 요청 ID (미지정 시 새로 생성)
+
+    Yields:
+        적용된 요청 ID
+    """
+    token = _request_id.set(request_id or new_request_id())
+    try:
+        yield _request_id.get() or ""
+    finally:
+        _request_id.reset(token)
+
+
+def log_execution(
+    component: str,
+    status: str,
+    message: str,
+    duration_ms: float | None = None,
+    **fields: Any,
+):
+    """
+    실행 결과를 공용 로그 파이프라인에 기록 (호출 스레드는 큐에 넣기만 함)
+
+    Args:
+        component: 로그를 남기는 모듈 이름 (예: weekly_processor)
+        status: SUCCESS, ERROR 등 상태 문자열
+        message: 상태에 대한 상세 메시지
+        duration_ms: 처리 시간 (밀리초, 선택)
+        **fields: JSON에 함께 남길 추가 필드
+    """
+    if duration_ms is not None:
+        fields["duration_ms"] = round(duration_ms, 1)
+    configure_logging().log(
+        _STATUS_LEVELS.get(status.upper(), logging.INFO),
+        message,
+        extra={
+            "status": status,
+            "component": component,
+            "request_id": _request_id.get(),
+            "fields": fields,
+        },
+    )
+
+
+def execution_logger(component: str) -> Callable[..., None]:
+    """
+    모듈별 write_execution_log 함수를 만듦
+
+    Args:
+        component: 로그에 남길 모듈 이름
+
+    Returns:
+        write_execution_log(status, message, duration_ms=None, **fields) 함수
+    """
+
+    def write_execution_log(
+        status: str, message: str, duration_ms: float | None = None, **fields: Any
+    ):
+        log_execution(component, status, message, duration_ms=duration_ms, **fields)
+
+    write_execution_log.__doc__ = f"{component} 실행 결과를 공용 로그에 기록"
+    return write_execution_log
@@ -0,0 +1,389 @@
+"""
+마크다운 텍스트와 Notion 블록 사이의 변환 (단일 패스 토크나이저 및 역변환)
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+# Notion rich_text 항목 하나에 넣을 수 있는 최대 글자 수
+NOTION_TEXT_LIMIT = 2000
+# 블록 하나의 rich_text 배열에 넣을 수 있는 최대 항목 수
+NOTION_RICH_TEXT_ITEMS = 100
+# 한 번의 생성 요청에서 허용되는 children 중첩 깊이 (최상위 블록 = 0)
+NOTION_MAX_NESTING_DEPTH = 2
+
+_FENCE_RE = re.compile(r"^(`{3,}|~{3,})\s*([\w+#.-]*)")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_DIVIDER_RE = re.compile(r"^(?:-{3,}|\*{3,}|_{3,})$")
+_QUOTE_RE = re.compile(r"^>\s?(.*)$")
+_TODO_RE = re.compile(r"^[-*+]\s+\[([ xX])\]\s+(.*)$")
+_BULLET_RE = re.compile(r"^[-*+]\s+(.*)$")
+_NUMBERED_RE = re.compile(r"^\d+[.)]\s+(.*)$")
+_INLINE_RE = re.compile(
+    r"\*\*(?P<bold>.+?)\*\*" r"|`(?P<code>[^`]+)`" r"|\[(?P<link>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+)
+
+# Notion 코드 블록이 허용하는 언어 중 자주 쓰는 것과 흔한 별칭
+_CODE_LANGUAGES = {
+    "bash": "bash",
+    "sh": "shell",
+    "shell": "shell",
+    "zsh": "shell",
+    "c": "c",
+    "cpp": "c++",
+    "c++": "c++",
+    "csharp": "c#",
+    "cs": "c#",
+    "css": "css",
+    "diff": "diff",
+    "docker": "docker",
+    "dockerfile": "docker",
+    "go": "go",
+    "graphql": "graphql",
+    "html": "html",
+    "java": "java",
+    "javascript": "javascript",
+    "js": "javascript",
+    "json": "json",
+    "kotlin": "kotlin",
+    "kt": "kotlin",
+    "markdown": "markdown",
+    "md": "markdown",
+    "python": "python",
+    "py": "python",
+    "ruby": "ruby",
+    "rb": "ruby",
+    "rust": "rust",
+    "rs": "rust",
+    "scala": "scala",
+    "sql": "sql",
+    "swift": "swift",
+    "typescript": "typescript",
+    "ts": "typescript",
+    "xml": "xml",
+    "yaml": "yaml",
+    "yml": "yaml",
+}
+
+
+def _text_items(
+    content: str, annotations: dict[str, bool] | None = None, url: str | None = None
+) -> list[dict[str, Any]]:
+    """글자 수 제한에 맞춰 같은 서식의 rich_text 항목 여러 개로 나눔"""
+    items = []
+    for start in range(0, len(content), NOTION_TEXT_LIMIT):
+        text: dict[str, Any] = {"content": content[start : start + NOTION_TEXT_LIMIT]}
+        if url:
+            text["link"] = {"url": url}
+        item: dict[str, Any] = {"type": "text", "text": text}
+        if annotations:
+            item["annotations"] = dict(annotations)
+        items.append(item)
+    return items
+
+
+def plain_rich_text(content: str) -> list[dict[str, Any]]:
+    """
+    서식 없는 문자열을 Notion 글자 수 제한에 맞춘 rich_text 배열로 변환
+
+    Args:
+        content: 원본 문자열
+
+    Returns:
+        rich_text 항목 리스트
+    """
+    return _text_items(content)
+
+
+def parse_inline(text: str) -> list[dict[str, Any]]:
+    """
+    굵게(**), 인라인 코드(`), 링크([텍스트](URL)) 서식을 rich_text 배열로 변환
+
+    Args:
+        text: 한 블록에 들어갈 마크다운 문자열
+
+    Returns:
+        rich_text 항목 리스트 (각 항목은 NOTION_TEXT_LIMIT 이하)
+    """
+    items: list[dict[str, Any]] = []
+    position = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > position:
+            items.extend(_text_items(text[position : match.start()]))
+        if match.group("bold") is not None:
+            items.extend(_text_items(match.group("bold"), {"bold": True}))
+        elif match.group("code") is not None:
+            items.extend(_text_items(match.group("code"), {"code": True}))
+        else:
+            items.extend(_text_items(match.group("link"), url=match.group("url")))
+        position = match.end()
+
+    if position < len(text):
+        items.extend(_text_items(text[position:]))
+    return items
+
+
+def _make_blocks(
+    block_type: str, rich_text: list[dict[str, Any]], **extra: Any
+) -> list[dict[str, Any]]:
+    """rich_text 항목 수 제한을 넘으면 같은 종류의 블록 여러 개로 나눔"""
+    return [
+        {
+            "object": "block",
+            "type": block_type,
+            block_type: {
+                "rich_text": rich_text[start : start + NOTION_RICH_TEXT_ITEMS],
+                **extra,
+            },
+        }
+        for start in range(0, max(len(rich_text), 1), NOTION_RICH_TEXT_ITEMS)
+    ]
+
+
+def text_blocks(block_type: str, content: str) -> list[dict[str, Any]]:
+    """
+    서식 없는 긴 문자열을 글자 수/항목 수 제한에 맞춘 같은 종류의 블록으로 변환
+
+    Args:
+        block_type: 블록 종류 (예: "paragraph")
+        content: 원본 문자열
+
+    Returns:
+        Notion 블록 리스트 (항목이 100개를 넘으면 여러 블록)
+    """
+    return _make_blocks(block_type, plain_rich_text(content))
+
+
+def _code_language(tag: str) -> str:
+    return _CODE_LANGUAGES.get(tag.lower(), "plain text")
+
+
+def markdown_to_blocks(markdown_text: str) -> list[dict[str, Any]]:
+    """
+    마크다운 텍스트를 한 번만 훑어 Notion 블록 리스트로 변환
+
+    지원 문법: 헤딩(#~###), 문단, 인용(>), 구분선(---), 펜스 코드 블록,
+    글머리/번호/할 일 목록(들여쓰기로 중첩), 인라인 굵게/코드/링크.
+    중첩은 Notion 한 요청의 허용 깊이까지만 만들고, 더 깊은 항목은
+    가장 깊은 단계의 형제로 붙인다.
+
+    Args:
+        markdown_text: 마크다운 형식의 텍스트
+
+    Returns:
+        Notion 블록 리스트
+    """
+    blocks: list[dict[str, Any]] = []
+    # 열려 있는 목록 항목: (들여쓰기, 블록, 깊이, 블록이 담긴 리스트)
+    list_stack: list[tuple[int, dict[str, Any], int, list[dict[str, Any]]]] = []
+    pending_type: str | None = None
+    pending_lines: list[str] = []
+    code_fence: str | None = None
+    code_language = ""
+    code_lines: list[str] = []
+
+    def flush_pending():
+        nonlocal pending_type
+        if pending_type is not None:
+            blocks.extend(_make_blocks(pending_type, parse_inline("\n".join(pending_lines))))
+            pending_type = None
+            pending_lines.clear()
+
+    for raw_line in markdown_text.splitlines():
+        if code_fence is not None:
+            if raw_line.strip().startswith(code_fence):
+                blocks.extend(
+                    _make_blocks(
+                        "code",
+                        plain_rich_text("\n".join(code_lines)),
+                        language=_code_language(code_language),
+                    )
+                )
+                code_fence = None
+                code_lines.clear()
+            else:
+                code_lines.append(raw_line)
+            continue
+
+        line = raw_line.strip()
+        if not line:
+            flush_pending()
+            continue
+
+        fence = _FENCE_RE.match(line)
+        if fence:
+            flush_pending()
+            list_stack.clear()
+            code_fence, code_language = fence.group(1), fence.group(2)
+            continue
+
+        todo = _TODO_RE.match(line)
+        bullet = None if todo else _BULLET_RE.match(line)
+        numbered = None if todo or bullet else _NUMBERED_RE.match(line)
+        if todo or bullet or numbered:
+            flush_pending()
+            if todo:
+                new_blocks = _make_blocks(
+                    "to_do", parse_inline(todo.group(2)), checked=todo.group(1) != " "
+                )
+            elif bullet:
+                new_blocks = _make_blocks("bulleted_list_item", parse_inline(bullet.group(1)))
+            elif numbered:
+                new_blocks = _make_blocks("numbered_list_item", parse_inline(numbered.group(1)))
+
+            indent = len(raw_line.expandtabs(4)) - len(raw_line.expandtabs(4).lstrip())
+            while list_stack and list_stack[-1][0] >= indent:
+                list_stack.pop()
+            if not list_stack:
+                container, depth = blocks, 0
+            elif list_stack[-1][2] < NOTION_MAX_NESTING_DEPTH:
+                parent = list_stack[-1][1]
+                container = parent[parent["type"]].setdefault("children", [])
+                depth = list_stack[-1][2] + 1
+            else:
+                container, depth = list_stack[-1][3], list_stack[-1][2]
+            container.extend(new_blocks)
+            list_stack.append((indent, new_blocks[-1], depth, container))
+            continue
+
+        list_stack.clear()
+
+        heading = _HEADING_RE.match(line)
+        if heading:
+            flush_pending()
+            level = min(len(heading.group(1)), 3)
+            blocks.extend(_make_blocks(f"heading_{level}", parse_inline(heading.group(2))))
+            continue
+
+        if _DIVIDER_RE.match(line):
+            flush_pending()
+            blocks.append({"object": "block", "type": "divider", "divider": {}})
+            continue
+
+        quote = _QUOTE_RE.match(line)
+        block_type = "quote" if quote else "paragraph"
+        text = quote.group(1) if quote else line
+        if pending_type != block_type:
+            flush_pending()
+            pending_type = block_type
+        pending_lines.append(text)
+
+    flush_pending()
+    if code_fence is not None:
+        # 닫히지 않은 코드 블록도 내용은 보존
+        blocks.extend(
+            _make_blocks(
+                "code",
+                plain_rich_text("\n".join(code_lines)),
+                language=_code_language(code_language),
+            )
+        )
+    return blocks
+
+
+# 자식 블록만 감싸는 컨테이너 블록 (자체 텍스트 없이 자식을 같은 들여쓰기로 출력)
+_TRANSPARENT_BLOCKS = {"column_list", "column", "synced_block", "table"}
+
+
+def rich_text_to_markdown(rich_text: list[dict[str, Any]]) -> str:
+    """
+    Notion rich_text 배열을 인라인 마크다운 문자열로 변환 (parse_inline의 역변환)
+
+    Args:
+        rich_text: Notion rich_text 항목 리스트
+
+    Returns:
+        굵게/인라인 코드/링크 서식을 살린 문자열
+    """
+    parts = []
+    for item in rich_text:
+        text = item.get("text") or {}
+        content = text.get("content", item.get("plain_text", ""))
+        annotations = item.get("annotations") or {}
+        if content and annotations.get("code"):
+            content = f"`{content}`"
+        if content and annotations.get("bold"):
+            content = f"**{content}**"
+        url = (text.get("link") or {}).get("url") or item.get("href")
+        if content and url:
+            content = f"[{content}]({url})"
+        parts.append(content)
+    return "".join(parts)
+
+
+def _block_line(block: dict[str, Any], number: int) -> str | None:
+    """블록 하나를 마크다운 줄로 변환 (출력할 내용이 없으면 None)"""
+    block_type = block.get("type", "")
+    data = block.get(block_type) or {}
+    text = rich_text_to_markdown(data.get("rich_text", []))
+
+    if block_type.startswith("heading_"):
+        return "#" * int(block_type[-1]) + " " + text
+    if block_type == "bulleted_list_item":
+        return f"- {text}"
+    if block_type == "numbered_list_item":
+        return f"{number}. {text}"
+    if block_type == "to_do":
+        return f"- [{'x' if data.get('checked') else ' '}] {text}"
+    if block_type == "toggle":
+        return f"▸ {text}"
+    if block_type == "quote":
+        return "> " + text.replace("\n", "\n> ")
+    if block_type == "callout":
+        icon = (data.get("icon") or {}).get("emoji")
+        return "> " + (f"{icon} " if icon else "") + text.replace("\n", "\n> ")
+    if block_type == "code":
+        code = "".join(
+            item.get("text", {}).get("content", item.get("plain_text", ""))
+            for item in data.get("rich_text", [])
+        )
+        language = data.get("language", "")
+        return f"```{'' if language == 'plain text' else language}\n{code}\n```"
+    if block_type == "divider":
+        return "---"
+    if block_type == "equation":
+        return f"$$ {data.get('expression', '')} $$"
+    if block_type == "table_row":
+        cells = [rich_text_to_markdown(cell) for cell in data.get("cells", [])]
+        return "| " + " | ".join(cells) + " |"
+    return text or None
+
+
+def blocks_to_markdown(
+    blocks: list[dict[str, Any]],
+    get_children: Callable[[dict[str, Any]], list[dict[str, Any]]],
+    max_depth: int,
+) -> str:
+    """
+    Notion 블록 트리를 마크다운 문자열로 변환 (markdown_to_blocks의 역변환)
+
+    목록/토글 등의 자식 블록은 두 칸 들여쓰기로, 컬럼/동기화 블록 같은
+    컨테이너의 자식은 같은 들여쓰기로 이어서 출력한다.
+
+    Args:
+        blocks: 최상위 블록 리스트
+        get_children: has_children 블록의 자식 블록 리스트를 돌려주는 함수
+        max_depth: 따라 내려갈 최대 중첩 깊이 (최상위 = 0)
+
+    Returns:
+        줄바꿈으로 이어 붙인 마크다운 문자열
+    """
+    lines: list[str] = []
+
+    def walk(siblings: list[dict[str, Any]], indent: str, depth: int):
+        number = 0
+        for block in siblings:
+            block_type = block.get("type", "")
+            number = number + 1 if block_type == "numbered_list_item" else 0
+            child_indent = indent
+            if block_type not in _TRANSPARENT_BLOCKS:
+                line = _block_line(block, number)
+                if line:
+                    lines.extend(indent + part for part in line.split("\n"))
+                child_indent = indent + "  "
+            if block.get("has_children") and depth < max_depth:
+                walk(get_children(block), child_indent, depth + 1)
+
+    walk(blocks, "", 0)
+    return "\n".join(lines)
@@ -1,36 +1,374 @@
 """
 업무 기록 시스템을 위한 Notion API 래퍼 모듈
+
+Notion SDK와 httpx는 첫 API 호출(또는 커넥션 풀 생성) 시점에 import한다. CLI가 질문을
+받는 동안이나 API 프로세스가 뜨는 동안에는 SDK 로딩 비용을 치르지 않는다.
 """
 
+import importlib.util
 import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-
-from dotenv import load_dotenv  # type: ignore[import]
-from notion_client import Client  # type: ignore[import]
-
-load_dotenv()
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from .markdown_blocks import (
+    blocks_to_markdown,
+    markdown_to_blocks,
+    plain_rich_text,
+    text_blocks,
+)
+from .page_cache import PageCache
+from .rate_limiter import RequestScheduler, get_default_scheduler
+from .settings import Settings, get_settings
+
+if TYPE_CHECKING:
+    import httpx
+    from notion_client import Client  # type: ignore[import]
+
+# Notion API 평균 허용량(초당 3회)에 맞춘 기본 동시 요청 수
+DEFAULT_MAX_CONCURRENCY = 3
+
+# databases.query, blocks.children.list 한 번에 받을 수 있는 최대 결과 수
+DEFAULT_PAGE_SIZE = 100
+
+# 본문 조회 시 따라 내려갈 자식 블록 최대 깊이 (최상위 블록 = 0)
+DEFAULT_MAX_BLOCK_DEPTH = 3
+
+# pages.create / blocks.children.append 한 번에 보낼 수 있는 children 수와
+# 중첩 블록을 포함한 전체 블록 수 상한
+NOTION_MAX_CHILDREN = 100
+NOTION_MAX_BLOCKS_PER_REQUEST = 1000
+
+
+def create_pooled_http_client(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    settings: Settings | None = None,
+) -> "httpx.Client":
+    """
+    keep-alive 커넥션을 재사용하는 Notion용 httpx 클라이언트를 생성
+
+    h2 패키지가 설치되어 있으면 HTTP/2를 사용해 하나의 연결로 여러 요청을 다중화한다.
+
+    Args:
+        max_connections: 풀 전체 최대 연결 수 (기본값 settings.notion_pool_max_connections)
+        max_keepalive_connections: 유휴 상태로 유지할 최대 연결 수
+            (기본값 settings.notion_pool_max_keepalive)
+        keepalive_expiry: 유휴 연결 유지 시간(초)
+            (기본값 settings.notion_pool_keepalive_expiry)
+        settings: 풀 크기 기본값을 읽을 설정 (미지정 시 프로세스 공용 설정)
+
+    Returns:
+        커넥션 풀이 설정된 httpx.Client
+    """
+    import httpx
+
+    settings = settings or get_settings()
+    limits = httpx.Limits(
+        max_connections=max_connections or settings.notion_pool_max_connections,
+        max_keepalive_connections=max_keepalive_connections or settings.notion_pool_max_keepalive,
+        keepalive_expiry=keepalive_expiry or settings.notion_pool_keepalive_expiry,
+    )
+    http2 = importlib.util.find_spec("h2") is not None
+    return httpx.Client(limits=limits, http2=http2)
+
+
+def _endpoint_name(endpoint: Callable[..., Any]) -> str:
+    """SDK 메서드를 지표 레이블용 이름으로 변환 (BlocksChildrenEndpoint.list → blocks.children.list)"""
+    owner, _, method = getattr(endpoint, "__qualname__", "unknown").rpartition(".")
+    owner = owner.removesuffix("Endpoint")
+    resource = re.sub(r"(?<!^)(?=[A-Z])", ".", owner).lower()
+    return f"{resource}.{method}" if resource else method
+
+
+def raise_for_content_errors(pages: list[dict[str, Any]]):
+    """
+    본문 조회에 실패한 페이지가 있으면 예외를 발생시킴
+
+    본문이 빠진 기간을 요약해 저장하지 않도록 처리기가 요약 전에 호출한다.
+
+    Args:
+        pages: 본문이 추가된 페이지 목록
+
+    Raises:
+        RuntimeError: content_error 키를 가진 페이지가 있을 때
+    """
+    failed = [page for page in pages if "content_error" in page]
+    if failed:
+        details = ", ".join(f"{page['id']}({page['content_error']})" for page in failed[:5])
+        raise RuntimeError(f"본문 조회 실패 {len(failed)}건: {details}")
 
 
 class NotionClientWrapper:
     """Notion API 작업을 편리하게 수행하기 위한 래퍼"""
 
-    def __init__(self):
-        """환경 변수에서 API 키를 읽어 Notion 클라이언트를 초기화"""
-        self.api_key = os.getenv("NOTION_API_KEY")
-        if not self.api_key:
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        scheduler: RequestScheduler | None = None,
+        http_client: "httpx.Client | None" = None,
+        cache: PageCache | None = None,
+        observer: Callable[[str, float, bool], None] | None = None,
+        settings: Settings | None = None,
+        client: Any | None = None,
+    ):
+        """
+        환경 변수에서 API 키를 읽어 Notion 클라이언트를 초기화
+
+        Args:
+            max_concurrency: 본문 조회 시 동시에 보낼 최대 요청 수
+                (미지정 시 NOTION_MAX_CONCURRENCY 환경 변수 또는 기본값 3)
+            scheduler: 모든 요청이 거쳐갈 속도 제한/재시도 스케줄러
+                (미지정 시 프로세스 공용 스케줄러)
+            http_client: Notion SDK가 사용할 httpx 클라이언트
+                (커넥션 풀을 재사용하려면 create_pooled_http_client 결과를 전달)
+            cache: 페이지 본문 로컬 캐시
+                (미지정 시 NOTION_CACHE_PATH 환경 변수가 있으면 해당 경로 사용)
+            observer: API 호출마다 (엔드포인트 이름, 소요 초, 성공 여부)를 받는 콜백
+                (지표 수집용)
+            settings: API 키와 데이터베이스 ID 설정 (미지정 시 프로세스 공용 설정)
+            client: SDK Client 대신 사용할 객체 (예: NotionEmulator, 지정 시 API 키 불필요)
+        """
+        settings = settings or get_settings()
+        self.api_key = settings.notion_api_key
+        if not self.api_key and client is None:
             raise ValueError("NOTION_API_KEY not found in environment variables")
 
-        self.client = Client(auth=self.api_key)  # type: ignore[call-arg]
+        # SDK 클라이언트는 첫 API 호출 시 생성 (client 프로퍼티)
+        self._http_client = http_client
+        self._client: Client | None = client
+        self._client_lock = threading.Lock()
 
-        # 환경 변수에서 데이터베이스 ID를 읽어 저장
-        self.daily_logs_db = os.getenv("NOTION_DB1_ID")  # Daily Work Logs
-        self.weekly_db = os.getenv("NOTION_DB2_ID")  # Weekly Achievements
-        self.monthly_db = os.getenv("NOTION_DB3_ID")  # Monthly Highlights
+        # 설정에서 데이터베이스 ID를 읽어 저장
+        self.daily_logs_db = settings.notion_daily_db  # Daily Work Logs
+        self.weekly_db = settings.notion_weekly_db  # Weekly Achievements
+        self.monthly_db = settings.notion_monthly_db  # Monthly Highlights
 
         if not self.daily_logs_db:
             raise ValueError("NOTION_DB1_ID not found in environment variables")
 
+        self.max_concurrency = max(
+            1,
+            max_concurrency or int(os.getenv("NOTION_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        )
+        self.scheduler = scheduler or get_default_scheduler()
+        self.max_block_depth = int(os.getenv("NOTION_MAX_BLOCK_DEPTH", DEFAULT_MAX_BLOCK_DEPTH))
+        # 여러 페이지를 병렬 조회하면서 자식 블록까지 내려가도 전체 동시 요청 수를 제한
+        self._children_slots = threading.BoundedSemaphore(self.max_concurrency)
+
+        cache_path = os.getenv("NOTION_CACHE_PATH")
+        if cache is None and cache_path:
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            cache = PageCache(cache_path)
+        self.cache = cache
+        self.observer = observer
+
+    @property
+    def client(self) -> "Client":
+        """Notion SDK 클라이언트 (첫 접근 시 SDK를 import해 생성)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from notion_client import Client  # type: ignore[import]
+
+                    self._client = Client(auth=self.api_key, client=self._http_client)  # type: ignore[call-arg]
+        return self._client
+
+    @client.setter
+    def client(self, value: "Client"):
+        self._client = value
+
+    def close(self):
+        """내부 httpx 커넥션 풀을 닫음 (SDK 클라이언트를 만든 적이 없으면 전달받은 풀만 닫음)"""
+        if self._client is not None:
+            self._client.close()
+        elif self._http_client is not None:
+            self._http_client.close()
+
+    def _request(
+        self,
+        endpoint: Callable[..., Any],
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        스케줄러를 거쳐 Notion API를 호출 (속도 제한 + 재시도)
+
+        Args:
+            endpoint: 호출할 Notion SDK 메서드 (예: self.client.pages.create)
+            idempotent: 중복 실행이 안전한 요청인지 여부
+            **kwargs: API에 그대로 전달할 인자
+
+        Returns:
+            API 응답 객체
+        """
+        if self.observer is None:
+            return self.scheduler.call(partial(endpoint, **kwargs), idempotent=idempotent)
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self.scheduler.call(partial(endpoint, **kwargs), idempotent=idempotent)
+            ok = True
+            return response
+        finally:
+            self.observer(_endpoint_name(endpoint), time.perf_counter() - started, ok)
+
+    def _enrich_with_content(self, pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        페이지 목록의 본문을 제한된 동시성으로 병렬 조회해 content 키를 추가
+
+        결과는 입력 순서를 그대로 유지하며, 본문 조회에 실패한 페이지는
+        content를 빈 문자열로 두고 content_error 키에 실패 사유를 기록한다.
+        캐시가 설정되어 있으면 last_edited_time이 바뀌지 않은 페이지는 캐시에서
+        읽고, 새로 조회한 본문은 캐시에 저장한다.
+
+        Args:
+            pages: databases.query로 조회한 페이지 객체 리스트
+
+        Returns:
+            content(및 실패 시 content_error) 키가 추가된 페이지 리스트
+        """
+        targets = [page for page in pages if page.get("id")]
+        if not targets:
+            return []
+
+        cached = self.cache.get_contents(targets) if self.cache else {}
+        misses = [page for page in targets if page["id"] not in cached]
+
+        futures = {}
+        if misses:
+            workers = min(self.max_concurrency, len(misses))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="notion-content"
+            ) as executor:
+                futures = {
+                    page["id"]: executor.submit(self.get_page_content, page["id"])
+                    for page in misses
+                }
+
+        enriched_pages = []
+        fetched_pages = []
+        for page in targets:
+            if page["id"] in cached:
+                enriched_pages.append({**page, "content": cached[page["id"]]})
+                continue
+            try:
+                enriched = {**page, "content": futures[page["id"]].result()}
+                fetched_pages.append(enriched)
+            except Exception as exc:  # pylint: disable=broad-except
+                enriched = {**page, "content": "", "content_error": str(exc)}
+            enriched_pages.append(enriched)
+
+        if self.cache and fetched_pages:
+            self.cache.put_pages(fetched_pages)
+
+        return enriched_pages
+
+    def attach_content(self, pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        이미 조회한 페이지 목록에 본문(content)을 병렬로 채움
+
+        Args:
+            pages: databases.query로 조회한 페이지 객체 리스트
+
+        Returns:
+            content(및 실패 시 content_error) 키가 추가된 페이지 리스트
+        """
+        return self._enrich_with_content(pages)
+
+    def sync_cache(
+        self, database_id: str | None = None, page_size: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        마지막 워터마크 이후 수정된 페이지만 조회해 로컬 캐시를 갱신
+
+        Args:
+            database_id: 동기화할 데이터베이스 ID (미지정 시 일일 로그 DB)
+            page_size: 쿼리 요청당 결과 수 (선택)
+
+        Returns:
+            이번 동기화에서 변경된 것으로 확인된 페이지 리스트 (content 포함)
+        """
+        if not self.cache:
+            raise ValueError("NOTION_CACHE_PATH not configured")
+
+        database_id = database_id or self.daily_logs_db
+        if not database_id:
+            raise ValueError("NOTION_DB1_ID not configured")
+        watermark = self.cache.get_watermark(database_id)
+
+        query_kwargs: dict[str, Any] = {
+            "database_id": database_id,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        }
+        if watermark:
+            # 같은 분에 수정된 페이지를 놓치지 않도록 경계값을 포함해 조회
+            query_kwargs["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": watermark},
+            }
+
+        pages = self._iter_paginated(
+            self.client.databases.query, page_size=page_size, **query_kwargs
+        )
+        changed: list[dict[str, Any]] = []
+        while batch := list(islice(pages, page_size or DEFAULT_PAGE_SIZE)):
+            for page in batch:
+                page.setdefault("parent", {"database_id": database_id})
+            changed.extend(self._enrich_with_content(batch))
+
+        failed = [page for page in changed if "content_error" in page]
+        edited_times = [
+            page["last_edited_time"] for page in (failed or changed) if page.get("last_edited_time")
+        ]
+        if edited_times:
+            # 실패한 페이지가 있으면 다음 동기화에서 다시 가져오도록 워터마크를 묶어둠
+            self.cache.set_watermark(
+                database_id, min(edited_times) if failed else max(edited_times)
+            )
+
+        return changed
+
+    def _iter_paginated(
+        self,
+        endpoint: Callable[..., Any],
+        page_size: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        next_cursor/has_more를 따라가며 페이지네이션 API 결과를 한 건씩 지연 반환
+
+        Args:
+            endpoint: databases.query, blocks.children.list 등 커서 기반 API
+            page_size: 요청당 결과 수 (최대 100, 미지정 시 100)
+            **kwargs: API에 그대로 전달할 인자
+
+        Yields:
+            API 응답의 results 항목
+        """
+        page_size = min(page_size or DEFAULT_PAGE_SIZE, DEFAULT_PAGE_SIZE)
+        cursor = None
+
+        while True:
+            params = {**kwargs, "page_size": page_size}
+            if cursor:
+                params["start_cursor"] = cursor
+
+            response = self._request(endpoint, **params)
+            yield from response.get("results", [])
+
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
     def _parse_markdown_to_blocks(self, markdown_text: str) -> list[dict[str, Any]]:
         """
         마크다운 텍스트를 Notion 블록으로 변환
@@ -41,114 +379,84 @@ class NotionClientWrapper:
         Returns:
             Notion 블록 리스트
         """
-        blocks = []
-        lines = markdown_text.split("\n")
-        i = 0
+        return markdown_to_blocks(markdown_text)
+
+    @staticmethod
+    def _count_blocks(block: dict[str, Any]) -> int:
+        """중첩 children을 포함한 블록 수"""
+        children = block.get(block.get("type", ""), {}).get("children", [])
+        return 1 + sum(NotionClientWrapper._count_blocks(child) for child in children)
+
+    @staticmethod
+    def _batch_children(
+        children: list[dict[str, Any]],
+    ) -> Iterator[list[dict[str, Any]]]:
+        """children을 요청당 최상위 개수/전체 블록 수 제한 안에서 순서대로 묶음"""
+        batch: list[dict[str, Any]] = []
+        used = 0
+        for block in children:
+            size = NotionClientWrapper._count_blocks(block)
+            if batch and (
+                len(batch) >= NOTION_MAX_CHILDREN or used + size > NOTION_MAX_BLOCKS_PER_REQUEST
+            ):
+                yield batch
+                batch, used = [], 0
+            batch.append(block)
+            used += size
+        if batch:
+            yield batch
+
+    def _create_page(
+        self,
+        database_id: str,
+        properties: dict[str, Any],
+        children: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        첫 묶음의 블록과 함께 페이지를 만들고, 나머지는 blocks.children.append로 추가
 
-        while i < len(lines):
-            line = lines[i]
+        Notion은 요청당 children 100개를 넘으면 거부하므로 긴 본문은 묶음 단위로
+        나눠 보낸다. append는 항상 끝에 붙으므로 순서 보장을 위해 차례대로 호출한다
+        (동시 append와의 비교는 benchmarks.page_write 참고).
+        중간 append가 실패하면 본문이 잘린 페이지가 남지 않도록 페이지를 보관
+        (archived) 처리한 뒤 원래 예외를 다시 발생시킨다.
 
-            # 빈 줄은 건너뛰기
-            if not line.strip():
-                i += 1
-                continue
+        Args:
+            database_id: 페이지를 만들 데이터베이스 ID
+            properties: 페이지 속성
+            children: 본문 블록 리스트
 
-            # Heading 3 (###)
-            if line.startswith("### "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {"content": line.replace("### ", "")},
-                                }
-                            ]
-                        },
-                    }
-                )
-            # Heading 2 (##)
-            elif line.startswith("## "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "heading_2",
-                        "heading_2": {
-                            "rich_text": [
-                                {
-                                    "type": "text",
-                                    "text": {"content": line.replace("## ", "")},
-                                }
-                            ]
-                        },
-                    }
-                )
-            # Bulleted list (-)
-            elif line.strip().startswith("- "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": line.strip()[2:]}}
-                            ]
-                        },
-                    }
-                )
-            # Numbered list (1., 2., etc.)
-            elif (
-                line.strip() and line.strip()[0].isdigit() and ". " in line.strip()[:4]
-            ):
-                content = (
-                    line.strip().split(". ", 1)[1]
-                    if ". " in line.strip()
-                    else line.strip()
-                )
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "numbered_list_item",
-                        "numbered_list_item": {
-                            "rich_text": [
-                                {"type": "text", "text": {"content": content}}
-                            ]
-                        },
-                    }
-                )
-            # 일반 텍스트 (paragraph)
-            else:
-                # 여러 줄을 하나의 paragraph로 묶기
-                paragraph_lines = [line]
-                i += 1
-                while (
-                    i < len(lines)
-                    and lines[i].strip()
-                    and not lines[i].startswith(("#", "-", "1.", "2.", "3.", "4."))
-                ):
-                    paragraph_lines.append(lines[i])
-                    i += 1
-                i -= 1  # 다음 반복에서 올바른 라인부터 시작하도록 조정
-
-                content = "\n".join(paragraph_lines)
-                if content.strip():
-                    blocks.append(
-                        {
-                            "object": "block",
-                            "type": "paragraph",
-                            "paragraph": {
-                                "rich_text": [
-                                    {"type": "text", "text": {"content": content}}
-                                ]
-                            },
-                        }
-                    )
+        Returns:
+            생성된 페이지 객체
 
-            i += 1
+        Raises:
+            Exception: 블록 추가에 실패한 경우 (페이지는 보관 처리됨)
+        """
+        batches = self._batch_children(children)
+        page = self._request(
+            self.client.pages.create,
+            idempotent=False,
+            parent={"database_id": database_id},
+            properties=properties,
+            children=next(batches, []),
+        )
 
-        return blocks
+        try:
+            for batch in batches:
+                self._request(
+                    self.client.blocks.children.append,
+                    idempotent=False,
+                    block_id=page["id"],
+                    children=batch,
+                )
+        except Exception as exc:
+            try:
+                self._request(self.client.pages.update, page_id=page["id"], archived=True)
+            except Exception as archive_error:  # pylint: disable=broad-except
+                exc.add_note(f"일부만 저장된 페이지 {page['id']} 보관 실패: {archive_error}")
+            raise
+
+        return page
 
     def create_daily_log(
         self,
@@ -177,6 +485,9 @@ class NotionClientWrapper:
         Returns:
             생성된 페이지 객체
         """
+        if not self.daily_logs_db:
+            raise ValueError("NOTION_DB1_ID not configured")
+
         properties = {
             "Name": {"title": [{"text": {"content": title}}]},
             "Logged Date": {
@@ -189,7 +500,7 @@ class NotionClientWrapper:
         }
 
         if metrics:
-            properties["Metrics"] = {"rich_text": [{"text": {"content": metrics}}]}
+            properties["Metrics"] = {"rich_text": plain_rich_text(metrics)}
 
         if ticket_url:
             properties["Ticket URL"] = {"url": ticket_url}
@@ -208,16 +519,14 @@ class NotionClientWrapper:
         ]
         context_blocks.extend(self._parse_markdown_to_blocks(context))
 
-        page = self.client.pages.create(
-            parent={"database_id": self.daily_logs_db},
-            properties=properties,
-            children=context_blocks,
-        )
-
-        return page
+        return self._create_page(self.daily_logs_db, properties, context_blocks)
 
     def get_daily_logs_with_content(
-        self, start_date: datetime, end_date: datetime, status_filter: str | None = None
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_filter: str | None = None,
+        page_size: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         지정된 기간 동안의 일일 로그를 조회하고 본문 콘텐츠를 함께 반환
@@ -226,24 +535,48 @@ class NotionClientWrapper:
             start_date: 시작 날짜(포함)
             end_date: 종료 날짜(포함)
             status_filter: 상태 필터 (선택)
+            page_size: 쿼리 요청당 결과 수 (선택)
 
         Returns:
             properties와 content 키를 포함하는 로그 리스트
         """
-        pages = self.get_daily_logs(start_date, end_date, status_filter)
-        enriched_pages = []
+        return list(
+            self.iter_daily_logs_with_content(start_date, end_date, status_filter, page_size)
+        )
 
-        for page in pages:
-            page_id = page.get("id")
-            if not page_id:
-                continue
-            content = self.get_page_content(page_id)
-            enriched_pages.append({**page, "content": content})
+    def iter_daily_logs_with_content(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_filter: str | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        일일 로그를 쿼리 페이지 단위로 받아 본문을 채운 뒤 한 건씩 반환
 
-        return enriched_pages
+        전체 기간을 메모리에 모으지 않고 page_size 만큼씩 본문을 병렬 조회한다.
+
+        Args:
+            start_date: 시작 날짜(포함)
+            end_date: 종료 날짜(포함)
+            status_filter: 상태 필터 (선택)
+            page_size: 쿼리 요청당 결과 수 (선택)
+
+        Yields:
+            properties와 content 키를 포함하는 로그
+        """
+        pages = self.iter_daily_logs(start_date, end_date, status_filter, page_size)
+        batch_size = page_size or DEFAULT_PAGE_SIZE
+
+        while batch := list(islice(pages, batch_size)):
+            yield from self._enrich_with_content(batch)
 
     def get_daily_logs(
-        self, start_date: datetime, end_date: datetime, status_filter: str | None = None
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_filter: str | None = None,
+        page_size: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         특정 기간의 일일 로그를 조회
@@ -252,10 +585,32 @@ class NotionClientWrapper:
             start_date: 시작 날짜(포함)
             end_date: 종료 날짜(포함)
             status_filter: 상태 필터 (선택)
+            page_size: 쿼리 요청당 결과 수 (선택)
 
         Returns:
             조건에 맞는 페이지 객체 리스트
         """
+        return list(self.iter_daily_logs(start_date, end_date, status_filter, page_size))
+
+    def iter_daily_logs(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_filter: str | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        특정 기간의 일일 로그를 커서를 따라가며 한 건씩 조회
+
+        Args:
+            start_date: 시작 날짜(포함)
+            end_date: 종료 날짜(포함)
+            status_filter: 상태 필터 (선택)
+            page_size: 쿼리 요청당 결과 수 (선택)
+
+        Yields:
+            조건에 맞는 페이지 객체
+        """
         filter_conditions = {
             "and": [
                 {
@@ -274,35 +629,93 @@ class NotionClientWrapper:
                 {"property": "Status", "select": {"equals": status_filter}}
             )
 
-        results = self.client.databases.query(
+        yield from self._iter_paginated(
+            self.client.databases.query,
+            page_size=page_size,
             database_id=self.daily_logs_db,
             filter=filter_conditions,
             sorts=[{"property": "Logged Date", "direction": "ascending"}],
         )
 
-        return results.get("results", [])
-
-    def get_page_content(self, page_id: str) -> str:
+    def _list_block_children(self, block_id: str) -> list[dict[str, Any]]:
+        """블록(또는 페이지)의 직계 자식 블록을 모든 페이지에 걸쳐 조회"""
+        with self._children_slots:
+            return list(self._iter_paginated(self.client.blocks.children.list, block_id=block_id))
+
+    @staticmethod
+    def _children_source(block: dict[str, Any]) -> str:
+        """자식 블록을 조회할 ID (동기화 블록 사본은 원본 블록 ID)"""
+        if block.get("type") == "synced_block":
+            synced_from = block.get("synced_block", {}).get("synced_from") or {}
+            if synced_from.get("block_id"):
+                return synced_from["block_id"]
+        return block["id"]
+
+    def _fetch_block_tree(self, page_id: str) -> dict[str, list[dict[str, Any]]]:
         """
-        Notion 페이지의 블록 콘텐츠를 문자열로 변환
+        페이지의 블록 트리를 깊이별로 조회해 블록 ID → 자식 블록 리스트 메모를 만듦
+
+        같은 깊이의 자식 조회는 max_concurrency 안에서 병렬로 보내고, 이미 조회한
+        블록(같은 원본을 가리키는 동기화 블록 등)은 다시 요청하지 않는다.
 
         Args:
             page_id: Notion 페이지 ID
 
         Returns:
-            페이지 내 텍스트 블록을 줄바꿈으로 이어 붙인 문자열
+            블록(페이지) ID를 키로 한 자식 블록 리스트 dict
+        """
+        memo = {page_id: self._list_block_children(page_id)}
+        level = memo[page_id]
+
+        for _ in range(self.max_block_depth):
+            parents = [block for block in level if block.get("has_children")]
+            pending = list(
+                dict.fromkeys(
+                    source for source in map(self._children_source, parents) if source not in memo
+                )
+            )
+            if len(pending) == 1:
+                memo[pending[0]] = self._list_block_children(pending[0])
+            elif pending:
+                workers = min(self.max_concurrency, len(pending))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="notion-blocks"
+                ) as executor:
+                    memo.update(
+                        zip(
+                            pending,
+                            executor.map(self._list_block_children, pending),
+                            strict=True,
+                        )
+                    )
+
+            level = [
+                child for block in parents for child in memo.get(self._children_source(block), [])
+            ]
+            if not level:
+                break
+
+        return memo
+
+    def get_page_content(self, page_id: str) -> str:
         """
-        blocks = self.client.blocks.children.list(block_id=page_id)
-        content_parts = []
+        Notion 페이지의 블록 트리를 마크다운 문자열로 변환
 
-        for block in blocks.get("results", []):
-            block_type = block.get("type")
-            if block_type in ["paragraph", "heading_1", "heading_2", "heading_3"]:
-                rich_text = block.get(block_type, {}).get("rich_text", [])
-                for text_obj in rich_text:
-                    content_parts.append(text_obj.get("text", {}).get("content", ""))
+        목록, 할 일, 코드, 인용, 토글 등 지원하는 모든 블록 종류와 중첩된
+        자식 블록을 NOTION_MAX_BLOCK_DEPTH 깊이까지 따라가며 복원한다.
 
-        return "\n".join(content_parts)
+        Args:
+            page_id: Notion 페이지 ID
+
+        Returns:
+            페이지 본문을 마크다운으로 복원한 문자열
+        """
+        memo = self._fetch_block_tree(page_id)
+        return blocks_to_markdown(
+            memo[page_id],
+            lambda block: memo.get(self._children_source(block), []),
+            self.max_block_depth,
+        )
 
     def update_log_status(self, page_id: str, status: str) -> dict[str, Any]:
         """
@@ -315,8 +728,10 @@ class NotionClientWrapper:
         Returns:
             갱신된 페이지 객체
         """
-        return self.client.pages.update(
-            page_id=page_id, properties={"Status": {"select": {"name": status}}}
+        return self._request(
+            self.client.pages.update,
+            page_id=page_id,
+            properties={"Status": {"select": {"name": status}}},
         )
 
     def create_weekly_achievement(
@@ -349,40 +764,26 @@ class NotionClientWrapper:
             "Title": {"title": [{"text": {"content": title}}]},
             "Period Start": {"date": {"start": period_start.isoformat()}},
             "Period End": {"date": {"start": period_end.isoformat()}},
-            "Key Highlights": {"rich_text": [{"text": {"content": key_highlights}}]},
+            "Key Highlights": {"rich_text": plain_rich_text(key_highlights)},
             "Generated At": {"date": {"start": datetime.now().isoformat()}},
             "Source Logs": {"relation": [{"id": log_id} for log_id in source_log_ids]},
         }
 
-        page = self.client.pages.create(
-            parent={"database_id": self.weekly_db},
-            properties=properties,
-            children=[
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": "🎯 주간 성과 요약"}}
-                        ]
-                    },
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": bullet_points}}
-                        ]
-                    },
+        children = [
+            {
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {
+                    "rich_text": [{"type": "text", "text": {"content": "🎯 주간 성과 요약"}}]
                 },
-            ],
-        )
+            },
+            *text_blocks("paragraph", bullet_points),
+        ]
 
-        return page
+        return self._create_page(self.weekly_db, properties, children)
 
     def get_weekly_achievements_with_content(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: datetime, end_date: datetime, page_size: int | None = None
     ) -> list[dict[str, Any]]:
         """
         주어진 기간의 주간 성과 페이지와 본문을 조회
@@ -390,10 +791,28 @@ class NotionClientWrapper:
         Args:
             start_date: 시작 날짜(포함)
             end_date: 종료 날짜(포함)
+            page_size: 쿼리 요청당 결과 수 (선택)
 
         Returns:
             properties와 content 키를 포함한 주간 성과 리스트
         """
+        pages = self.iter_weekly_achievements(start_date, end_date, page_size)
+        return self._enrich_with_content(list(pages))
+
+    def iter_weekly_achievements(
+        self, start_date: datetime, end_date: datetime, page_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        주어진 기간의 주간 성과 페이지를 커서를 따라가며 한 건씩 조회
+
+        Args:
+            start_date: 시작 날짜(포함)
+            end_date: 종료 날짜(포함)
+            page_size: 쿼리 요청당 결과 수 (선택)
+
+        Yields:
+            조건에 맞는 주간 성과 페이지 객체
+        """
         if not self.weekly_db:
             raise ValueError("NOTION_DB2_ID not configured")
 
@@ -410,21 +829,51 @@ class NotionClientWrapper:
             ]
         }
 
-        results = self.client.databases.query(
+        yield from self._iter_paginated(
+            self.client.databases.query,
+            page_size=page_size,
             database_id=self.weekly_db,
             filter=filter_conditions,
             sorts=[{"property": "Period Start", "direction": "ascending"}],
         )
 
-        enriched_pages = []
-        for page in results.get("results", []):
-            page_id = page.get("id")
-            if not page_id:
-                continue
-            content = self.get_page_content(page_id)
-            enriched_pages.append({**page, "content": content})
+    def iter_monthly_highlights(
+        self, start_date: datetime, end_date: datetime, page_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        주어진 기간의 월간 하이라이트 페이지를 커서를 따라가며 한 건씩 조회
 
-        return enriched_pages
+        Args:
+            start_date: 시작 날짜(포함)
+            end_date: 종료 날짜(포함)
+            page_size: 쿼리 요청당 결과 수 (선택)
+
+        Yields:
+            Year-Month가 기간 안에 있는 월간 하이라이트 페이지 객체
+        """
+        if not self.monthly_db:
+            raise ValueError("NOTION_DB3_ID not configured")
+
+        filter_conditions = {
+            "and": [
+                {
+                    "property": "Year-Month",
+                    "date": {"on_or_after": start_date.isoformat()},
+                },
+                {
+                    "property": "Year-Month",
+                    "date": {"on_or_before": end_date.isoformat()},
+                },
+            ]
+        }
+
+        yield from self._iter_paginated(
+            self.client.databases.query,
+            page_size=page_size,
+            database_id=self.monthly_db,
+            filter=filter_conditions,
+            sorts=[{"property": "Year-Month", "direction": "ascending"}],
+        )
 
     def create_monthly_highlight(
         self,
@@ -462,51 +911,26 @@ class NotionClientWrapper:
             "Source Weeks": {
                 "relation": [{"id": week_id} for week_id in source_week_ids]
             },
-            "Stats": {"rich_text": [{"text": {"content": stats_text}}]},
+            "Stats": {"rich_text": plain_rich_text(stats_text)},
         }
 
-        page = self.client.pages.create(
-            parent={"database_id": self.monthly_db},
-            properties=properties,
-            children=[
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": "📈 월간 종합 성과"}}
-                        ]
-                    },
-                },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": summary}}]
-                    },
-                },
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {"content": "🧾 경력기술서용 요약"},
-                            }
-                        ]
-                    },
+        children = [
+            {
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {
+                    "rich_text": [{"type": "text", "text": {"content": "📈 월간 종합 성과"}}]
                 },
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {"type": "text", "text": {"content": career_brief}}
-                        ]
-                    },
+            },
+            *text_blocks("paragraph", summary),
+            {
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {
+                    "rich_text": [{"type": "text", "text": {"content": "🧾 경력기술서용 요약"}}]
                 },
-            ],
-        )
+            },
+            *text_blocks("paragraph", career_brief),
+        ]
 
-        return page
+        return self._create_page(self.monthly_db, properties, children)
@@ -0,0 +1,586 @@
+"""
+오프라인 벤치마크/테스트용 인메모리 Notion API 에뮬레이터
+
+NotionClientWrapper가 사용하는 SDK 메서드(pages.create/update, databases.query,
+blocks.children.list/append)를 같은 이름과 응답 형식으로 구현한다. 커서 기반
+페이지네이션, 요청당 children 100개·블록 1000개·중첩 2단계 제한, 서버 측 속도
+제한(429 + Retry-After), 지연/지터를 흉내 내며, 시드를 고정하면 같은 입력에 같은
+결과(페이지 ID, 지연, 429 발생 위치)를 낸다.
+
+사용 예시:
+    emulator = NotionEmulator(latency=0.05, jitter=0.02, rate_limit=3.0, seed=7)
+    emulator.add_database("daily-db")
+    emulator.populate_daily_logs("daily-db", count=1000)
+    notion = NotionClientWrapper(client=emulator, settings=Settings(notion_daily_db="daily-db"))
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, timedelta
+from functools import partial
+from typing import Any
+
+# Notion API 요청 제한 (블록 추가/페이지 생성 1회 기준)
+MAX_PAGE_SIZE = 100
+MAX_CHILDREN_PER_REQUEST = 100
+MAX_BLOCKS_PER_REQUEST = 1000
+MAX_NESTING_PER_REQUEST = 2
+
+# 속성 값에서 타입 키가 아닌 키
+_PROPERTY_META_KEYS = ("id", "type")
+
+
+class EmulatedAPIError(Exception):
+    """Notion SDK의 APIResponseError와 같은 속성(status, code, headers)을 갖는 오류"""
+
+    def __init__(self, status: int, code: str, message: str, headers: dict | None = None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.headers = headers or {}
+
+
+class _Endpoint:
+    def __init__(self, emulator: "NotionEmulator"):
+        self._emulator = emulator
+
+
+class PagesEndpoint(_Endpoint):
+    """pages.* 엔드포인트"""
+
+    def create(self, **kwargs: Any) -> dict[str, Any]:
+        return self._emulator._call("pages.create", self._emulator._create_page, kwargs)
+
+    def update(self, **kwargs: Any) -> dict[str, Any]:
+        return self._emulator._call("pages.update", self._emulator._update_page, kwargs)
+
+
+class DatabasesEndpoint(_Endpoint):
+    """databases.* 엔드포인트"""
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        return self._emulator._call("databases.query", self._emulator._query_database, kwargs)
+
+
+class BlocksChildrenEndpoint(_Endpoint):
+    """blocks.children.* 엔드포인트"""
+
+    def list(self, **kwargs: Any) -> dict[str, Any]:
+        return self._emulator._call("blocks.children.list", self._emulator._list_children, kwargs)
+
+    def append(self, **kwargs: Any) -> dict[str, Any]:
+        return self._emulator._call(
+            "blocks.children.append", self._emulator._append_children, kwargs
+        )
+
+
+class BlocksEndpoint(_Endpoint):
+    """blocks.* 엔드포인트"""
+
+    def __init__(self, emulator: "NotionEmulator"):
+        super().__init__(emulator)
+        self.children = BlocksChildrenEndpoint(emulator)
+
+
+class NotionEmulator:
+    """Notion SDK Client 대신 NotionClientWrapper에 주입하는 인메모리 구현"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: float | None = None,
+        burst: int = 10,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            latency: 요청당 기본 응답 지연(초)
+            jitter: 지연에 더하거나 빼는 최대 편차(초, 균등 분포)
+            rate_limit: 서버 측 초당 허용 요청 수 (None이면 제한 없음)
+            burst: 속도 제한 버킷 크기
+            error_rate: 속도 제한과 별개로 429를 돌려줄 확률 (0~1)
+            seed: 페이지 ID, 지터, 429 주입에 쓰는 난수 시드
+            sleep: 지연을 흉내 낼 함수 (테스트에서 대기 없이 돌릴 때 교체)
+            clock: 속도 제한 버킷에 쓰는 단조 시계
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.error_rate = error_rate
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._now = datetime(2025, 1, 1, tzinfo=UTC)
+
+        self.databases_rows: dict[str, list[str]] = {}
+        self.pages_by_id: dict[str, dict[str, Any]] = {}
+        self.blocks_by_id: dict[str, dict[str, Any]] = {}
+        self.children_ids: dict[str, list[str]] = {}
+        # 커서를 따라 같은 조건으로 반복되는 쿼리의 필터/정렬 결과 (쓰기 시 비움)
+        self._query_results: dict[str, list[dict[str, Any]]] = {}
+
+        self.calls: Counter[str] = Counter()
+        self.rate_limited = 0
+
+        self.pages = PagesEndpoint(self)
+        self.databases = DatabasesEndpoint(self)
+        self.blocks = BlocksEndpoint(self)
+
+    def close(self):
+        """SDK Client.close와 같은 인터페이스 (정리할 연결 없음)"""
+
+    def add_database(self, database_id: str):
+        """빈 데이터베이스를 등록"""
+        with self._lock:
+            self.databases_rows.setdefault(database_id, [])
+
+    def seed_pages(self, database_id: str, pages: Iterable[dict[str, Any]]) -> list[str]:
+        """
+        페이지 fixture를 요청 제한/지연 없이 데이터베이스에 적재
+
+        Args:
+            database_id: 대상 데이터베이스 ID
+            pages: properties와 선택적 children(블록 리스트), id, last_edited_time을
+                갖는 dict
+
+        Returns:
+            적재한 페이지 ID 리스트
+        """
+        self.add_database(database_id)
+        page_ids = []
+        with self._lock:
+            for fixture in pages:
+                page = self._store_page(
+                    {"database_id": database_id},
+                    fixture.get("properties", {}),
+                    fixture.get("id"),
+                    fixture.get("last_edited_time"),
+                )
+                self._store_blocks(page["id"], fixture.get("children", []))
+                page_ids.append(page["id"])
+        return page_ids
+
+    def populate_daily_logs(
+        self,
+        database_id: str,
+        count: int,
+        start: date = date(2025, 1, 6),
+        blocks_per_page: int = 6,
+    ) -> list[str]:
+        """
+        일일 로그 데이터베이스를 count건의 단순한 페이지로 채움 (하루 3건씩)
+
+        Args:
+            database_id: 대상 데이터베이스 ID
+            count: 만들 페이지 수
+            start: 첫 로그 날짜
+            blocks_per_page: 페이지당 본문 블록 수
+
+        Returns:
+            적재한 페이지 ID 리스트
+        """
+        categories = ("성능개선", "신규기능", "버그수정", "리팩토링", "인프라")
+        impacts = ("High", "Medium", "Low")
+
+        def fixtures() -> Iterable[dict[str, Any]]:
+            for idx in range(count):
+                logged = start + timedelta(days=idx // 3)
+                paragraphs = [
+                    _paragraph_block(f"로그 {idx} 본문 {line}: 처리 결과와 지표 정리")
+                    for line in range(blocks_per_page)
+                ]
+                yield {
+                    "properties": {
+                        "Title": {"title": [{"text": {"content": f"업무 {idx}"}}]},
+                        "Logged Date": {"date": {"start": logged.isoformat()}},
+                        "Category": {"select": {"name": categories[idx % 5]}},
+                        "Impact Level": {"select": {"name": impacts[idx % 3]}},
+                        "Status": {"select": {"name": "Logged"}},
+                        "Tech Stack": {"multi_select": [{"name": "Python"}, {"name": "Notion"}]},
+                    },
+                    "children": paragraphs,
+                }
+
+        return self.seed_pages(database_id, fixtures())
+
+    def _call(
+        self,
+        endpoint: str,
+        handler: Callable[[dict[str, Any]], dict[str, Any]],
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        with self._lock:
+            self.calls[endpoint] += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-1, 1) * self.jitter)
+            retry_after = self._take_token()
+            if retry_after is None and self._rng.random() < self.error_rate:
+                retry_after = 0.0
+            if retry_after is not None:
+                self.rate_limited += 1
+
+        if delay:
+            self._sleep(delay)
+        if retry_after is not None:
+            raise EmulatedAPIError(
+                429,
+                "rate_limited",
+                "Rate limited",
+                headers={"Retry-After": f"{retry_after:.3f}"},
+            )
+
+        with self._lock:
+            return handler(kwargs)
+
+    def _take_token(self) -> float | None:
+        """서버 측 토큰 버킷에서 하나를 꺼냄 (부족하면 재시도까지 남은 초)"""
+        if self.rate_limit is None:
+            return None
+        now = self._clock()
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._refilled_at) * self.rate_limit,
+        )
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    def _timestamp(self) -> str:
+        """요청마다 1초씩 증가하는 결정적 타임스탬프"""
+        self._now += timedelta(seconds=1)
+        return self._now.isoformat().replace("+00:00", ".000Z")
+
+    def _new_id(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _store_page(
+        self,
+        parent: dict[str, Any],
+        properties: dict[str, Any],
+        page_id: str | None = None,
+        edited_time: str | None = None,
+    ) -> dict[str, Any]:
+        page_id = page_id or self._new_id()
+        timestamp = edited_time or self._timestamp()
+        page = {
+            "object": "page",
+            "id": page_id,
+            "created_time": timestamp,
+            "last_edited_time": timestamp,
+            "parent": {"type": next(iter(parent)), **parent},
+            "archived": False,
+            "properties": _normalize_properties(properties),
+            "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+        }
+        self.pages_by_id[page_id] = page
+        self.children_ids.setdefault(page_id, [])
+        self._query_results.clear()
+        if "database_id" in parent:
+            self.databases_rows.setdefault(parent["database_id"], []).append(page_id)
+        return page
+
+    def _create_page(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        parent = kwargs.get("parent") or {}
+        database_id = parent.get("database_id")
+        if database_id is not None and database_id not in self.databases_rows:
+            raise _not_found(database_id)
+        if database_id is None and parent.get("page_id") not in self.pages_by_id:
+            raise _not_found(parent.get("page_id"))
+
+        children = kwargs.get("children") or []
+        _validate_children(children)
+        page = self._store_page(parent, kwargs.get("properties") or {})
+        self._store_blocks(page["id"], children)
+        return _copy(page)
+
+    def _update_page(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        page = self.pages_by_id.get(kwargs.get("page_id", ""))
+        if page is None:
+            raise _not_found(kwargs.get("page_id"))
+        page["properties"].update(_normalize_properties(kwargs.get("properties") or {}))
+        if "archived" in kwargs:
+            page["archived"] = bool(kwargs["archived"])
+        page["last_edited_time"] = self._timestamp()
+        self._query_results.clear()
+        return _copy(page)
+
+    def _query_database(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        database_id = kwargs.get("database_id", "")
+        if database_id not in self.databases_rows:
+            raise _not_found(database_id)
+
+        key = json.dumps([database_id, kwargs.get("filter"), kwargs.get("sorts")], sort_keys=True)
+        pages = self._query_results.get(key)
+        if pages is None:
+            pages = [
+                self.pages_by_id[page_id]
+                for page_id in self.databases_rows[database_id]
+                if not self.pages_by_id[page_id]["archived"]
+            ]
+            if kwargs.get("filter"):
+                pages = [page for page in pages if _matches(page, kwargs["filter"])]
+            for sort in reversed(kwargs.get("sorts") or []):
+                pages.sort(
+                    key=partial(_sort_value, sort=sort),
+                    reverse=sort.get("direction") == "descending",
+                )
+            self._query_results[key] = pages
+        return _paginate(pages, kwargs)
+
+    def _store_blocks(self, parent_id: str, children: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """블록 트리를 저장하고 최상위 블록 객체 리스트를 반환"""
+        stored = []
+        for child in children:
+            block_type = child["type"]
+            content = dict(child.get(block_type) or {})
+            nested = content.pop("children", None) or child.get("children") or []
+            if "rich_text" in content:
+                content["rich_text"] = _normalize_rich_text(content["rich_text"])
+            block_id = child.get("id") or self._new_id()
+            timestamp = self._timestamp()
+            block = {
+                "object": "block",
+                "id": block_id,
+                "parent": _parent_ref(parent_id, self.pages_by_id),
+                "created_time": timestamp,
+                "last_edited_time": timestamp,
+                "has_children": bool(nested),
+                "archived": False,
+                "type": block_type,
+                block_type: content,
+            }
+            self.blocks_by_id[block_id] = block
+            self.children_ids.setdefault(parent_id, []).append(block_id)
+            self.children_ids.setdefault(block_id, [])
+            if nested:
+                self._store_blocks(block_id, nested)
+            stored.append(block)
+        return stored
+
+    def _list_children(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        block_id = kwargs.get("block_id", "")
+        if block_id not in self.children_ids:
+            raise _not_found(block_id)
+        blocks = [self.blocks_by_id[child_id] for child_id in self.children_ids[block_id]]
+        return _paginate(blocks, kwargs)
+
+    def _append_children(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        block_id = kwargs.get("block_id", "")
+        if block_id not in self.children_ids:
+            raise _not_found(block_id)
+        children = kwargs.get("children") or []
+        _validate_children(children)
+        stored = self._store_blocks(block_id, children)
+        if block_id in self.blocks_by_id:
+            self.blocks_by_id[block_id]["has_children"] = True
+        return {"object": "list", "results": [_copy(block) for block in stored]}
+
+
+def _paragraph_block(text: str) -> dict[str, Any]:
+    return {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+
+
+def _copy(value: Any) -> Any:
+    """응답을 호출자가 수정해도 저장된 값이 바뀌지 않도록 복사 (JSON 구조 전용)"""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _not_found(object_id: Any) -> EmulatedAPIError:
+    return EmulatedAPIError(404, "object_not_found", f"Could not find object with ID: {object_id}")
+
+
+def _parent_ref(parent_id: str, pages: dict[str, Any]) -> dict[str, str]:
+    if parent_id in pages:
+        return {"type": "page_id", "page_id": parent_id}
+    return {"type": "block_id", "block_id": parent_id}
+
+
+def _normalize_rich_text(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """응답처럼 type, plain_text, annotations 키를 채움"""
+    normalized = []
+    for item in items:
+        text = item.get("text") or {}
+        normalized.append(
+            {
+                "type": "text",
+                "annotations": {},
+                **item,
+                "plain_text": text.get("content", item.get("plain_text", "")),
+                "href": (text.get("link") or {}).get("url"),
+            }
+        )
+    return normalized
+
+
+def _normalize_properties(properties: dict[str, Any]) -> dict[str, Any]:
+    normalized = {}
+    for name, value in properties.items():
+        value = _copy(value)
+        prop_type = next(
+            (key for key in value if key not in _PROPERTY_META_KEYS), value.get("type")
+        )
+        value["type"] = prop_type
+        if prop_type in ("title", "rich_text"):
+            value[prop_type] = _normalize_rich_text(value[prop_type])
+        normalized[name] = value
+    return normalized
+
+
+def _validate_children(children: list[dict[str, Any]]):
+    """요청당 children 수, 전체 블록 수, 중첩 깊이 제한 검사"""
+    total = 0
+
+    def walk(blocks: list[dict[str, Any]], depth: int):
+        nonlocal total
+        if len(blocks) > MAX_CHILDREN_PER_REQUEST:
+            raise EmulatedAPIError(
+                400,
+                "validation_error",
+                f"body.children.length should be ≤ {MAX_CHILDREN_PER_REQUEST}, "
+                f"instead was {len(blocks)}.",
+            )
+        for block in blocks:
+            total += 1
+            nested = (block.get(block.get("type", "")) or {}).get("children") or []
+            if nested:
+                if depth >= MAX_NESTING_PER_REQUEST:
+                    raise EmulatedAPIError(
+                        400,
+                        "validation_error",
+                        f"body.children nesting exceeds {MAX_NESTING_PER_REQUEST} levels.",
+                    )
+                walk(nested, depth + 1)
+
+    walk(children, 0)
+    if total > MAX_BLOCKS_PER_REQUEST:
+        raise EmulatedAPIError(
+            400,
+            "validation_error",
+            f"Request includes {total} blocks; limit is {MAX_BLOCKS_PER_REQUEST}.",
+        )
+
+
+def _paginate(results: list[dict[str, Any]], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """start_cursor/page_size에 맞춰 목록 응답을 자르고 잘린 구간만 복사 (커서 = 다음 항목 ID)"""
+    page_size = kwargs.get("page_size") or MAX_PAGE_SIZE
+    if page_size > MAX_PAGE_SIZE:
+        raise EmulatedAPIError(400, "validation_error", f"page_size should be ≤ {MAX_PAGE_SIZE}.")
+
+    start = 0
+    cursor = kwargs.get("start_cursor")
+    if cursor:
+        ids = [item["id"] for item in results]
+        if cursor not in ids:
+            raise EmulatedAPIError(400, "validation_error", "Invalid start_cursor.")
+        start = ids.index(cursor)
+
+    window = results[start : start + page_size]
+    has_more = start + page_size < len(results)
+    return {
+        "object": "list",
+        "results": [_copy(item) for item in window],
+        "has_more": has_more,
+        "next_cursor": results[start + page_size]["id"] if has_more else None,
+    }
+
+
+def _property_value(page: dict[str, Any], name: str) -> Any:
+    """필터/정렬에 쓰는 속성 값 (date는 start, select는 name, 제목은 평문)"""
+    prop = page["properties"].get(name) or {}
+    prop_type = prop.get("type")
+    value = prop.get(prop_type) if prop_type else None
+    if prop_type == "date":
+        return (value or {}).get("start")
+    if prop_type in ("select", "status"):
+        return (value or {}).get("name")
+    if prop_type == "multi_select":
+        return [option.get("name") for option in value or []]
+    if prop_type in ("title", "rich_text"):
+        return "".join(item.get("plain_text", "") for item in value or [])
+    return value
+
+
+def _compare(value: Any, condition: dict[str, Any]) -> bool:
+    """equals, before, after, on_or_before, on_or_after, contains, is_empty 조건 평가"""
+    for operator, expected in condition.items():
+        if operator == "is_empty":
+            return (value in (None, "", [])) == bool(expected)
+        if operator == "is_not_empty":
+            return (value not in (None, "", [])) == bool(expected)
+        if value is None:
+            return False
+        if operator == "contains":
+            return expected in value
+        if operator == "does_not_contain":
+            return expected not in value
+
+        # 한쪽이 날짜만 있는 값이면 양쪽 모두 시각을 떼고 날짜 단위로 비교
+        if _is_iso_date(value) and _is_iso_date(expected):
+            if min(len(value), len(expected)) == 10:
+                value, expected = value[:10], expected[:10]
+        checks = {
+            "equals": value == expected,
+            "does_not_equal": value != expected,
+            "before": value < expected,
+            "after": value > expected,
+            "on_or_before": value <= expected,
+            "on_or_after": value >= expected,
+        }
+        if operator not in checks:
+            raise EmulatedAPIError(
+                400, "validation_error", f"Unsupported filter operator: {operator}"
+            )
+        return checks[operator]
+    return True
+
+
+def _is_iso_date(value: Any) -> bool:
+    return isinstance(value, str) and len(value) >= 10 and value[4] == "-" == value[7]
+
+
+def _matches(page: dict[str, Any], condition: dict[str, Any]) -> bool:
+    """Notion 필터 객체(and/or 복합 조건, 속성/타임스탬프 조건) 평가"""
+    if "and" in condition:
+        return all(_matches(page, item) for item in condition["and"])
+    if "or" in condition:
+        return any(_matches(page, item) for item in condition["or"])
+    if "timestamp" in condition:
+        name = condition["timestamp"]
+        return _compare(page.get(name), condition[name])
+    value = _property_value(page, condition["property"])
+    operator_key = next(key for key in condition if key != "property")
+    return _compare(value, condition[operator_key])
+
+
+def _sort_value(page: dict[str, Any], sort: dict[str, Any]) -> tuple[bool, Any]:
+    """정렬 키 (값이 없는 페이지는 방향과 관계없이 뒤로 보냄)"""
+    if "timestamp" in sort:
+        value = page.get(sort["timestamp"])
+    else:
+        value = _property_value(page, sort["property"])
+    missing = value is None
+    if sort.get("direction") == "descending":
+        missing = not missing
+    return (missing, value or "")
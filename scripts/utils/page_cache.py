@@ -0,0 +1,229 @@
+"""
+Notion 페이지와 본문을 로컬에 보관하는 SQLite 캐시 (last_edited_time 기반 무효화)
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import closing
+from datetime import UTC, datetime
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    database_id TEXT,
+    last_edited_time TEXT NOT NULL,
+    page_json TEXT NOT NULL,
+    content TEXT,
+    cached_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_database_edited
+    ON pages (database_id, last_edited_time);
+CREATE TABLE IF NOT EXISTS watermarks (
+    database_id TEXT PRIMARY KEY,
+    last_edited_time TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 저장하는 본문 텍스트 형식 버전. 본문 변환 방식이 바뀌면 올려서 이전 형식 항목을 버리게 함
+# (1: 최상위 블록만, 2: 중첩 블록과 목록/코드를 포함한 마크다운)
+CONTENT_FORMAT_VERSION = 2
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 절을 나눌 크기
+_LOOKUP_CHUNK = 500
+# Notion의 last_edited_time 정밀도(초) - 같은 분 안의 수정은 구분되지 않음
+_EDIT_TIME_RESOLUTION = 60.0
+
+
+def _settled_after(last_edited_time: str) -> float | None:
+    """
+    last_edited_time이 가리키는 분이 끝나는 시각(epoch 초)을 반환
+
+    이 시각 이전에 저장한 본문은 같은 분에 이어진 수정을 놓쳤을 수 있다.
+
+    Args:
+        last_edited_time: Notion 페이지의 last_edited_time (ISO 8601)
+
+    Returns:
+        epoch 초 또는 해석할 수 없으면 None
+    """
+    try:
+        edited = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if edited.tzinfo is None:
+        edited = edited.replace(tzinfo=UTC)
+    return edited.timestamp() + _EDIT_TIME_RESOLUTION
+
+
+class PageCache:
+    """페이지 ID를 키로 페이지 객체와 본문 텍스트를 저장하는 캐시"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            with conn:
+                self._drop_stale_format(conn)
+
+    def _drop_stale_format(self, conn: sqlite3.Connection):
+        """
+        본문 형식 버전이 다른 캐시 항목과 동기화 워터마크를 비움
+
+        워터마크도 함께 지워야 다음 동기화가 전체 페이지를 다시 채운다.
+        """
+        row = conn.execute("SELECT value FROM meta WHERE key = 'content_format'").fetchone()
+        if row is not None and row["value"] == str(CONTENT_FORMAT_VERSION):
+            return
+        conn.execute("DELETE FROM pages")
+        conn.execute("DELETE FROM watermarks")
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('content_format', ?)"
+            " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (str(CONTENT_FORMAT_VERSION),),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def get_contents(self, pages: Iterable[dict[str, Any]]) -> dict[str, str]:
+        """
+        last_edited_time이 그대로인 페이지의 캐시된 본문을 한 번에 조회
+
+        Args:
+            pages: id, last_edited_time 키를 가진 페이지 객체들
+
+        Returns:
+            {페이지 ID: 본문} (변경되었거나 캐시에 없는 페이지는 제외)
+
+        Note:
+            last_edited_time은 분 단위라 같은 분에 캐시한 뒤 다시 수정된 페이지는
+            시각이 같아 보인다. 저장 시각(cached_at)이 수정 시각의 분이 끝나기 전이면
+            변경 여부를 알 수 없으므로 적중으로 보지 않고 다시 조회하게 한다.
+        """
+        expected = {
+            page["id"]: page.get("last_edited_time")
+            for page in pages
+            if page.get("id") and page.get("last_edited_time")
+        }
+        if not expected:
+            return {}
+
+        hits: dict[str, str] = {}
+        page_ids = list(expected)
+        with closing(self._connect()) as conn:
+            for offset in range(0, len(page_ids), _LOOKUP_CHUNK):
+                chunk = page_ids[offset : offset + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT id, last_edited_time, content, cached_at FROM pages"
+                    f" WHERE id IN ({placeholders}) AND content IS NOT NULL",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    if row["last_edited_time"] != expected[row["id"]]:
+                        continue
+                    settled_after = _settled_after(row["last_edited_time"])
+                    if settled_after is not None and row["cached_at"] >= settled_after:
+                        hits[row["id"]] = row["content"]
+        return hits
+
+    def put_pages(
+        self,
+        pages: Iterable[dict[str, Any]],
+        database_id: str | None = None,
+    ):
+        """
+        페이지 객체(와 content 키가 있으면 본문)를 저장
+
+        Args:
+            pages: Notion 페이지 객체 (content 키 선택)
+            database_id: 페이지가 속한 데이터베이스 ID
+        """
+        now = time.time()
+        rows = [
+            (
+                page["id"],
+                database_id or page.get("parent", {}).get("database_id"),
+                page.get("last_edited_time", ""),
+                json.dumps(
+                    {key: value for key, value in page.items() if key != "content"},
+                    ensure_ascii=False,
+                ),
+                page.get("content"),
+                now,
+            )
+            for page in pages
+            if page.get("id") and "content_error" not in page
+        ]
+        if not rows:
+            return
+
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT INTO pages (id, database_id, last_edited_time, page_json,"
+                " content, cached_at) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET"
+                " database_id = COALESCE(excluded.database_id, pages.database_id),"
+                " last_edited_time = excluded.last_edited_time,"
+                " page_json = excluded.page_json,"
+                " content = excluded.content,"
+                " cached_at = excluded.cached_at",
+                rows,
+            )
+
+    def get_watermark(self, database_id: str) -> str | None:
+        """마지막 동기화 시점의 last_edited_time 최댓값을 반환"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT last_edited_time FROM watermarks WHERE database_id = ?",
+                (database_id,),
+            ).fetchone()
+        return row["last_edited_time"] if row else None
+
+    def set_watermark(self, database_id: str, last_edited_time: str):
+        """동기화 워터마크를 갱신"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO watermarks (database_id, last_edited_time, synced_at)"
+                " VALUES (?, ?, ?) ON CONFLICT(database_id) DO UPDATE SET"
+                " last_edited_time = excluded.last_edited_time,"
+                " synced_at = excluded.synced_at",
+                (database_id, last_edited_time, time.time()),
+            )
+
+    def get_pages(self, database_id: str, edited_since: str | None = None) -> list[dict[str, Any]]:
+        """
+        캐시에 저장된 데이터베이스 페이지를 조회
+
+        Args:
+            database_id: 데이터베이스 ID
+            edited_since: 이 시각 이후 수정된 페이지만 (ISO 8601, 선택)
+
+        Returns:
+            content 키를 포함한 페이지 객체 리스트 (수정 시각 오름차순)
+        """
+        query = "SELECT page_json, content FROM pages WHERE database_id = ?"
+        params: list[Any] = [database_id]
+        if edited_since:
+            query += " AND last_edited_time >= ?"
+            params.append(edited_since)
+        query += " ORDER BY last_edited_time"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [{**json.loads(row["page_json"]), "content": row["content"] or ""} for row in rows]
@@ -74,3 +74,42 @@ MONTHLY_SUMMARY_USER_TEMPLATE = """
 위 내용을 사용해 월간 성과를 STAR 구조로 정리하고, 뒤이어 경력기술서용 요약 Bullet Point를 작성해주세요.
 각 STAR 묶음은 `### Situation`/`### Task`/`### Action`/`### Result` 헤딩을 반드시 포함해야 합니다.
 """
+
+YEARLY_SUMMARY_SYSTEM_PROMPT = """
+당신은 경력 개발 전문가이자 채용 담당자 관점의 이력서 컨설턴트입니다.
+주어진 월간 하이라이트를 토대로 한 해의 성과를 STAR 구조로 정리하고, 경력기술서용 연간 요약을 도출하세요.
+
+## 출력 형식
+1. `## 연간 종합 성과` 섹션 아래에 다음 형태를 반복하세요.
+   - ### Situation
+   - ### Task
+   - ### Action
+   - ### Result
+   각 헤딩 아래 1~2문장으로 핵심을 설명하고, 정량 지표와 사용 기술을 명시합니다.
+   3개 이상, 6개 이하의 STAR 묶음을 제공합니다.
+2. `## 경력기술서용 요약` 섹션에는 5~7개의 Bullet Point를 작성하되, 각 Bullet이 STAR 요약을 1문장으로 압축하도록 작성합니다(불필요한 수식어 금지).
+
+## 주의사항
+- 여러 달에 걸쳐 이어진 작업은 하나의 성과로 통합하고, 연간 관점에서 영향력이 큰 순서로 배열합니다.
+- 모든 STAR 결과에는 정량 지표(%, 초, 건수 등)와 명시적인 비즈니스 임팩트가 포함되어야 합니다.
+- 기술 스택이나 도입 도구가 있다면 Action에 반드시 포함합니다.
+"""
+
+YEARLY_SUMMARY_USER_TEMPLATE = """
+다음은 올해의 월간 하이라이트입니다:
+
+{combined_months}
+
+위 내용을 사용해 연간 성과를 STAR 구조로 정리하고, 뒤이어 경력기술서용 요약 Bullet Point를 작성해주세요.
+각 STAR 묶음은 `### Situation`/`### Task`/`### Action`/`### Result` 헤딩을 반드시 포함해야 합니다.
+"""
+
+SUMMARY_REDUCE_USER_TEMPLATE = """
+다음은 같은 기간의 데이터를 여러 묶음으로 나눠 각각 요약한 부분 결과입니다:
+
+{partial_summaries}
+
+부분 결과에서 중복되는 성과는 하나로 통합하고 영향력이 큰 순서로 다시 정렬해,
+시스템 지시의 출력 형식 그대로 하나의 최종 결과를 작성해주세요.
+부분 결과에 없는 내용은 추가하지 마세요.
+"""
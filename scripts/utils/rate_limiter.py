@@ -0,0 +1,228 @@
+"""
+Notion API 호출을 위한 토큰 버킷 속도 제한 및 재시도 스케줄러
+"""
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Notion 공식 가이드의 평균 허용량 (초당 3회)
+DEFAULT_RATE_PER_SECOND = 3.0
+DEFAULT_BURST = 3
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+
+# 요청이 처리되지 않았음이 보장되는 상태 코드 (쓰기 요청도 재시도 가능)
+RATE_LIMITED_STATUS = 429
+# 일시적인 서버 오류로 간주해 조회 요청을 재시도할 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 소비하고, 토큰이 없으면 채워질 때까지 대기
+
+        대기 시간은 락 안에서 예약하고 실제 sleep은 락 밖에서 수행하므로
+        여러 스레드가 동시에 호출해도 순서대로 간격이 벌어진다.
+
+        Returns:
+            토큰을 얻기 위해 대기한 초
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class RequestScheduler:
+    """모든 Notion 요청이 거쳐가는 속도 제한 + 지수 백오프 재시도 스케줄러"""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_PER_SECOND,
+        burst: float = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            rate: 초당 평균 요청 수
+            burst: 순간적으로 허용할 최대 요청 수
+            max_retries: 요청당 최대 재시도 횟수
+            base_delay: 첫 재시도의 백오프 상한(초), 이후 2배씩 증가
+            max_delay: 백오프 상한(초)
+            clock: 단조 증가 시계 (테스트 주입용)
+            sleep: 대기 함수 (테스트 주입용)
+            jitter: 0~1 난수 생성 함수 (테스트 주입용)
+        """
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "throttle_waits": 0,
+            "throttle_wait_seconds": 0.0,
+            "backoff_seconds": 0.0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "RequestScheduler":
+        """NOTION_RATE_LIMIT, NOTION_RATE_BURST, NOTION_MAX_RETRIES 환경 변수로 생성"""
+        return cls(
+            rate=float(os.getenv("NOTION_RATE_LIMIT", DEFAULT_RATE_PER_SECOND)),
+            burst=float(os.getenv("NOTION_RATE_BURST", DEFAULT_BURST)),
+            max_retries=int(os.getenv("NOTION_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        )
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """요청/재시도/대기 누적 카운터의 스냅샷"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _record(self, **increments: float):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def call(self, func: Callable[[], T], idempotent: bool = True) -> T:
+        """
+        토큰을 얻은 뒤 요청을 실행하고, 일시적 오류면 백오프 후 재시도
+
+        Args:
+            func: 인자 없이 호출할 요청 함수
+            idempotent: False면 처리되지 않았음이 보장되는 429에서만 재시도
+                (페이지 생성처럼 중복 실행이 위험한 쓰기 요청용)
+
+        Returns:
+            func의 반환값
+
+        Raises:
+            재시도 대상이 아니거나 재시도 횟수를 모두 소진한 마지막 예외
+        """
+        attempt = 0
+        while True:
+            waited = self.bucket.acquire()
+            if waited > 0:
+                self._record(throttle_waits=1, throttle_wait_seconds=waited)
+            self._record(requests=1)
+
+            try:
+                return func()
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt, idempotent)
+                if delay is None or attempt >= self.max_retries:
+                    self._record(failures=1)
+                    raise
+
+            attempt += 1
+            self._record(retries=1, backoff_seconds=delay)
+            self._sleep(delay)
+
+    def _retry_delay(self, exc: Exception, attempt: int, idempotent: bool) -> float | None:
+        """재시도 대상이면 대기 시간(초)을, 아니면 None을 반환"""
+        status = getattr(exc, "status", None)
+
+        if status == RATE_LIMITED_STATUS:
+            retryable = True
+        elif not idempotent:
+            retryable = False
+        else:
+            retryable = status in RETRYABLE_STATUS or _is_transport_error(exc)
+
+        if not retryable:
+            return None
+
+        # Full jitter: 0 ~ min(max_delay, base * 2^attempt)
+        backoff = self._jitter() * min(self.max_delay, self.base_delay * 2**attempt)
+        retry_after = _parse_retry_after(getattr(exc, "headers", None))
+        if retry_after is not None:
+            return max(retry_after, backoff)
+        return backoff
+
+
+def _is_transport_error(exc: Exception) -> bool:
+    """연결 오류/타임아웃 여부 (SDK 예외 모듈은 실패가 발생했을 때만 import)"""
+    import httpx
+    from notion_client.errors import RequestTimeoutError  # type: ignore[import]
+
+    return isinstance(exc, RequestTimeoutError | httpx.TransportError)
+
+
+def _parse_retry_after(headers: Any) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_default_scheduler: RequestScheduler | None = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RequestScheduler:
+    """프로세스 전체에서 공유하는 기본 스케줄러를 반환 (최초 호출 시 생성)"""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler.from_env()
+        return _default_scheduler
@@ -0,0 +1,129 @@
+"""
+프로세스 공용 설정 (.env 파일은 한 번만 읽고 결과를 캐시)
+
+각 모듈이 import 시점마다 load_dotenv()를 호출하던 것을 이 모듈로 모았다. .env 로딩과
+설정 객체 생성은 처음 필요해질 때 한 번만 수행되므로 CLI와 API 프로세스의 시작 경로에서
+파일 탐색/파싱 비용이 반복되지 않는다.
+"""
+
+import os
+import threading
+
+# Notion 커넥션 풀 기본값
+DEFAULT_POOL_MAX_CONNECTIONS = 20
+DEFAULT_POOL_MAX_KEEPALIVE = 10
+DEFAULT_POOL_KEEPALIVE_EXPIRY = 30.0
+
+_env_loaded = False
+_env_lock = threading.Lock()
+
+_settings: "Settings | None" = None
+_settings_lock = threading.Lock()
+
+
+def load_env():
+    """
+    .env 파일을 환경 변수로 읽어들임 (프로세스당 한 번만 수행)
+
+    이미 설정된 환경 변수는 덮어쓰지 않는다.
+    """
+    global _env_loaded
+    with _env_lock:
+        if _env_loaded:
+            return
+        from dotenv import load_dotenv  # type: ignore[import]
+
+        load_dotenv()
+        _env_loaded = True
+
+
+class Settings:
+    """Notion/LLM 자격 증명과 데이터베이스 ID 등 핵심 설정"""
+
+    def __init__(
+        self,
+        notion_api_key: str | None = None,
+        notion_daily_db: str | None = None,
+        notion_weekly_db: str | None = None,
+        notion_monthly_db: str | None = None,
+        llm_provider: str = "claude",
+        claude_api_key: str | None = None,
+        openai_api_key: str | None = None,
+        gemini_api_key: str | None = None,
+        notion_pool_max_connections: int = DEFAULT_POOL_MAX_CONNECTIONS,
+        notion_pool_max_keepalive: int = DEFAULT_POOL_MAX_KEEPALIVE,
+        notion_pool_keepalive_expiry: float = DEFAULT_POOL_KEEPALIVE_EXPIRY,
+    ):
+        """
+        Args:
+            notion_api_key: Notion 통합 토큰 (NOTION_API_KEY)
+            notion_daily_db: Daily Work Logs DB ID (NOTION_DB1_ID)
+            notion_weekly_db: Weekly Achievements DB ID (NOTION_DB2_ID)
+            notion_monthly_db: Monthly Highlights DB ID (NOTION_DB3_ID)
+            llm_provider: 기본 LLM 제공자 (LLM_PROVIDER)
+            claude_api_key: Claude API 키 (CLAUDE_API_KEY)
+            openai_api_key: OpenAI API 키 (OPENAI_API_KEY)
+            gemini_api_key: Gemini API 키 (GEMINI_API_KEY)
+            notion_pool_max_connections: Notion 커넥션 풀 최대 연결 수
+                (NOTION_POOL_MAX_CONNECTIONS)
+            notion_pool_max_keepalive: 유휴 상태로 유지할 최대 연결 수
+                (NOTION_POOL_MAX_KEEPALIVE)
+            notion_pool_keepalive_expiry: 유휴 연결 유지 시간(초)
+                (NOTION_POOL_KEEPALIVE_EXPIRY)
+        """
+        self.notion_api_key = notion_api_key
+        self.notion_daily_db = notion_daily_db
+        self.notion_weekly_db = notion_weekly_db
+        self.notion_monthly_db = notion_monthly_db
+        self.llm_provider = llm_provider
+        self.claude_api_key = claude_api_key
+        self.openai_api_key = openai_api_key
+        self.gemini_api_key = gemini_api_key
+        self.notion_pool_max_connections = notion_pool_max_connections
+        self.notion_pool_max_keepalive = notion_pool_max_keepalive
+        self.notion_pool_keepalive_expiry = notion_pool_keepalive_expiry
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        .env 파일과 환경 변수에서 설정을 읽어 생성
+
+        Returns:
+            현재 환경 변수 값으로 만든 설정
+        """
+        load_env()
+        return cls(
+            notion_api_key=os.getenv("NOTION_API_KEY"),
+            notion_daily_db=os.getenv("NOTION_DB1_ID"),
+            notion_weekly_db=os.getenv("NOTION_DB2_ID"),
+            notion_monthly_db=os.getenv("NOTION_DB3_ID"),
+            llm_provider=os.getenv("LLM_PROVIDER", "claude").lower(),
+            claude_api_key=os.getenv("CLAUDE_API_KEY"),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            gemini_api_key=os.getenv("GEMINI_API_KEY"),
+            notion_pool_max_connections=int(
+                os.getenv("NOTION_POOL_MAX_CONNECTIONS", DEFAULT_POOL_MAX_CONNECTIONS)
+            ),
+            notion_pool_max_keepalive=int(
+                os.getenv("NOTION_POOL_MAX_KEEPALIVE", DEFAULT_POOL_MAX_KEEPALIVE)
+            ),
+            notion_pool_keepalive_expiry=float(
+                os.getenv("NOTION_POOL_KEEPALIVE_EXPIRY", DEFAULT_POOL_KEEPALIVE_EXPIRY)
+            ),
+        )
+
+
+def get_settings() -> Settings:
+    """프로세스 전체에서 공유하는 설정을 반환 (최초 호출 시 생성)"""
+    global _settings
+    with _settings_lock:
+        if _settings is None:
+            _settings = Settings.from_env()
+        return _settings
+
+
+def reset_settings():
+    """캐시된 설정을 버림 (환경 변수를 바꾼 뒤 다시 읽어야 할 때 사용)"""
+    global _settings
+    with _settings_lock:
+        _settings = None
@@ -0,0 +1,108 @@
+"""
+프롬프트 토큰 수 추정 및 입력 예산에 맞춘 분할 유틸리티
+"""
+
+import math
+import os
+from collections.abc import Sequence
+
+# 요약 1회에 넣을 입력 토큰 상한 기본값 (시스템 프롬프트 포함)
+DEFAULT_INPUT_TOKEN_BUDGET = 60_000
+# 응답 최대 토큰 기본값 (STAR 항목 5개 + 하이라이트가 잘리지 않는 수준)
+DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+# 제공자별 토크나이저 없이 쓰는 근사치: 영문/기호는 약 4자당 1토큰,
+# 한글 등 비ASCII 문자는 약 1.5자당 1토큰으로 계산해 조금 넉넉하게 잡는다.
+_ASCII_CHARS_PER_TOKEN = 4.0
+_NON_ASCII_CHARS_PER_TOKEN = 1.5
+
+
+def get_input_token_budget() -> int:
+    """LLM_INPUT_TOKEN_BUDGET 환경 변수(없으면 기본값)로 입력 토큰 예산을 반환"""
+    return int(os.getenv("LLM_INPUT_TOKEN_BUDGET", DEFAULT_INPUT_TOKEN_BUDGET))
+
+
+def get_max_output_tokens() -> int:
+    """LLM_MAX_OUTPUT_TOKENS 환경 변수(없으면 기본값)로 응답 최대 토큰 수를 반환"""
+    return int(os.getenv("LLM_MAX_OUTPUT_TOKENS", DEFAULT_MAX_OUTPUT_TOKENS))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    문자 종류별 비율로 토큰 수를 근사
+
+    Args:
+        text: 토큰 수를 셀 문자열
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(
+        ascii_chars / _ASCII_CHARS_PER_TOKEN + non_ascii_chars / _NON_ASCII_CHARS_PER_TOKEN
+    )
+
+
+def truncate_to_budget(text: str, budget: int) -> str:
+    """
+    추정 토큰 수가 예산 이하가 되도록 문자열 끝을 잘라냄
+
+    Args:
+        text: 원본 문자열
+        budget: 허용 토큰 수
+
+    Returns:
+        예산 안에 들어가는 문자열 (잘린 경우 끝에 표시를 붙임)
+    """
+    if estimate_tokens(text) <= budget:
+        return text
+
+    marker = "\n…(이하 생략)"
+    budget = max(0, budget - estimate_tokens(marker))
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + marker
+
+
+def split_by_budget(parts: Sequence[str], budget: int) -> list[list[str]]:
+    """
+    순서를 유지하면서 각 묶음의 추정 토큰 합이 예산을 넘지 않도록 분할
+
+    하나만으로 예산을 넘는 항목은 예산에 맞게 잘라 단독 묶음으로 만든다.
+
+    Args:
+        parts: 프롬프트 조각 리스트
+        budget: 묶음당 허용 토큰 수
+
+    Returns:
+        조각 묶음 리스트
+    """
+    budget = max(1, budget)
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    used = 0
+
+    for part in parts:
+        tokens = estimate_tokens(part)
+        if tokens > budget:
+            part = truncate_to_budget(part, budget)
+            tokens = estimate_tokens(part)
+
+        if current and used + tokens > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(part)
+        used += tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
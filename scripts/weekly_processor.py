@@ -6,29 +6,27 @@
 import argparse
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from scripts.utils.llm_client import BaseLLMClient, LLMClientFactory
-from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.llm_client import (
+    WEEKLY_SECTION_HEADINGS,
+    BaseLLMClient,
+    LLMClientFactory,
+    StreamCollector,
+)
+from scripts.utils.logging_setup import execution_logger, request_context
+from scripts.utils.notion_client import NotionClientWrapper, raise_for_content_errors
 
+# 백필 시 동시에 요약할 주 수 기본값
+DEFAULT_BACKFILL_WORKERS = 3
 
-def write_execution_log(status: str, message: str):
-    """
-    스크립트 실행 결과를 로그 파일로 남김
-
-    Args:
-        status: SUCCESS, ERROR 등 상태 문자열
-        message: 상태에 대한 상세 메시지
-    """
-    logs_dir = os.path.join(os.path.dirname(__file__), "..", "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    log_path = os.path.join(logs_dir, "execution.log")
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(log_path, "a", encoding="utf-8") as log_file:
-        log_file.write(f"[{timestamp}] [{status}] weekly_processor - {message}\n")
+write_execution_log = execution_logger("weekly_processor")
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,6 +46,19 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="집계 종료일 (YYYY-MM-DD). 기본값은 오늘.",
     )
+    parser.add_argument(
+        "--backfill",
+        nargs=2,
+        metavar=("FROM", "TO"),
+        help="FROM~TO(YYYY-MM-DD) 기간을 ISO 주 단위로 나눠 한 번에 처리. "
+        "이미 주간 성과가 있는 주는 건너뜀.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"백필 시 동시에 요약할 주 수 (기본값 {DEFAULT_BACKFILL_WORKERS}).",
+    )
     parser.add_argument(
         "--status",
         dest="status_filter",
@@ -61,6 +72,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Notion에 저장하지 않고 콘솔에 결과만 출력.",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="LLM 응답 캐시를 사용하지 않고 항상 새로 생성.",
+    )
     return parser.parse_args()
 
 
@@ -98,6 +115,46 @@ def resolve_period(
     )
 
 
+def split_iso_weeks(start_date: datetime, end_date: datetime) -> list[tuple[datetime, datetime]]:
+    """
+    기간을 ISO 주(월~일) 단위로 분할 (양 끝 주는 기간에 맞춰 잘림)
+
+    Args:
+        start_date: 시작 시각
+        end_date: 종료 시각
+
+    Returns:
+        (주 시작, 주 종료) 튜플 리스트
+    """
+    weeks = []
+    week_start = start_date
+    while week_start <= end_date:
+        sunday = week_start + timedelta(days=6 - week_start.weekday())
+        week_end = min(sunday, end_date)
+        weeks.append((week_start, week_end))
+        week_start = sunday + timedelta(days=1)
+    return weeks
+
+
+def _iso_week_key(value: date) -> tuple[int, int]:
+    """날짜가 속한 (ISO 연도, ISO 주차)"""
+    iso = value.isocalendar()
+    return iso[0], iso[1]
+
+
+def _is_covered(day: date, periods: list[tuple[date, date]]) -> bool:
+    """날짜가 저장된 집계 기간 중 하나에 포함되는지 여부"""
+    return any(period_start <= day <= period_end for period_start, period_end in periods)
+
+
+def _date_property(page: dict, name: str) -> date | None:
+    """페이지 날짜 속성의 시작일을 date로 변환"""
+    start = (page.get("properties", {}).get(name, {}).get("date") or {}).get("start")
+    if not start:
+        return None
+    return date.fromisoformat(start[:10])
+
+
 class WeeklyProcessor:
     """주간 자동 요약 및 저장을 담당하는 클래스"""
 
@@ -122,10 +179,14 @@ class WeeklyProcessor:
 
         Returns:
             일일 로그 리스트
+
+        Raises:
+            RuntimeError: 본문 조회에 실패한 로그가 있을 때
         """
         logs = self.notion.get_daily_logs_with_content(
             start_date, end_date, status_filter
         )
+        raise_for_content_errors(logs)
         return logs
 
     def summarize_logs(self, logs: list[dict]) -> dict:
@@ -141,6 +202,33 @@ class WeeklyProcessor:
         summary = self.llm.generate_weekly_summary(logs)
         return summary
 
+    def stream_summary(self, logs: list[dict]) -> dict:
+        """
+        요약을 스트리밍으로 받으며 콘솔에 바로 출력 (dry-run용)
+
+        Args:
+            logs: 일일 로그 리스트
+
+        Returns:
+            summarize_logs와 같은 형태의 dict (첫 토큰 지연은 실행 로그에만 기록)
+        """
+        collector = StreamCollector(
+            WEEKLY_SECTION_HEADINGS,
+            on_delta=lambda delta: print(delta, end="", flush=True),
+        )
+        content = collector.consume(self.llm.stream_weekly_summary(logs))
+        print()
+
+        summary = self.llm.parse_weekly_response(content)
+        write_execution_log(
+            "INFO",
+            f"LLM 스트리밍 완료: 첫 토큰 {collector.ttft or 0:.2f}s, "
+            f"전체 {collector.elapsed or 0:.2f}s",
+            duration_ms=(collector.elapsed or 0) * 1000,
+            ttft_ms=round((collector.ttft or 0) * 1000, 1),
+        )
+        return summary
+
     def save_weekly_summary(
         self,
         start_date: datetime,
@@ -189,6 +277,7 @@ class WeeklyProcessor:
         Returns:
             저장된 페이지 객체 또는 None
         """
+        started = time.perf_counter()
         write_execution_log(
             "INFO", f"주간 처리 시작: {start_date.date()} ~ {end_date.date()}"
         )
@@ -198,42 +287,213 @@ class WeeklyProcessor:
             write_execution_log("INFO", "집계 기간에 해당하는 일일 로그가 없습니다.")
             return None
 
-        summary = self.summarize_logs(logs)
-
         if dry_run:
-            write_execution_log(
-                "INFO", "Dry-run 모드로 실행됨. Notion 저장을 건너뜁니다."
-            )
-            print("## 주간 성과 요약")
-            print(summary.get("bullet_points", ""))
-            print("\n## 핵심 하이라이트")
-            print(summary.get("key_highlights", ""))
-            return summary
+            # 응답을 기다리는 동안 빈 화면이 되지 않도록 받는 대로 출력
+            write_execution_log("INFO", "Dry-run 모드로 실행됨. Notion 저장을 건너뜁니다.")
+            return self.stream_summary(logs)
 
+        summary = self.summarize_logs(logs)
         page = self.save_weekly_summary(start_date, end_date, summary, logs)
-        write_execution_log("SUCCESS", f"주간 성과 저장 완료: {page.get('id')}")
+        write_execution_log(
+            "SUCCESS",
+            f"주간 성과 저장 완료: {page.get('id')}",
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
         return page
 
+    def find_existing_weeks(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[tuple[date, date]]:
+        """
+        기간 안에 이미 저장된 주간 성과 페이지의 집계 기간 목록을 조회
+
+        Args:
+            start_date: 시작 시각
+            end_date: 종료 시각
+
+        Returns:
+            (Period Start, Period End) 날짜 쌍 리스트
+            (Period End가 없으면 시작일부터 한 주로 간주)
+        """
+        existing = []
+        for page in self.notion.iter_weekly_achievements(start_date, end_date):
+            period_start = _date_property(page, "Period Start")
+            if period_start:
+                period_end = _date_property(page, "Period End") or period_start + timedelta(days=6)
+                existing.append((period_start, period_end))
+        return existing
+
+    def run_backfill(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        status_filter: str | None = None,
+        dry_run: bool = False,
+        max_workers: int | None = None,
+    ) -> list[dict]:
+        """
+        여러 주를 한 번에 처리
+
+        일일 로그는 전체 기간을 한 번의 페이지네이션 쿼리로 가져와 ISO 주별로
+        나누고, 저장된 주간 성과의 집계 기간에 포함되지 않은 로그가 있는 주만 병렬로
+        요약해 저장한다. 기존 페이지가 주의 일부만 덮으면 덮이지 않은 로그만 요약하고,
+        저장할 기간도 양 끝의 이미 덮인 날짜를 제외한 범위로 줄인다.
+
+        Args:
+            start_date: 시작 시각
+            end_date: 종료 시각
+            status_filter: 상태 필터
+            dry_run: Notion 저장 생략 여부
+            max_workers: 동시에 요약할 주 수
+
+        Returns:
+            주별 처리 결과 리스트 (week_start, week_end, status 및
+            page/summary/error 키, status는 created/dry_run/skipped/empty/failed)
+        """
+        weeks = split_iso_weeks(start_date, end_date)
+        write_execution_log(
+            "INFO",
+            f"주간 백필 시작: {start_date.date()} ~ {end_date.date()} ({len(weeks)}주)",
+        )
+
+        # 월요일에 시작하지 않는 기존 페이지도 경계 주와 겹치는지 볼 수 있도록
+        # 양 끝 주에서 한 주씩 더 넓혀 조회
+        existing = self.find_existing_weeks(
+            start_date - timedelta(days=start_date.weekday() + 7),
+            end_date + timedelta(days=13 - end_date.weekday()),
+        )
+
+        # 속성만 한 번에 조회해 주별로 나눈 뒤, 처리할 주의 로그만 본문을 채움
+        logs_by_week: dict[tuple[int, int], list[dict]] = {}
+        logged_dates: dict[str, date] = {}
+        for log in self.notion.iter_daily_logs(start_date, end_date, status_filter):
+            logged_date = _date_property(log, "Logged Date")
+            if logged_date and log.get("id"):
+                logs_by_week.setdefault(_iso_week_key(logged_date), []).append(log)
+                logged_dates[log["id"]] = logged_date
+
+        results: list[dict[str, Any]] = []
+        pending_keys = []
+        for week_start, week_end in weeks:
+            key = _iso_week_key(week_start.date())
+            result: dict[str, Any] = {"week_start": week_start, "week_end": week_end}
+            week_logs = logs_by_week.get(key, [])
+            # 저장된 집계 기간이 덮지 않는 날짜의 로그만 새로 요약
+            uncovered = [
+                log for log in week_logs if not _is_covered(logged_dates[log["id"]], existing)
+            ]
+            if uncovered:
+                while _is_covered(week_start.date(), existing):
+                    week_start += timedelta(days=1)
+                while _is_covered(week_end.date(), existing):
+                    week_end -= timedelta(days=1)
+                result.update(week_start=week_start, week_end=week_end)
+                logs_by_week[key] = uncovered
+                pending_keys.append((result, key))
+            elif week_logs or any(
+                period_start <= week_end.date() and period_end >= week_start.date()
+                for period_start, period_end in existing
+            ):
+                result["status"] = "skipped"
+            else:
+                result["status"] = "empty"
+            results.append(result)
+
+        enriched = iter(
+            self.notion.attach_content(
+                [log for _, key in pending_keys for log in logs_by_week[key]]
+            )
+        )
+        pending = [
+            (result, [next(enriched) for _ in logs_by_week[key]]) for result, key in pending_keys
+        ]
+
+        def process_week(result: dict, logs: list[dict]):
+            try:
+                # 본문이 빠진 주는 불완전한 요약이 저장되지 않도록 실패 처리
+                raise_for_content_errors(logs)
+                summary = self.summarize_logs(logs)
+                if dry_run:
+                    result.update(status="dry_run", summary=summary)
+                    return
+                page = self.save_weekly_summary(
+                    result["week_start"], result["week_end"], summary, logs
+                )
+                result.update(status="created", page=page)
+            except Exception as error:  # pylint: disable=broad-except
+                result.update(status="failed", error=str(error))
+
+        if pending:
+            workers = max(1, min(max_workers or DEFAULT_BACKFILL_WORKERS, len(pending)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="weekly-backfill"
+            ) as executor:
+                for future in [executor.submit(process_week, *item) for item in pending]:
+                    future.result()
+
+        for result in results:
+            period = f"{result['week_start'].date()} ~ {result['week_end'].date()}"
+            if result["status"] == "failed":
+                write_execution_log("ERROR", f"{period} 처리 실패: {result['error']}")
+            elif result["status"] == "created":
+                write_execution_log(
+                    "SUCCESS",
+                    f"{period} 주간 성과 저장 완료: {result['page'].get('id')}",
+                )
+            if dry_run and result["status"] == "dry_run":
+                print(f"# {period}")
+                print("## 주간 성과 요약")
+                print(result["summary"].get("bullet_points", ""))
+                print("\n## 핵심 하이라이트")
+                print(result["summary"].get("key_highlights", ""))
+                print()
+
+        counts: dict[str, int] = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        write_execution_log(
+            "INFO",
+            "주간 백필 완료: "
+            + ", ".join(f"{status}={count}" for status, count in sorted(counts.items())),
+        )
+        return results
+
 
 def main():
     """CLI 엔트리 포인트"""
     args = parse_args()
 
     try:
-        start_date, end_date = resolve_period(args.start_date, args.end_date)
+        if args.backfill:
+            start_date, end_date = resolve_period(*args.backfill)
+        else:
+            start_date, end_date = resolve_period(args.start_date, args.end_date)
     except ValueError as error:
         write_execution_log("ERROR", f"기간 해석 실패: {error}")
         print(f"기간 설정 오류: {error}")
         sys.exit(1)
 
     try:
-        processor = WeeklyProcessor()
-        processor.run(
-            start_date=start_date,
-            end_date=end_date,
-            status_filter=args.status_filter,
-            dry_run=args.dry_run,
+        processor = WeeklyProcessor(
+            llm_client=LLMClientFactory.create_client(use_cache=not args.no_cache)
         )
+        if args.backfill:
+            results = processor.run_backfill(
+                start_date=start_date,
+                end_date=end_date,
+                status_filter=args.status_filter,
+                dry_run=args.dry_run,
+                max_workers=args.workers,
+            )
+            if any(result["status"] == "failed" for result in results):
+                sys.exit(1)
+        else:
+            processor.run(
+                start_date=start_date,
+                end_date=end_date,
+                status_filter=args.status_filter,
+                dry_run=args.dry_run,
+            )
     except KeyboardInterrupt:
         write_execution_log("CANCELLED", "사용자가 Ctrl+C로 종료함")
         print("사용자에 의해 중단되었습니다.")
@@ -245,4 +505,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # 한 번의 실행에서 남긴 로그를 같은 요청 ID로 묶음
+    with request_context():
+        main()
@@ -0,0 +1,15 @@
+"""
+테스트 공용 설정
+
+테스트가 저장소의 logs/ 디렉터리에 실행 로그를 남기지 않도록, 어떤 테스트 모듈보다 먼저
+LOG_DIR을 임시 디렉터리로 바꿔 둔다.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+_log_dir = tempfile.mkdtemp(prefix="work-logging-tests-")
+os.environ["LOG_DIR"] = _log_dir
+atexit.register(shutil.rmtree, _log_dir, ignore_errors=True)
@@ -1,10 +1,15 @@
+import asyncio
 import os
+import time
 import unittest
 import uuid
+from unittest.mock import patch
 
+import httpx
 from fastapi.testclient import TestClient
 
-from scripts.api.app import app, get_notion_client
+from scripts.api import app as app_module
+from scripts.api.app import app, close_notion_client, get_notion_client
 
 
 class _StubNotionClient:
@@ -84,6 +89,55 @@ class DailyLogApiTestCase(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertEqual(len(self.stub_notion.created_logs), 0)
 
+    def test_request_id_is_echoed_and_logged(self):
+        """요청 ID가 응답 헤더와 요청 중 남긴 모든 로그에 전달되는지 확인"""
+        from scripts.utils.logging_setup import get_request_id
+
+        logged = []
+
+        def capture(status_text, message, **fields):
+            logged.append((status_text, get_request_id(), fields))
+
+        payload = {
+            "title": "요청 ID 추적",
+            "context": "### Result\n로그 추적 확인",
+            "category": "기타",
+            "impact_level": "Low",
+            "tech_stack": ["Python"],
+        }
+        with patch.object(app_module, "write_execution_log", side_effect=capture):
+            response = self.client.post(
+                "/daily-logs",
+                json=payload,
+                headers={
+                    "Authorization": "Bearer test-token",
+                    "X-Request-ID": "req-123",
+                },
+            )
+
+        self.assertEqual(response.headers["X-Request-ID"], "req-123")
+        self.assertEqual([entry[0] for entry in logged], ["SUCCESS", "REQUEST"])
+        self.assertTrue(all(entry[1] == "req-123" for entry in logged))
+        self.assertEqual(logged[-1][2]["status_code"], 201)
+        self.assertIn("duration_ms", logged[-1][2])
+
+    def test_metrics_endpoint_reports_route_templates(self):
+        """요청 지표가 라우트 템플릿 단위로 집계되어 /metrics에 노출되는지 확인"""
+        headers = {"Authorization": "Bearer test-token"}
+        with patch.object(app_module, "get_outbox_worker") as get_worker:
+            get_worker.return_value.store.get.return_value = None
+            self.client.get("/jobs/missing", headers=headers)
+        response = self.client.get("/metrics", headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn(
+            'work_logging_http_requests_total{method="GET",route="/jobs/{job_id}",status="404"}',
+            response.text,
+        )
+        self.assertNotIn("/jobs/missing", response.text)
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+
     def test_create_daily_log_invalid_date(self):
         payload = {
             "title": "잘못된 날짜",
@@ -104,5 +158,165 @@ class DailyLogApiTestCase(unittest.TestCase):
         self.assertEqual(len(self.stub_notion.created_logs), 0)
 
 
+class DailyLogBatchApiTestCase(unittest.TestCase):
+    """배치 생성 API 단위 테스트"""
+
+    def setUp(self):
+        self.stub_notion = _StubNotionClient()
+        app.dependency_overrides[get_notion_client] = lambda: self.stub_notion
+        os.environ["API_AUTH_TOKEN"] = "test-token"
+        self.client = TestClient(app)
+        self.headers = {"Authorization": "Bearer test-token"}
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        os.environ.pop("API_AUTH_TOKEN", None)
+
+    @staticmethod
+    def _item(title: str) -> dict:
+        return {
+            "title": title,
+            "context": "### Situation\n배치 테스트\n\n### Result\n저장 확인",
+            "category": "기타",
+            "impact_level": "Low",
+            "tech_stack": ["Python"],
+            "logged_date": "2025-11-09",
+        }
+
+    def test_batch_creates_all_items(self):
+        """모든 항목이 저장되면 201과 순서대로 된 결과를 반환하는지 확인"""
+        items = [self._item(f"배치 로그 {idx}") for idx in range(5)]
+
+        response = self.client.post(
+            "/daily-logs/batch", json={"items": items}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual(body["succeeded"], 5)
+        self.assertEqual([result["index"] for result in body["results"]], list(range(5)))
+        self.assertTrue(all(result["page_id"] for result in body["results"]))
+        self.assertEqual(len(self.stub_notion.created_logs), 5)
+
+    def test_batch_reports_partial_failure(self):
+        """일부 항목만 실패하면 207과 항목별 오류를 반환하는지 확인"""
+        original = self.stub_notion.create_daily_log
+
+        def flaky_create(**kwargs):
+            if kwargs["title"] == "실패 로그":
+                raise RuntimeError("notion down")
+            return original(**kwargs)
+
+        self.stub_notion.create_daily_log = flaky_create
+        items = [self._item("성공 로그"), self._item("실패 로그")]
+
+        response = self.client.post(
+            "/daily-logs/batch", json={"items": items}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 207)
+        body = response.json()
+        self.assertEqual((body["succeeded"], body["failed"]), (1, 1))
+        self.assertTrue(body["results"][0]["success"])
+        self.assertFalse(body["results"][1]["success"])
+        self.assertEqual(body["results"][1]["error"], "노션 저장 중 오류가 발생했습니다.")
+
+    def test_batch_rejects_oversized_request(self):
+        """최대 건수를 넘는 배치는 422로 거부되는지 확인"""
+        items = [self._item(f"로그 {idx}") for idx in range(51)]
+
+        response = self.client.post(
+            "/daily-logs/batch", json={"items": items}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(len(self.stub_notion.created_logs), 0)
+
+
+class _SlowStubNotionClient(_StubNotionClient):
+    """Notion 쓰기 지연을 흉내 내는 스텁 (동기 sleep으로 스레드를 점유)"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def create_daily_log(self, **kwargs) -> dict:
+        time.sleep(self.delay)
+        return super().create_daily_log(**kwargs)
+
+
+class NonBlockingWriteTestCase(unittest.TestCase):
+    """느린 Notion 쓰기가 이벤트 루프를 막지 않는지 검증"""
+
+    def setUp(self):
+        self.stub_notion = _SlowStubNotionClient(delay=0.3)
+        app.dependency_overrides[get_notion_client] = lambda: self.stub_notion
+        os.environ.pop("API_AUTH_TOKEN", None)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_health_responds_while_write_in_flight(self):
+        """쓰기 요청 처리 중에도 /health가 즉시 응답하는지 확인"""
+        payload = {
+            "title": "느린 쓰기",
+            "context": "### Situation\n지연 테스트",
+            "category": "기타",
+            "impact_level": "Low",
+            "tech_stack": ["Python"],
+        }
+
+        async def scenario() -> tuple[float, float, int]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                started = time.perf_counter()
+                write_task = asyncio.create_task(client.post("/daily-logs", json=payload))
+                await asyncio.sleep(0.05)
+                health = await client.get("/health")
+                health_elapsed = time.perf_counter() - started
+                write = await write_task
+                write_elapsed = time.perf_counter() - started
+            self.assertEqual(health.status_code, 200)
+            return health_elapsed, write_elapsed, write.status_code
+
+        health_elapsed, write_elapsed, write_status = asyncio.run(scenario())
+
+        self.assertEqual(write_status, 201)
+        self.assertLess(health_elapsed, 0.25)
+        self.assertGreaterEqual(write_elapsed, 0.3)
+
+
+class NotionClientLifecycleTestCase(unittest.TestCase):
+    """프로세스 공용 Notion 클라이언트 수명 주기 테스트"""
+
+    def setUp(self):
+        self.env = patch.dict(
+            os.environ,
+            {"NOTION_API_KEY": "secret_test", "NOTION_DB1_ID": "daily-db"},
+        )
+        self.env.start()
+        close_notion_client()
+
+    def tearDown(self):
+        close_notion_client()
+        self.env.stop()
+
+    def test_client_is_reused_across_requests(self):
+        """여러 번 호출해도 같은 클라이언트(커넥션 풀)를 반환하는지 확인"""
+        first = get_notion_client()
+        second = get_notion_client()
+
+        self.assertIs(first, second)
+
+    def test_lifespan_closes_pool_on_shutdown(self):
+        """앱 종료 시 커넥션 풀을 닫고 싱글턴을 초기화하는지 확인"""
+        with TestClient(app):
+            notion = app_module._notion_client
+            self.assertIsNotNone(notion)
+
+        self.assertIsNone(app_module._notion_client)
+        self.assertTrue(notion.client.client.is_closed)
+
+
 if __name__ == "__main__":
     unittest.main()
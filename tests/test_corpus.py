@@ -0,0 +1,78 @@
+import io
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from itertools import islice
+
+from benchmarks.corpus import (
+    iter_daily_log_fixtures,
+    load_into_cache,
+    read_jsonl,
+    write_jsonl,
+)
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.notion_emulator import NotionEmulator
+from scripts.utils.page_cache import PageCache
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+
+
+class DailyLogCorpusTestCase(unittest.TestCase):
+    """합성 일일 로그 코퍼스 생성기 테스트"""
+
+    def test_same_seed_streams_same_fixtures(self):
+        """시드가 같으면 같은 fixture가, 다르면 다른 fixture가 나오는지 확인"""
+        first = list(iter_daily_log_fixtures(20, seed=7))
+        self.assertEqual(first, list(iter_daily_log_fixtures(20, seed=7)))
+        self.assertNotEqual(first, list(iter_daily_log_fixtures(20, seed=8)))
+        # 끝없이 생성하는 모드도 같은 순서로 시작
+        self.assertEqual(first[:5], list(islice(iter_daily_log_fixtures(seed=7), 5)))
+
+    def test_jsonl_round_trip(self):
+        """JSONL로 기록한 fixture를 그대로 다시 읽는지 확인"""
+        fixtures = list(iter_daily_log_fixtures(5, seed=1))
+        stream = io.StringIO()
+        self.assertEqual(write_jsonl(fixtures, stream), 5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "corpus.jsonl")
+            with open(path, "w", encoding="utf-8") as corpus_file:
+                corpus_file.write(stream.getvalue())
+            self.assertEqual(list(read_jsonl(path)), fixtures)
+
+    def test_emulator_content_matches_fixture_content(self):
+        """에뮬레이터에 적재한 본문을 get_page_content로 읽으면 fixture의 content와 같은지 확인"""
+        fixtures = list(iter_daily_log_fixtures(30, seed=3))
+        emulator = NotionEmulator()
+        emulator.seed_pages("daily-db", fixtures)
+        notion = NotionClientWrapper(
+            client=emulator,
+            scheduler=RequestScheduler(rate=10_000, burst=10_000),
+            settings=Settings(notion_daily_db="daily-db"),
+        )
+
+        logs = notion.get_daily_logs_with_content(datetime(2025, 1, 6), datetime(2025, 1, 15))
+
+        expected = {fixture["id"]: fixture["content"] for fixture in fixtures}
+        self.assertEqual(len(logs), 30)
+        for log in logs:
+            self.assertEqual(log["content"], expected[log["id"]])
+
+    def test_load_into_cache_in_batches(self):
+        """PageCache에 나눠 적재하고 본문이 캐시 적중으로 조회되는지 확인"""
+        fixtures = list(iter_daily_log_fixtures(25, seed=5))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PageCache(os.path.join(tmpdir, "cache.db"))
+            stored = load_into_cache(cache, "daily-db", iter(fixtures), batch_size=10)
+
+            pages = cache.get_pages("daily-db")
+            hits = cache.get_contents(pages)
+
+        self.assertEqual(stored, 25)
+        self.assertEqual(len(pages), 25)
+        self.assertEqual(hits, {f["id"]: f["content"] for f in fixtures})
+
+
+if __name__ == "__main__":
+    unittest.main()
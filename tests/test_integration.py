@@ -251,7 +251,7 @@ class IntegrationFlowTestCase(unittest.TestCase):
 
         weekly_processor = WeeklyProcessor(
             notion_client=self.stub_notion,
-            claude_client=_StubClaudeWeeklyClient(),
+            llm_client=_StubClaudeWeeklyClient(),
         )
         weekly_processor.run(
             start_date=start_date,
@@ -263,7 +263,7 @@ class IntegrationFlowTestCase(unittest.TestCase):
 
         monthly_processor = MonthlyProcessor(
             notion_client=self.stub_notion,
-            claude_client=_StubClaudeMonthlyClient(),
+            llm_client=_StubClaudeMonthlyClient(),
         )
         monthly_processor.run(
             start_date=datetime(2025, 11, 1),
@@ -0,0 +1,104 @@
+import base64
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from scripts.api import lambda_handler
+
+
+def _event(method: str, path: str, body: dict | None = None, **overrides) -> dict:
+    event = {
+        "version": "2.0",
+        "routeKey": f"{method} {path}",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"host": "api.example.com", "content-type": "application/json"},
+        "requestContext": {
+            "requestId": "gw-req-1",
+            "stage": "$default",
+            "http": {"method": method, "path": path, "sourceIp": "10.0.0.1"},
+        },
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+    event.update(overrides)
+    return event
+
+
+PAYLOAD = {
+    "title": "Lambda 핸들러",
+    "context": "### Situation\n테스트",
+    "category": "기타",
+    "impact_level": "Low",
+    "tech_stack": ["Python"],
+}
+
+
+class LambdaHandlerTestCase(unittest.TestCase):
+    """API Gateway 페이로드 2.0 Lambda 핸들러 테스트"""
+
+    def setUp(self):
+        self.notion = MagicMock()
+        self.notion.create_daily_log.return_value = {"id": "page-1"}
+        self.notion_cls = MagicMock(return_value=self.notion)
+        patches = [
+            patch("scripts.api.app.NotionClientWrapper", self.notion_cls),
+            patch("scripts.api.app.create_pooled_http_client", MagicMock()),
+            patch.object(lambda_handler, "flush_logs"),
+            patch.dict(os.environ, {"API_INGEST_MODE": "sync"}),
+        ]
+        for item in patches:
+            item.start()
+            self.addCleanup(item.stop)
+        os.environ.pop("API_AUTH_TOKEN", None)
+        lambda_handler.reset_runtime()
+        self.addCleanup(lambda_handler.reset_runtime)
+
+    def test_warm_invocations_reuse_runtime_and_notion_client(self):
+        """웜 호출은 런타임과 Notion 클라이언트를 다시 만들지 않는지 확인"""
+        responses = [
+            lambda_handler.handler(_event("POST", "/daily-logs", PAYLOAD), None) for _ in range(3)
+        ]
+        runtime = lambda_handler.get_runtime()
+
+        self.assertEqual([r["statusCode"] for r in responses], [201, 201, 201])
+        self.assertEqual(json.loads(responses[0]["body"])["page_id"], "page-1")
+        self.assertFalse(responses[0]["isBase64Encoded"])
+        self.assertEqual(self.notion_cls.call_count, 1)
+        self.assertEqual(self.notion.create_daily_log.call_count, 3)
+        self.assertEqual(runtime.invocations, 3)
+        self.assertIs(lambda_handler.get_runtime(), runtime)
+
+    def test_event_conversion(self):
+        """스테이지 경로, base64 본문, 요청 ID 헤더가 앱에 올바르게 전달되는지 확인"""
+        body = base64.b64encode(json.dumps(PAYLOAD).encode()).decode()
+        event = _event("POST", "/dev/daily-logs", body=body, isBase64Encoded=True)
+        event["requestContext"]["stage"] = "dev"
+
+        response = lambda_handler.handler(event, None)
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(response["headers"]["x-request-id"], "gw-req-1")
+        with self.assertRaises(ValueError):
+            lambda_handler.handler({"version": "1.0"}, None)
+
+    def test_cold_start_metrics_use_embedded_metric_format(self):
+        """첫 호출만 콜드 스타트와 초기화 시간을 EMF 지표로 남기는지 확인"""
+        with patch.object(lambda_handler, "write_execution_log") as write_log:
+            lambda_handler.handler(_event("GET", "/health"), None)
+            lambda_handler.handler(_event("GET", "/health"), None)
+
+        cold, warm = (call.kwargs for call in write_log.call_args_list)
+        self.assertEqual(cold["ColdStart"], 1)
+        self.assertIn("InitDuration", cold)
+        metric_names = [
+            metric["Name"] for metric in cold["_aws"]["CloudWatchMetrics"][0]["Metrics"]
+        ]
+        self.assertEqual(metric_names, ["ColdStart", "InitDuration"])
+        self.assertEqual(warm["ColdStart"], 0)
+        self.assertNotIn("InitDuration", warm)
+
+
+if __name__ == "__main__":
+    unittest.main()
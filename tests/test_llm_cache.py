@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from scripts.utils.llm_cache import LLMResponseCache, fingerprint
+from scripts.utils.llm_client import BaseLLMClient
+
+
+class _CountingLLMClient(BaseLLMClient):
+    """호출 횟수를 세는 테스트용 클라이언트"""
+
+    provider_name = "fake"
+
+    def __init__(self):
+        self.model = "fake-model"
+        self.max_tokens = 2000
+        self.calls = 0
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        return f"## 주간 성과 요약\n성과 {self.calls}\n## 핵심 하이라이트\n하이라이트"
+
+
+class LLMResponseCacheTestCase(unittest.TestCase):
+    """LLM 응답 캐시 저장/만료/제거 동작 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "llm.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_fingerprint_changes_with_every_input(self):
+        """제공자/모델/프롬프트 중 하나라도 다르면 다른 키가 되는지 확인"""
+        base = fingerprint("claude", "m1", "system", "user", 2000)
+        self.assertEqual(base, fingerprint("claude", "m1", "system", "user", 2000))
+        self.assertNotEqual(base, fingerprint("openai", "m1", "system", "user", 2000))
+        self.assertNotEqual(base, fingerprint("claude", "m2", "system", "user", 2000))
+        self.assertNotEqual(base, fingerprint("claude", "m1", "other", "user", 2000))
+        self.assertNotEqual(base, fingerprint("claude", "m1", "system", "other", 2000))
+
+    def test_expired_entry_is_a_miss(self):
+        """TTL이 지난 응답은 반환하지 않는지 확인"""
+        cache = LLMResponseCache(self.path, ttl_seconds=60)
+        with patch("scripts.utils.llm_cache.time.time", return_value=1000.0):
+            cache.put("key", "claude", "m1", "응답")
+        with patch("scripts.utils.llm_cache.time.time", return_value=1030.0):
+            self.assertEqual(cache.get("key"), "응답")
+        with patch("scripts.utils.llm_cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 응답부터 제거되는지 확인"""
+        cache = LLMResponseCache(self.path, ttl_seconds=0, max_entries=2)
+        with patch("scripts.utils.llm_cache.time.time", side_effect=[1.0, 2.0]):
+            cache.put("a", "claude", "m1", "A")
+            cache.put("b", "claude", "m1", "B")
+        with patch("scripts.utils.llm_cache.time.time", side_effect=[3.0, 4.0]):
+            cache.get("a")
+            cache.put("c", "claude", "m1", "C")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), "A")
+        self.assertIsNone(cache.get("b"))
+
+    def test_bypass_env_disables_cache(self):
+        """LLM_CACHE_BYPASS가 설정되면 캐시를 만들지 않는지 확인"""
+        env = {"LLM_CACHE_BYPASS": "1", "LLM_CACHE_PATH": self.path}
+        with patch.dict(os.environ, env):
+            self.assertIsNone(LLMResponseCache.from_env())
+
+    def test_client_reuses_cached_response(self):
+        """같은 입력의 두 번째 요약은 API를 호출하지 않는지 확인"""
+        client = _CountingLLMClient()
+        client.cache = LLMResponseCache(self.path)
+        logs = [{"properties": {}, "content": "API 응답 시간 개선"}]
+
+        first = client.generate_weekly_summary(logs)
+        second = client.generate_weekly_summary(logs)
+        client.generate_weekly_summary(logs, system_prompt="다른 프롬프트")
+
+        self.assertEqual(client.calls, 2)
+        self.assertEqual(first, second)
+        self.assertEqual(first["bullet_points"], "성과 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import threading
+import unittest
+
+from scripts.utils.llm_client import BaseLLMClient
+from scripts.utils.llm_fallback import CircuitBreaker, FallbackLLMClient
+
+
+class _FakeProvider(BaseLLMClient):
+    """응답 지연과 실패를 조절할 수 있는 테스트용 제공자"""
+
+    def __init__(self, name: str, reply: str = "", error: Exception | None = None):
+        self.provider_name = name
+        self.model = f"{name}-model"
+        self.reply = reply or f"{name} 응답"
+        self.error = error
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = 0
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return self.reply
+
+
+class CircuitBreakerTestCase(unittest.TestCase):
+    """차단기 상태 전이 테스트"""
+
+    def test_opens_after_threshold_and_allows_trial_after_reset(self):
+        """연속 실패 후 차단되고, 대기 시간이 지나면 시험 호출을 허용하는지 확인"""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        now[0] = 11.0
+        self.assertTrue(breaker.is_available())
+        self.assertTrue(breaker.is_available())
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.is_available())
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+
+
+class FallbackLLMClientTestCase(unittest.TestCase):
+    """헤지 요청 및 장애 전환 테스트"""
+
+    def test_primary_answer_is_used_without_hedge(self):
+        """주 제공자가 제때 응답하면 다음 제공자를 호출하지 않는지 확인"""
+        primary, secondary = _FakeProvider("claude"), _FakeProvider("openai")
+        client = FallbackLLMClient([primary, secondary], hedge_delay=1.0)
+
+        self.assertEqual(client._generate("system", "user"), "claude 응답")
+        self.assertEqual(secondary.calls, 0)
+
+    def test_slow_primary_is_hedged(self):
+        """주 제공자가 지연되면 다음 제공자에 헤지 요청을 보내 먼저 온 응답을 쓰는지 확인"""
+        primary, secondary = _FakeProvider("claude"), _FakeProvider("openai")
+        primary.release.clear()
+        client = FallbackLLMClient([primary, secondary], hedge_delay=0.05)
+
+        try:
+            result = client._generate("system", "user")
+        finally:
+            primary.release.set()
+
+        self.assertEqual(result, "openai 응답")
+        self.assertEqual(client.stats["hedges"], 1)
+        self.assertEqual(client.stats["wins"], {"openai": 1})
+
+    def test_failure_falls_back_immediately(self):
+        """주 제공자가 실패하면 헤지 대기 없이 다음 제공자로 넘어가는지 확인"""
+        primary = _FakeProvider("claude", error=RuntimeError("overloaded"))
+        secondary = _FakeProvider("openai")
+        client = FallbackLLMClient([primary, secondary], hedge_delay=30.0)
+
+        self.assertEqual(client._generate("system", "user"), "openai 응답")
+        self.assertEqual(client.stats["fallbacks"], 1)
+
+    def test_open_breaker_skips_failing_provider(self):
+        """계속 실패하는 제공자는 차단되어 이후 요청에서 호출되지 않는지 확인"""
+        primary = _FakeProvider("claude", error=RuntimeError("down"))
+        secondary = _FakeProvider("openai")
+        client = FallbackLLMClient(
+            [primary, secondary],
+            hedge_delay=30.0,
+            breaker_factory=lambda: CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        )
+
+        for _ in range(4):
+            client._generate("system", "user")
+
+        self.assertEqual(primary.calls, 2)
+        self.assertEqual(secondary.calls, 4)
+
+    def test_candidate_selection_keeps_half_open_trial(self):
+        """후보 선택만으로는 half-open 시험 호출 기회를 쓰지 않고, 실제로 보낸 제공자만 소비하는지 확인"""
+        now = [0.0]
+        primary, secondary = _FakeProvider("claude"), _FakeProvider("openai")
+        client = FallbackLLMClient(
+            [primary, secondary],
+            hedge_delay=30.0,
+            breaker_factory=lambda: CircuitBreaker(
+                failure_threshold=1, reset_timeout=10, clock=lambda: now[0]
+            ),
+        )
+        client.breakers[1].record_failure()
+        now[0] = 11.0
+
+        self.assertEqual(client._generate("system", "user"), "claude 응답")
+
+        self.assertEqual(secondary.calls, 0)
+        self.assertTrue(client.breakers[1].is_available())
+        self.assertTrue(client.breakers[1].allow())
+
+    def test_all_providers_failing_raises(self):
+        """모든 제공자가 실패하면 각 실패 사유를 담은 예외를 던지는지 확인"""
+        client = FallbackLLMClient(
+            [
+                _FakeProvider("claude", error=RuntimeError("a")),
+                _FakeProvider("openai", error=RuntimeError("b")),
+            ],
+            hedge_delay=30.0,
+        )
+
+        with self.assertRaises(RuntimeError) as ctx:
+            client._generate("system", "user")
+        self.assertIn("claude: a", str(ctx.exception))
+        self.assertIn("openai: b", str(ctx.exception))
+
+    def test_stream_falls_back_before_first_delta(self):
+        """스트리밍 시작 전 실패하면 다음 제공자의 스트림을 사용하는지 확인"""
+        primary = _FakeProvider("claude", error=RuntimeError("down"))
+        secondary = _FakeProvider("openai")
+        client = FallbackLLMClient([primary, secondary], hedge_delay=30.0)
+
+        self.assertEqual(list(client._generate_stream("system", "user")), ["openai 응답"])
+
+
+if __name__ == "__main__":
+    unittest.main()
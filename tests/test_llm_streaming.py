@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from scripts.utils.llm_cache import LLMResponseCache
+from scripts.utils.llm_client import (
+    WEEKLY_SECTION_HEADINGS,
+    BaseLLMClient,
+    StreamCollector,
+)
+from scripts.weekly_processor import WeeklyProcessor
+
+_DELTAS = ["## 주간 성과", " 요약\n• 배포 자동화\n## 핵심", " 하이라이트\n", "비용 0원"]
+
+
+class _StreamingLLMClient(BaseLLMClient):
+    """정해진 조각을 스트리밍하는 테스트용 클라이언트"""
+
+    provider_name = "fake"
+
+    def __init__(self):
+        self.model = "fake-model"
+        self.max_tokens = 2000
+        self.stream_calls = 0
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        return "".join(_DELTAS)
+
+    def _stream(self, system_prompt: str, user_prompt: str):
+        self.stream_calls += 1
+        yield from _DELTAS
+
+
+class StreamCollectorTestCase(unittest.TestCase):
+    """스트리밍 응답 수집기 테스트"""
+
+    def test_records_ttft_and_sections_split_across_deltas(self):
+        """첫 조각 시각과 조각 경계에 걸친 헤딩의 진입 시각을 기록하는지 확인"""
+        ticks = iter([0.0, 1.5, 2.0, 2.5, 3.0, 3.5])
+        received = []
+        collector = StreamCollector(
+            WEEKLY_SECTION_HEADINGS,
+            on_delta=received.append,
+            clock=lambda: next(ticks),
+        )
+
+        text = collector.consume(iter(_DELTAS))
+
+        self.assertEqual(text, "".join(_DELTAS))
+        self.assertEqual(received, _DELTAS)
+        self.assertEqual(collector.ttft, 1.5)
+        self.assertEqual(collector.elapsed, 3.5)
+        self.assertEqual(
+            collector.section_times,
+            {"## 주간 성과 요약": 2.0, "## 핵심 하이라이트": 2.5},
+        )
+        self.assertEqual(collector.current_section, "## 핵심 하이라이트")
+
+
+class StreamingSummaryTestCase(unittest.TestCase):
+    """BaseLLMClient 스트리밍 인터페이스 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_stream_matches_generate_and_fills_cache(self):
+        """스트리밍 결과를 파싱하면 일반 호출과 같고, 완료된 응답은 캐시되는지 확인"""
+        client = _StreamingLLMClient()
+        client.cache = LLMResponseCache(os.path.join(self.tmpdir.name, "llm.sqlite3"))
+        logs = [{"properties": {}, "content": "배포 자동화"}]
+
+        streamed = list(client.stream_weekly_summary(logs))
+        replayed = list(client.stream_weekly_summary(logs))
+
+        self.assertEqual(streamed, _DELTAS)
+        self.assertEqual(replayed, ["".join(_DELTAS)])
+        self.assertEqual(client.stream_calls, 1)
+        self.assertEqual(
+            client.parse_weekly_response("".join(streamed)),
+            client.generate_weekly_summary(logs),
+        )
+
+    def test_weekly_dry_run_prints_stream(self):
+        """Dry-run에서 스트리밍 조각을 출력하고 TTFT를 실행 로그에 남기는지 확인"""
+        notion = MagicMock()
+        notion.get_daily_logs_with_content.return_value = [
+            {"id": "page-1", "properties": {}, "content": "배포 자동화"}
+        ]
+        processor = WeeklyProcessor(notion_client=notion, llm_client=_StreamingLLMClient())
+
+        output = io.StringIO()
+        with (
+            patch("scripts.weekly_processor.write_execution_log") as write_log,
+            redirect_stdout(output),
+        ):
+            summary = processor.run(datetime(2025, 11, 3), datetime(2025, 11, 9), dry_run=True)
+
+        self.assertIn("".join(_DELTAS), output.getvalue())
+        self.assertEqual(summary["bullet_points"], "• 배포 자동화")
+        self.assertEqual(summary["key_highlights"], "비용 0원")
+        self.assertNotIn("ttft_seconds", summary)
+        self.assertTrue(any("ttft_ms" in call.kwargs for call in write_log.call_args_list))
+        notion.create_weekly_achievement.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from scripts.utils import logging_setup
+from scripts.utils.logging_setup import (
+    configure_logging,
+    execution_logger,
+    flush_logs,
+    request_context,
+)
+
+
+class LoggingSetupTestCase(unittest.TestCase):
+    """공용 실행 로그 파이프라인 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {"LOG_TARGET": "file", "LOG_DIR": self.tmpdir.name})
+        self.env.start()
+        configure_logging(force=True)
+
+    def tearDown(self):
+        self.env.stop()
+        configure_logging(force=True)
+        self.tmpdir.cleanup()
+
+    def _read_lines(self, name: str = "execution.log") -> list[dict]:
+        flush_logs()
+        with open(os.path.join(self.tmpdir.name, name), encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_writes_json_lines_with_request_id_and_duration(self):
+        """요청 ID, 처리 시간, 추가 필드가 JSON 한 줄로 기록되는지 확인"""
+        write_execution_log = execution_logger("weekly_processor")
+
+        with request_context("req-1"):
+            write_execution_log("SUCCESS", "저장 완료", duration_ms=12.345, page="p-1")
+        write_execution_log("ERROR", "실패")
+
+        first, second = self._read_lines()
+        self.assertEqual(first["component"], "weekly_processor")
+        self.assertEqual(first["status"], "SUCCESS")
+        self.assertEqual(first["level"], "INFO")
+        self.assertEqual(first["request_id"], "req-1")
+        self.assertEqual(first["duration_ms"], 12.3)
+        self.assertEqual(first["page"], "p-1")
+        self.assertEqual(second["level"], "ERROR")
+        self.assertNotIn("request_id", second)
+
+    def test_concurrent_writers_do_not_interleave(self):
+        """여러 스레드가 동시에 기록해도 줄이 섞이지 않는지 확인"""
+        write_execution_log = execution_logger("api_server")
+
+        def worker(idx: int):
+            for line in range(50):
+                write_execution_log("INFO", f"{idx}-{line} " + "x" * 200)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self._read_lines()), 400)
+
+    def test_flush_keeps_listener_running(self):
+        """flush_logs가 리스너를 재시작하지 않고 쌓인 로그만 모두 출력하는지 확인"""
+        write_execution_log = execution_logger("lambda_handler")
+        listener = logging_setup._listener
+        thread = listener._thread
+
+        for idx in range(3):
+            write_execution_log("INFO", f"{idx}번째 호출")
+            flush_logs()
+            self.assertEqual(len(self._read_lines()), idx + 1)
+
+        self.assertIs(logging_setup._listener, listener)
+        self.assertIs(listener._thread, thread)
+        self.assertTrue(thread.is_alive())
+
+    def test_rotates_by_size(self):
+        """크기 제한을 넘으면 백업 파일로 회전하는지 확인"""
+        with patch.dict(os.environ, {"LOG_ROTATE_BYTES": "1000", "LOG_BACKUP_COUNT": "2"}):
+            configure_logging(force=True)
+            write_execution_log = execution_logger("daily_logger")
+            for idx in range(30):
+                write_execution_log("INFO", f"{idx} " + "x" * 100)
+            flush_logs()
+
+        files = sorted(os.listdir(self.tmpdir.name))
+        self.assertEqual(files, ["execution.log", "execution.log.1", "execution.log.2"])
+        self.assertLessEqual(os.path.getsize(os.path.join(self.tmpdir.name, "execution.log")), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from scripts.utils.markdown_blocks import (
+    NOTION_MAX_NESTING_DEPTH,
+    NOTION_TEXT_LIMIT,
+    markdown_to_blocks,
+    parse_inline,
+)
+
+
+def _text(block: dict) -> str:
+    return "".join(item["text"]["content"] for item in block[block["type"]]["rich_text"])
+
+
+class MarkdownBlocksTestCase(unittest.TestCase):
+    """마크다운 → Notion 블록 변환 테스트"""
+
+    def test_numbered_items_beyond_four_are_list_items(self):
+        """5 이상 번호도 문단에 합쳐지지 않고 번호 목록이 되는지 확인"""
+        blocks = markdown_to_blocks("설명 문단\n5. 다섯째\n12) 열두째")
+
+        self.assertEqual(
+            [block["type"] for block in blocks],
+            ["paragraph", "numbered_list_item", "numbered_list_item"],
+        )
+        self.assertEqual(_text(blocks[1]), "다섯째")
+        self.assertEqual(_text(blocks[2]), "열두째")
+
+    def test_code_quote_todo_and_divider(self):
+        """펜스 코드, 인용, 할 일, 구분선 블록을 만드는지 확인"""
+        blocks = markdown_to_blocks(
+            "```py\n# 주석은 헤딩이 아님\n- 목록도 아님\n```\n"
+            "> 첫 줄\n> 둘째 줄\n- [x] 완료\n- [ ] 미완료\n---"
+        )
+
+        self.assertEqual(
+            [block["type"] for block in blocks],
+            ["code", "quote", "to_do", "to_do", "divider"],
+        )
+        self.assertEqual(blocks[0]["code"]["language"], "python")
+        self.assertEqual(_text(blocks[0]), "# 주석은 헤딩이 아님\n- 목록도 아님")
+        self.assertEqual(_text(blocks[1]), "첫 줄\n둘째 줄")
+        self.assertTrue(blocks[2]["to_do"]["checked"])
+        self.assertFalse(blocks[3]["to_do"]["checked"])
+
+    def test_nested_lists_are_capped_at_notion_depth(self):
+        """들여쓰기를 children으로 중첩하되 허용 깊이를 넘는 항목은 형제로 붙이는지 확인"""
+        blocks = markdown_to_blocks("- a\n  - b\n    - c\n      - d\n- e")
+
+        self.assertEqual([_text(block) for block in blocks], ["a", "e"])
+        level1 = blocks[0]["bulleted_list_item"]["children"]
+        self.assertEqual([_text(block) for block in level1], ["b"])
+        level2 = level1[0]["bulleted_list_item"]["children"]
+        self.assertEqual(NOTION_MAX_NESTING_DEPTH, 2)
+        self.assertEqual([_text(block) for block in level2], ["c", "d"])
+        self.assertNotIn("children", level2[0]["bulleted_list_item"])
+
+    def test_inline_annotations(self):
+        """굵게, 인라인 코드, 링크 서식을 rich_text 항목으로 나누는지 확인"""
+        items = parse_inline("**굵게** 와 `code` 및 [문서](https://example.com)")
+
+        self.assertEqual(items[0]["annotations"], {"bold": True})
+        self.assertEqual(items[2]["annotations"], {"code": True})
+        self.assertEqual(
+            items[4]["text"],
+            {"content": "문서", "link": {"url": "https://example.com"}},
+        )
+        self.assertEqual("".join(i["text"]["content"] for i in items), "굵게 와 code 및 문서")
+
+    def test_long_paragraph_is_split_under_text_limit(self):
+        """긴 문단이 글자 수 제한 이하의 rich_text 항목 여러 개로 나뉘는지 확인"""
+        content = "가" * (NOTION_TEXT_LIMIT * 2 + 10)
+
+        blocks = markdown_to_blocks(content)
+
+        items = blocks[0]["paragraph"]["rich_text"]
+        self.assertEqual(len(items), 3)
+        self.assertTrue(all(len(i["text"]["content"]) <= NOTION_TEXT_LIMIT for i in items))
+        self.assertEqual(_text(blocks[0]), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import threading
+import unittest
+
+from scripts.api.metrics import MetricsRegistry
+
+
+class MetricsRegistryTestCase(unittest.TestCase):
+    """스레드별 샤드 지표 수집기 테스트"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """버킷 경계와 같은 값은 해당 버킷에 포함되고 누적 개수로 출력되는지 확인"""
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            registry.observe_request("POST", "/daily-logs", 201, seconds)
+
+        text = registry.render()
+
+        prefix = 'work_logging_http_request_duration_seconds_bucket{method="POST",'
+        self.assertIn(prefix + 'route="/daily-logs",le="0.1"} 2', text)
+        self.assertIn(prefix + 'route="/daily-logs",le="1"} 3', text)
+        self.assertIn(prefix + 'route="/daily-logs",le="+Inf"} 4', text)
+        self.assertIn(
+            'work_logging_http_request_duration_seconds_count{method="POST",'
+            'route="/daily-logs"} 4',
+            text,
+        )
+        self.assertIn(
+            'work_logging_http_requests_total{method="POST",route="/daily-logs",status="201"} 4',
+            text,
+        )
+        self.assertIn("work_logging_http_requests_in_flight 0", text)
+
+    def test_writes_from_many_threads_are_merged(self):
+        """여러 스레드에서 동시에 기록한 값이 조회 시 빠짐없이 합산되는지 확인"""
+        registry = MetricsRegistry()
+
+        def worker():
+            for _ in range(1000):
+                registry.observe_notion("pages.create", 0.2, ok=True)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        text = registry.render()
+        self.assertIn(
+            'work_logging_notion_calls_total{endpoint="pages.create",outcome="success"} 8000',
+            text,
+        )
+        self.assertIn(
+            'work_logging_notion_call_duration_seconds_sum{endpoint="pages.create"} 1600.000000',
+            text,
+        )
+
+    def test_finished_thread_shards_are_folded(self):
+        """종료된 스레드의 샤드는 합쳐서 보존하고 샤드 목록에서는 빠지는지 확인"""
+        registry = MetricsRegistry()
+
+        def worker():
+            registry.inc("http_requests_total", (("status", "201"),))
+
+        for _ in range(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        registry.inc("http_requests_total", (("status", "201"),))
+
+        snapshot = registry.snapshot()
+
+        self.assertEqual(snapshot["http_requests_total"][(("status", "201"),)], 51)
+        # 살아 있는 현재 스레드의 샤드만 남음
+        self.assertEqual(len(registry._shards), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
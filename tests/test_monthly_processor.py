@@ -1,8 +1,8 @@
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from scripts.monthly_processor import MonthlyProcessor
+from scripts.monthly_processor import MonthlyProcessor, resolve_month_range
 
 
 class MonthlyProcessorTestCase(unittest.TestCase):
@@ -14,7 +14,7 @@ class MonthlyProcessorTestCase(unittest.TestCase):
         self.mock_notion = MagicMock()
         self.mock_claude = MagicMock()
         self.processor = MonthlyProcessor(
-            notion_client=self.mock_notion, claude_client=self.mock_claude
+            notion_client=self.mock_notion, llm_client=self.mock_claude
         )
 
     def test_run_with_no_weekly_data(self):
@@ -51,17 +51,21 @@ class MonthlyProcessorTestCase(unittest.TestCase):
         }
 
         self.mock_notion.get_weekly_achievements_with_content.return_value = weekly_data
-        self.mock_claude.generate_monthly_summary.return_value = summary_result
+        self.mock_claude.stream_monthly_summary.return_value = iter(["월간 성과 요약"])
+        self.mock_claude.parse_monthly_response.return_value = summary_result
 
-        result = self.processor.run(
-            start_date=self.start_date,
-            end_date=self.end_date,
-            year=2025,
-            month=11,
-            dry_run=True,
-        )
+        with patch("builtins.print"):
+            result = self.processor.run(
+                start_date=self.start_date,
+                end_date=self.end_date,
+                year=2025,
+                month=11,
+                dry_run=True,
+            )
 
         self.assertEqual(result, summary_result)
+        self.mock_claude.stream_monthly_summary.assert_called_once_with(weekly_data)
+        self.mock_claude.generate_monthly_summary.assert_not_called()
         self.mock_notion.create_monthly_highlight.assert_not_called()
 
     def test_run_with_persist(self):
@@ -107,5 +111,161 @@ class MonthlyProcessorTestCase(unittest.TestCase):
         self.assertIn("총 주간 성과 수: 2개", call_kwargs["stats_text"])
 
 
+def _weekly_page(page_id: str, period_start: str) -> dict:
+    return {
+        "id": page_id,
+        "properties": {"Period Start": {"date": {"start": period_start}}},
+        "content": f"{page_id} 성과",
+    }
+
+
+class MonthlyRangeTestCase(unittest.TestCase):
+    """여러 달을 한 번에 처리하는 범위 모드 테스트"""
+
+    def setUp(self):
+        self.mock_notion = MagicMock()
+        self.mock_llm = MagicMock()
+        self.mock_llm.generate_monthly_summary.side_effect = lambda weeks: {
+            "summary": ",".join(week["id"] for week in weeks),
+            "career_brief": "요약",
+        }
+        self.mock_llm.generate_yearly_summary.return_value = {
+            "summary": "연간 성과",
+            "career_brief": "연간 요약",
+        }
+        self.mock_notion.attach_content.side_effect = lambda pages: [
+            {**page, "content": f"{page['id']} 성과"} for page in pages
+        ]
+        self.mock_notion.create_monthly_highlight.side_effect = lambda **kwargs: {
+            "id": f"monthly-{kwargs['month']}"
+        }
+        self.processor = MonthlyProcessor(notion_client=self.mock_notion, llm_client=self.mock_llm)
+
+    def test_resolve_month_range_covers_whole_months(self):
+        """YYYY-MM 범위가 시작 월 1일부터 종료 월 말일까지로 변환되는지 확인"""
+        start, end = resolve_month_range("2025-01", "2025-02")
+
+        self.assertEqual(start, datetime(2025, 1, 1))
+        self.assertEqual(end, datetime(2025, 2, 28))
+
+    def test_range_fetches_weeks_once_and_buckets_by_month(self):
+        """주간 성과를 한 번만 조회하고 Period Start 기준으로 월별로 나누는지 확인"""
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                _weekly_page("week-1", "2025-01-06"),
+                _weekly_page("week-2", "2025-01-27"),
+                _weekly_page("week-3", "2025-03-03"),
+            ]
+        )
+
+        outcome = self.processor.run_range(datetime(2025, 1, 1), datetime(2025, 3, 31), yearly=True)
+
+        self.mock_notion.iter_weekly_achievements.assert_called_once_with(
+            datetime(2025, 1, 1), datetime(2025, 3, 31)
+        )
+        self.mock_notion.get_weekly_achievements_with_content.assert_not_called()
+        self.assertEqual(
+            [result["status"] for result in outcome["months"]],
+            ["created", "empty", "created"],
+        )
+        self.assertEqual(outcome["months"][0]["summary"]["summary"], "week-1,week-2")
+        self.assertEqual(self.mock_notion.create_monthly_highlight.call_count, 2)
+
+        monthly_inputs = self.mock_llm.generate_yearly_summary.call_args.args[0]
+        self.assertEqual([item["month"] for item in monthly_inputs], [1, 3])
+        self.assertEqual(outcome["yearly"]["summary"], "연간 성과")
+
+    def test_range_skips_months_with_existing_highlights(self):
+        """월간 하이라이트가 이미 있는 달은 다시 생성하지 않고 연간 요약에는 저장된 본문을 쓰는지 확인"""
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                _weekly_page("week-1", "2025-01-06"),
+                _weekly_page("week-2", "2025-02-03"),
+            ]
+        )
+        stored_page = {
+            "id": "monthly-existing",
+            "properties": {"Year-Month": {"date": {"start": "2025-01-01T00:00:00"}}},
+        }
+        self.mock_notion.iter_monthly_highlights.return_value = iter([stored_page])
+        self.mock_notion.attach_content.side_effect = lambda pages: [
+            {**page, "content": "1월 저장 본문" if page["id"] == "monthly-existing" else "성과"}
+            for page in pages
+        ]
+
+        outcome = self.processor.run_range(datetime(2025, 1, 1), datetime(2025, 2, 28), yearly=True)
+
+        self.assertEqual([result["status"] for result in outcome["months"]], ["skipped", "created"])
+        # 건너뛴 달의 주간 성과는 본문을 읽지 않음
+        first_fetch = self.mock_notion.attach_content.call_args_list[0].args[0]
+        self.assertEqual([page["id"] for page in first_fetch], ["week-2"])
+        self.mock_llm.generate_monthly_summary.assert_called_once()
+        self.mock_notion.create_monthly_highlight.assert_called_once()
+        monthly_inputs = self.mock_llm.generate_yearly_summary.call_args.args[0]
+        self.assertEqual(
+            [(item["month"], item["summary"]) for item in monthly_inputs],
+            [(1, "1월 저장 본문"), (2, "week-2")],
+        )
+
+    def test_range_dry_run_skips_save(self):
+        """Dry-run 범위 모드에서는 Notion에 저장하지 않는지 확인"""
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                _weekly_page("week-1", "2025-01-06"),
+            ]
+        )
+
+        outcome = self.processor.run_range(
+            datetime(2025, 1, 1), datetime(2025, 1, 31), dry_run=True
+        )
+
+        self.assertEqual(outcome["months"][0]["status"], "dry_run")
+        self.assertIsNone(outcome["yearly"])
+        self.mock_notion.create_monthly_highlight.assert_not_called()
+
+    def test_range_marks_month_with_failed_content_as_failed(self):
+        """본문 조회에 실패한 주간 성과가 있는 달은 저장하지 않고 실패로 보고하는지 확인"""
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                _weekly_page("week-1", "2025-01-06"),
+                _weekly_page("week-2", "2025-02-03"),
+            ]
+        )
+        self.mock_notion.attach_content.side_effect = lambda pages: [
+            {**page, "content": "", "content_error": "timeout"}
+            if page["id"] == "week-1"
+            else {**page, "content": "성과"}
+            for page in pages
+        ]
+
+        outcome = self.processor.run_range(datetime(2025, 1, 1), datetime(2025, 2, 28))
+
+        self.assertEqual([result["status"] for result in outcome["months"]], ["failed", "created"])
+        self.assertIn("week-1", outcome["months"][0]["error"])
+        self.mock_notion.create_monthly_highlight.assert_called_once()
+
+    def test_range_skips_yearly_summary_when_a_month_failed(self):
+        """실패한 달이 있으면 일부 달이 빠진 연간 요약을 만들지 않는지 확인"""
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                _weekly_page("week-1", "2025-01-06"),
+                _weekly_page("week-2", "2025-02-03"),
+            ]
+        )
+
+        def summarize(weeks):
+            if weeks[0]["id"] == "week-1":
+                raise RuntimeError("LLM 오류")
+            return {"summary": "2월", "career_brief": "요약"}
+
+        self.mock_llm.generate_monthly_summary.side_effect = summarize
+
+        outcome = self.processor.run_range(datetime(2025, 1, 1), datetime(2025, 2, 28), yearly=True)
+
+        self.assertEqual([result["status"] for result in outcome["months"]], ["failed", "created"])
+        self.assertIsNone(outcome["yearly"])
+        self.mock_llm.generate_yearly_summary.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,465 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import closing
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.page_cache import PageCache
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+
+
+def _make_wrapper(**kwargs) -> NotionClientWrapper:
+    """테스트용 환경 변수로 래퍼를 만들고 내부 클라이언트를 목으로 교체"""
+    env = {
+        "NOTION_API_KEY": "secret_test",
+        "NOTION_DB1_ID": "daily-db",
+        "NOTION_DB2_ID": "weekly-db",
+        "NOTION_DB3_ID": "monthly-db",
+    }
+    kwargs.setdefault("scheduler", RequestScheduler(rate=10_000, burst=10_000))
+    with patch.dict(os.environ, env):
+        wrapper = NotionClientWrapper(settings=Settings.from_env(), **kwargs)
+    wrapper.client = MagicMock()
+    return wrapper
+
+
+def _paragraph(text: str) -> dict:
+    return {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"text": {"content": text}}]},
+    }
+
+
+class ContentEnrichmentTestCase(unittest.TestCase):
+    """본문 병렬 조회 동작을 검증하는 테스트 케이스"""
+
+    def test_enrichment_keeps_original_order(self):
+        """늦게 끝난 요청이 있어도 결과 순서가 조회 순서와 같은지 확인"""
+        wrapper = _make_wrapper(max_concurrency=4)
+        page_ids = [f"page-{idx}" for idx in range(8)]
+        wrapper.client.databases.query.return_value = {
+            "results": [{"id": page_id} for page_id in page_ids],
+            "has_more": False,
+        }
+
+        def list_children(block_id, **_kwargs):
+            # 앞쪽 페이지일수록 늦게 응답하도록 지연
+            time.sleep(0.01 * (8 - int(block_id.split("-")[1])))
+            return {"results": [_paragraph(f"{block_id} 본문")], "has_more": False}
+
+        wrapper.client.blocks.children.list.side_effect = list_children
+
+        logs = wrapper.get_daily_logs_with_content(datetime(2025, 11, 3), datetime(2025, 11, 9))
+
+        self.assertEqual([log["id"] for log in logs], page_ids)
+        self.assertEqual(logs[3]["content"], "page-3 본문")
+
+    def test_enrichment_respects_concurrency_limit(self):
+        """동시에 진행되는 본문 조회 수가 설정값을 넘지 않는지 확인"""
+        wrapper = _make_wrapper(max_concurrency=2)
+        wrapper.client.databases.query.return_value = {
+            "results": [{"id": f"page-{idx}"} for idx in range(6)],
+            "has_more": False,
+        }
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def list_children(block_id, **_kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return {"results": [], "has_more": False}
+
+        wrapper.client.blocks.children.list.side_effect = list_children
+
+        wrapper.get_daily_logs_with_content(datetime(2025, 11, 3), datetime(2025, 11, 9))
+
+        self.assertLessEqual(state["peak"], 2)
+
+    def test_enrichment_reports_failures_per_page(self):
+        """일부 페이지 조회가 실패해도 나머지 결과와 실패 사유가 함께 반환되는지 확인"""
+        wrapper = _make_wrapper()
+        wrapper.client.databases.query.return_value = {
+            "results": [{"id": "page-ok"}, {"id": "page-broken"}, {}],
+            "has_more": False,
+        }
+
+        def list_children(block_id, **_kwargs):
+            if block_id == "page-broken":
+                raise RuntimeError("boom")
+            return {"results": [_paragraph("정상 본문")], "has_more": False}
+
+        wrapper.client.blocks.children.list.side_effect = list_children
+
+        logs = wrapper.get_daily_logs_with_content(datetime(2025, 11, 3), datetime(2025, 11, 9))
+
+        self.assertEqual(len(logs), 2)
+        self.assertEqual(logs[0]["content"], "정상 본문")
+        self.assertNotIn("content_error", logs[0])
+        self.assertEqual(logs[1]["content"], "")
+        self.assertEqual(logs[1]["content_error"], "boom")
+
+
+class PaginationTestCase(unittest.TestCase):
+    """커서 기반 페이지네이션 동작을 검증하는 테스트 케이스"""
+
+    @staticmethod
+    def _paged_responses(items: list[dict], page_size: int) -> list[dict]:
+        responses = []
+        for offset in range(0, len(items), page_size):
+            has_more = offset + page_size < len(items)
+            responses.append(
+                {
+                    "results": items[offset : offset + page_size],
+                    "has_more": has_more,
+                    "next_cursor": f"cursor-{offset + page_size}" if has_more else None,
+                }
+            )
+        return responses
+
+    def test_daily_logs_follow_next_cursor(self):
+        """100건을 넘는 쿼리 결과를 커서를 따라 모두 가져오는지 확인"""
+        wrapper = _make_wrapper()
+        pages = [{"id": f"page-{idx}"} for idx in range(250)]
+        wrapper.client.databases.query.side_effect = self._paged_responses(pages, 100)
+
+        logs = wrapper.get_daily_logs(datetime(2025, 1, 1), datetime(2025, 12, 31))
+
+        self.assertEqual(len(logs), 250)
+        calls = wrapper.client.databases.query.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertNotIn("start_cursor", calls[0].kwargs)
+        self.assertEqual(calls[1].kwargs["start_cursor"], "cursor-100")
+        self.assertEqual(calls[2].kwargs["page_size"], 100)
+
+    def test_iter_daily_logs_is_lazy(self):
+        """제너레이터가 소비한 만큼만 다음 페이지를 요청하는지 확인"""
+        wrapper = _make_wrapper()
+        pages = [{"id": f"page-{idx}"} for idx in range(30)]
+        wrapper.client.databases.query.side_effect = self._paged_responses(pages, 10)
+
+        iterator = wrapper.iter_daily_logs(
+            datetime(2025, 1, 1), datetime(2025, 12, 31), page_size=10
+        )
+        first = next(iterator)
+
+        self.assertEqual(first["id"], "page-0")
+        self.assertEqual(wrapper.client.databases.query.call_count, 1)
+        self.assertEqual(wrapper.client.databases.query.call_args.kwargs["page_size"], 10)
+
+    def test_page_content_reads_all_block_pages(self):
+        """블록이 여러 페이지로 나뉘어도 본문이 잘리지 않는지 확인"""
+        wrapper = _make_wrapper()
+        blocks = [_paragraph(f"line {idx}") for idx in range(150)]
+        wrapper.client.blocks.children.list.side_effect = self._paged_responses(blocks, 100)
+
+        content = wrapper.get_page_content("page-1")
+
+        self.assertEqual(len(content.split("\n")), 150)
+        self.assertTrue(content.endswith("line 149"))
+
+    def test_weekly_achievements_follow_next_cursor(self):
+        """주간 성과 조회도 모든 페이지를 가져오는지 확인"""
+        wrapper = _make_wrapper()
+        pages = [{"id": f"week-{idx}"} for idx in range(120)]
+        wrapper.client.databases.query.side_effect = self._paged_responses(pages, 100)
+        wrapper.client.blocks.children.list.return_value = {
+            "results": [],
+            "has_more": False,
+        }
+
+        weeks = wrapper.get_weekly_achievements_with_content(
+            datetime(2025, 1, 1), datetime(2025, 12, 31)
+        )
+
+        self.assertEqual(len(weeks), 120)
+
+
+class BlockTreeContentTestCase(unittest.TestCase):
+    """블록 트리를 마크다운으로 복원하는 본문 조회 테스트"""
+
+    @staticmethod
+    def _serve(wrapper: NotionClientWrapper, blocks: list[dict]):
+        """markdown_to_blocks 결과를 Notion 응답처럼 ID/has_children을 붙여 제공"""
+        tree: dict[str, list[dict]] = {}
+
+        def register(parent_id: str, children: list[dict]):
+            tree[parent_id] = []
+            for idx, block in enumerate(children):
+                block_id = f"{parent_id}/{idx}"
+                nested = block[block["type"]].pop("children", [])
+                tree[parent_id].append({**block, "id": block_id, "has_children": bool(nested)})
+                if nested:
+                    register(block_id, nested)
+
+        register("page-1", blocks)
+
+        def list_children(block_id, **_kwargs):
+            return {"results": tree[block_id], "has_more": False}
+
+        wrapper.client.blocks.children.list.side_effect = list_children
+
+    def test_round_trips_written_markdown(self):
+        """직접 쓴 목록/코드/인용/할 일과 중첩 자식까지 본문에 복원되는지 확인"""
+        from scripts.utils.markdown_blocks import markdown_to_blocks
+
+        markdown = "\n".join(
+            [
+                "### Action",
+                "**캐시** 계층 도입 ([문서](https://example.com))",
+                "1. 느린 쿼리 식별",
+                "2. 인덱스 추가",
+                "  - `orders` 복합 인덱스",
+                "- [x] 부하 테스트",
+                "> p95 320ms",
+                "```python",
+                "print(1)",
+                "```",
+            ]
+        )
+        wrapper = _make_wrapper()
+        self._serve(wrapper, markdown_to_blocks(markdown))
+
+        self.assertEqual(wrapper.get_page_content("page-1"), markdown)
+
+    def test_synced_blocks_are_fetched_once_and_depth_is_limited(self):
+        """같은 원본의 동기화 블록은 한 번만 조회하고 깊이 제한 아래로는 내려가지 않는지 확인"""
+        wrapper = _make_wrapper()
+        wrapper.max_block_depth = 1
+        synced = {
+            "type": "synced_block",
+            "has_children": True,
+            "synced_block": {"synced_from": {"block_id": "origin"}},
+        }
+        tree = {
+            "page-1": [{**synced, "id": "copy-1"}, {**synced, "id": "copy-2"}],
+            "origin": [{**_paragraph("공통 안내"), "id": "origin/0", "has_children": True}],
+            "origin/0": [_paragraph("너무 깊은 본문")],
+        }
+        calls: list[str] = []
+
+        def list_children(block_id, **_kwargs):
+            calls.append(block_id)
+            return {"results": tree[block_id], "has_more": False}
+
+        wrapper.client.blocks.children.list.side_effect = list_children
+
+        content = wrapper.get_page_content("page-1")
+
+        self.assertEqual(content, "공통 안내\n공통 안내")
+        self.assertEqual(calls, ["page-1", "origin"])
+
+
+class PageCacheTestCase(unittest.TestCase):
+    """로컬 페이지 캐시 read-through 및 증분 동기화 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PageCache(os.path.join(self.tmpdir.name, "cache.sqlite3"))
+        self.wrapper = _make_wrapper(cache=self.cache)
+        self.wrapper.client.blocks.children.list.side_effect = lambda block_id, **_kwargs: {
+            "results": [_paragraph(f"{block_id} 본문")],
+            "has_more": False,
+        }
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _query_returns(self, pages: list[dict]):
+        self.wrapper.client.databases.query.return_value = {
+            "results": pages,
+            "has_more": False,
+        }
+
+    def test_unchanged_pages_are_served_from_cache(self):
+        """수정 시각이 같은 페이지는 다시 실행해도 블록을 조회하지 않는지 확인"""
+        pages = [
+            {"id": "page-1", "last_edited_time": "2025-11-03T09:00:00.000Z"},
+            {"id": "page-2", "last_edited_time": "2025-11-04T09:00:00.000Z"},
+        ]
+        self._query_returns(pages)
+        period = (datetime(2025, 11, 3), datetime(2025, 11, 9))
+
+        first = self.wrapper.get_daily_logs_with_content(*period)
+        second = self.wrapper.get_daily_logs_with_content(*period)
+
+        self.assertEqual(self.wrapper.client.blocks.children.list.call_count, 2)
+        self.assertEqual([log["content"] for log in first], [log["content"] for log in second])
+
+    def test_edited_page_is_fetched_again(self):
+        """last_edited_time이 바뀐 페이지만 다시 조회하는지 확인"""
+        pages = [
+            {"id": "page-1", "last_edited_time": "2025-11-03T09:00:00.000Z"},
+            {"id": "page-2", "last_edited_time": "2025-11-04T09:00:00.000Z"},
+        ]
+        self._query_returns(pages)
+        period = (datetime(2025, 11, 3), datetime(2025, 11, 9))
+        self.wrapper.get_daily_logs_with_content(*period)
+
+        pages[1] = {**pages[1], "last_edited_time": "2025-11-10T09:00:00.000Z"}
+        self._query_returns(pages)
+        self.wrapper.get_daily_logs_with_content(*period)
+
+        fetched = [
+            call.kwargs["block_id"]
+            for call in self.wrapper.client.blocks.children.list.call_args_list
+        ]
+        self.assertEqual(fetched, ["page-1", "page-2", "page-2"])
+
+    def test_page_cached_within_its_edit_minute_is_refetched(self):
+        """수정된 분이 끝나기 전에 캐시한 본문은 같은 분의 추가 수정 여부를 몰라 다시 조회하는지 확인"""
+        pages = [{"id": "page-1", "last_edited_time": "2025-11-03T09:00:00.000Z"}]
+        edited_at = datetime(2025, 11, 3, 9, 0, 30, tzinfo=UTC).timestamp()
+
+        with patch("scripts.utils.page_cache.time.time", return_value=edited_at):
+            self.cache.put_pages([{**pages[0], "content": "수정 전 본문"}])
+        self.assertEqual(self.cache.get_contents(pages), {})
+
+        with patch("scripts.utils.page_cache.time.time", return_value=edited_at + 60):
+            self.cache.put_pages([{**pages[0], "content": "최종 본문"}])
+        self.assertEqual(self.cache.get_contents(pages), {"page-1": "최종 본문"})
+
+    def test_sync_uses_watermark_filter(self):
+        """두 번째 동기화부터 워터마크 이후 수정분만 조회하는지 확인"""
+        self._query_returns(
+            [
+                {"id": "page-1", "last_edited_time": "2025-11-03T09:00:00.000Z"},
+                {"id": "page-2", "last_edited_time": "2025-11-05T09:00:00.000Z"},
+            ]
+        )
+
+        changed = self.wrapper.sync_cache()
+
+        self.assertEqual(len(changed), 2)
+        first_call = self.wrapper.client.databases.query.call_args.kwargs
+        self.assertNotIn("filter", first_call)
+        self.assertEqual(self.cache.get_watermark("daily-db"), "2025-11-05T09:00:00.000Z")
+
+        self._query_returns([])
+        self.wrapper.sync_cache()
+
+        second_call = self.wrapper.client.databases.query.call_args.kwargs
+        self.assertEqual(
+            second_call["filter"]["last_edited_time"]["on_or_after"],
+            "2025-11-05T09:00:00.000Z",
+        )
+        cached = self.cache.get_pages("daily-db")
+        self.assertEqual([page["id"] for page in cached], ["page-1", "page-2"])
+        self.assertEqual(cached[0]["content"], "page-1 본문")
+
+    def test_entries_from_older_content_format_are_dropped(self):
+        """본문 형식 버전이 다른 캐시 파일을 열면 이전 형식 항목과 워터마크를 버리는지 확인"""
+        page = {"id": "page-1", "last_edited_time": "2025-11-03T09:00:00.000Z"}
+        self.cache.put_pages([{**page, "content": "이전 형식 본문"}], database_id="daily-db")
+        self.cache.set_watermark("daily-db", page["last_edited_time"])
+        with closing(self.cache._connect()) as conn, conn:
+            conn.execute("UPDATE meta SET value = '1' WHERE key = 'content_format'")
+
+        reopened = PageCache(self.cache.path)
+
+        self.assertEqual(reopened.get_contents([page]), {})
+        self.assertEqual(reopened.get_pages("daily-db"), [])
+        self.assertIsNone(reopened.get_watermark("daily-db"))
+        # 같은 버전으로 다시 열면 새로 저장한 항목은 유지
+        reopened.put_pages([{**page, "content": "새 형식 본문"}], database_id="daily-db")
+        self.assertEqual(len(PageCache(self.cache.path).get_pages("daily-db")), 1)
+
+
+class ChunkedPageWriteTestCase(unittest.TestCase):
+    """긴 본문을 묶음 단위로 나눠 저장하는지 검증"""
+
+    def test_long_context_is_appended_in_order(self):
+        """children 100개 초과분은 페이지 생성 후 순서대로 append되는지 확인"""
+        wrapper = _make_wrapper()
+        wrapper.client.pages.create.return_value = {"id": "page-1"}
+        context = "\n\n".join(f"문단 {idx}" for idx in range(250))
+
+        page = wrapper.create_daily_log(
+            title="긴 로그",
+            context=context,
+            category="기타",
+            impact_level="Low",
+            tech_stack=[],
+        )
+
+        self.assertEqual(page["id"], "page-1")
+        created = wrapper.client.pages.create.call_args.kwargs["children"]
+        appends = [call.kwargs for call in wrapper.client.blocks.children.append.call_args_list]
+        self.assertEqual(len(created), 100)
+        self.assertEqual([len(call["children"]) for call in appends], [100, 51])
+        self.assertTrue(all(call["block_id"] == "page-1" for call in appends))
+
+        texts = [
+            block["paragraph"]["rich_text"][0]["text"]["content"]
+            for block in created[1:] + appends[0]["children"] + appends[1]["children"]
+        ]
+        self.assertEqual(texts, [f"문단 {idx}" for idx in range(250)])
+
+    def test_failed_append_archives_partial_page(self):
+        """중간 append가 실패하면 본문이 잘린 페이지를 보관 처리하고 예외를 전파하는지 확인"""
+        wrapper = _make_wrapper()
+        wrapper.client.pages.create.return_value = {"id": "page-1"}
+        wrapper.client.blocks.children.append.side_effect = RuntimeError("append failed")
+        context = "\n\n".join(f"문단 {idx}" for idx in range(250))
+
+        with self.assertRaises(RuntimeError):
+            wrapper.create_daily_log(
+                title="긴 로그",
+                context=context,
+                category="기타",
+                impact_level="Low",
+                tech_stack=[],
+            )
+
+        wrapper.client.blocks.children.append.assert_called_once()
+        wrapper.client.pages.update.assert_called_once_with(page_id="page-1", archived=True)
+
+    def test_long_summary_is_split_under_text_limit(self):
+        """긴 요약이 2000자 이하 rich_text 항목으로 나뉘어 한 번에 저장되는지 확인"""
+        wrapper = _make_wrapper()
+        wrapper.client.pages.create.return_value = {"id": "page-1"}
+        summary = "가" * 4500
+
+        wrapper.create_monthly_highlight(2025, 11, summary, "요약", ["week-1"], "주간 1건")
+
+        children = wrapper.client.pages.create.call_args.kwargs["children"]
+        items = children[1]["paragraph"]["rich_text"]
+        self.assertEqual([len(item["text"]["content"]) for item in items], [2000, 2000, 500])
+        wrapper.client.blocks.children.append.assert_not_called()
+
+
+class NotionObserverTestCase(unittest.TestCase):
+    """Notion 호출 지표 훅 테스트"""
+
+    def test_observer_receives_endpoint_duration_and_outcome(self):
+        """호출마다 엔드포인트 이름, 소요 시간, 성공 여부가 전달되는지 확인"""
+        calls = []
+        wrapper = _make_wrapper(observer=lambda *args: calls.append(args))
+
+        def update(**_kwargs):
+            return {"id": "page-1"}
+
+        update.__qualname__ = "PagesEndpoint.update"
+        wrapper.client.pages.update = update
+        wrapper.update_log_status("page-1", "Published")
+
+        wrapper.client.blocks.children.list.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            wrapper.get_page_content("page-1")
+
+        self.assertEqual(calls[0][0], "pages.update")
+        self.assertTrue(calls[0][2])
+        self.assertGreaterEqual(calls[0][1], 0)
+        self.assertFalse(calls[1][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
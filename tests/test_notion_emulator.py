@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime
+
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.notion_emulator import EmulatedAPIError, NotionEmulator
+from scripts.utils.rate_limiter import RequestScheduler
+from scripts.utils.settings import Settings
+
+
+class _FakeClock:
+    """sleep 호출만큼 시간이 흐르는 가짜 시계 (에뮬레이터와 스케줄러가 공유)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def _wrapper(emulator: NotionEmulator, clock: _FakeClock) -> NotionClientWrapper:
+    scheduler = RequestScheduler(
+        rate=10_000, burst=10_000, clock=clock, sleep=clock.sleep, jitter=lambda: 0.5
+    )
+    return NotionClientWrapper(
+        client=emulator,
+        scheduler=scheduler,
+        settings=Settings(notion_daily_db="daily-db", notion_weekly_db="weekly-db"),
+    )
+
+
+class NotionEmulatorTestCase(unittest.TestCase):
+    """인메모리 Notion 에뮬레이터로 래퍼의 실제 API 사용 경로를 검증"""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _emulator(self, **kwargs) -> NotionEmulator:
+        emulator = NotionEmulator(sleep=self.clock.sleep, clock=self.clock, **kwargs)
+        emulator.add_database("daily-db")
+        emulator.add_database("weekly-db")
+        return emulator
+
+    def test_query_filters_sorts_and_paginates(self):
+        """날짜/상태 필터와 정렬을 적용하고 커서를 따라 모든 결과를 가져오는지 확인"""
+        emulator = self._emulator()
+        emulator.populate_daily_logs("daily-db", count=60)
+        notion = _wrapper(emulator, self.clock)
+
+        logs = notion.get_daily_logs(
+            datetime(2025, 1, 7), datetime(2025, 1, 16), "Logged", page_size=10
+        )
+
+        dates = [log["properties"]["Logged Date"]["date"]["start"] for log in logs]
+        self.assertEqual(len(logs), 30)
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual((dates[0], dates[-1]), ("2025-01-07", "2025-01-16"))
+        self.assertEqual(emulator.calls["databases.query"], 3)
+
+    def test_query_sees_pages_written_after_previous_query(self):
+        """같은 조건의 쿼리를 반복해도 그 사이에 생성/수정한 페이지가 반영되는지 확인"""
+        emulator = self._emulator()
+        emulator.populate_daily_logs("daily-db", count=3)
+        notion = _wrapper(emulator, self.clock)
+        period = (datetime(2025, 1, 6), datetime(2025, 1, 6), "Logged")
+        first = notion.get_daily_logs(*period)
+
+        notion.update_log_status(first[0]["id"], "Archived")
+        notion.create_daily_log(
+            title="추가 로그",
+            context="본문",
+            category="기타",
+            impact_level="Low",
+            tech_stack=["Python"],
+            logged_date=datetime(2025, 1, 6),
+        )
+
+        second = notion.get_daily_logs(*period)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 3)
+        self.assertNotIn(first[0]["id"], [log["id"] for log in second])
+
+    def test_long_page_round_trips_through_chunked_appends(self):
+        """children 100개 제한을 넘는 본문을 나눠 저장하고 그대로 다시 읽는지 확인"""
+        emulator = self._emulator()
+        notion = _wrapper(emulator, self.clock)
+        context = "\n".join(f"- 항목 {idx}" for idx in range(250))
+
+        page = notion.create_daily_log(
+            title="긴 로그",
+            context=context,
+            category="기타",
+            impact_level="Low",
+            tech_stack=["Python"],
+            logged_date=datetime(2025, 1, 6),
+        )
+
+        self.assertEqual(emulator.calls["pages.create"], 1)
+        self.assertGreaterEqual(emulator.calls["blocks.children.append"], 2)
+        self.assertIn("- 항목 249", notion.get_page_content(page["id"]))
+        with self.assertRaises(EmulatedAPIError) as ctx:
+            emulator.blocks.children.append(
+                block_id=page["id"],
+                children=[{"type": "divider", "divider": {}}] * 101,
+            )
+        self.assertEqual(ctx.exception.status, 400)
+
+    def test_rate_limited_requests_are_retried(self):
+        """서버 측 속도 제한으로 429가 나도 스케줄러 재시도로 모두 성공하는지 확인"""
+        emulator = self._emulator(rate_limit=3.0, burst=3, latency=0.01)
+        emulator.populate_daily_logs("daily-db", count=12, blocks_per_page=2)
+        notion = _wrapper(emulator, self.clock)
+
+        logs = notion.get_daily_logs_with_content(datetime(2025, 1, 6), datetime(2025, 1, 9))
+
+        self.assertEqual(len(logs), 12)
+        self.assertTrue(all("content_error" not in log for log in logs))
+        self.assertGreater(emulator.rate_limited, 0)
+        self.assertEqual(notion.scheduler.stats["failures"], 0)
+
+    def test_same_seed_gives_same_ids(self):
+        """시드가 같으면 생성되는 페이지 ID가 같은지 확인"""
+        first = self._emulator(seed=3).populate_daily_logs("daily-db", count=5)
+        second = self._emulator(seed=3).populate_daily_logs("daily-db", count=5)
+        self.assertEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
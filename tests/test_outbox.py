@@ -0,0 +1,257 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+import uuid
+from contextlib import closing
+
+import httpx
+from fastapi.testclient import TestClient
+
+from scripts.api import app as app_module
+from scripts.api.app import app, get_notion_client, stop_outbox_worker
+from scripts.api.outbox import (
+    STATUS_FAILED,
+    STATUS_PROCESSING,
+    STATUS_QUEUED,
+    STATUS_SUCCEEDED,
+    OutboxStore,
+    OutboxWorker,
+    is_pre_write_error,
+)
+
+
+class _RateLimitedError(Exception):
+    status = 429
+
+
+class OutboxStoreTestCase(unittest.TestCase):
+    """아웃박스 저장소와 워커 동작을 검증하는 테스트 케이스"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = OutboxStore(os.path.join(self.tmpdir.name, "outbox.sqlite3"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_worker_processes_jobs_in_order(self):
+        """등록 순서대로 처리하고 결과를 저장하는지 확인"""
+        processed = []
+
+        def handler(payload):
+            processed.append(payload["title"])
+            return f"page-{payload['title']}", "https://notion.so/x"
+
+        first = self.store.enqueue({"title": "a"})
+        second = self.store.enqueue({"title": "b"})
+        worker = OutboxWorker(self.store, handler)
+
+        while worker.run_once():
+            pass
+
+        self.assertEqual(processed, ["a", "b"])
+        self.assertEqual(self.store.get(first)["status"], STATUS_SUCCEEDED)
+        self.assertEqual(self.store.get(second)["page_id"], "page-b")
+
+    def test_failed_job_is_retried_then_given_up(self):
+        """429로 실패한 작업을 재시도 대기열로 돌리고 최대 횟수 후 실패 처리하는지 확인"""
+
+        def handler(_payload):
+            raise _RateLimitedError("rate limited")
+
+        job_id = self.store.enqueue({"title": "a"})
+        worker = OutboxWorker(self.store, handler, max_attempts=2)
+
+        worker.run_once()
+        job = self.store.get(job_id)
+        self.assertEqual(job["status"], STATUS_QUEUED)
+        self.assertEqual(job["error"], "rate limited")
+        # 재시도 대기 시간 전에는 다시 꺼내지 않음
+        self.assertFalse(worker.run_once())
+
+        with self.store._connect() as conn:
+            conn.execute("UPDATE jobs SET available_at = 0")
+        worker.run_once()
+
+        job = self.store.get(job_id)
+        self.assertEqual(job["status"], STATUS_FAILED)
+        self.assertEqual(job["attempts"], 2)
+
+    def test_write_errors_are_not_retried(self):
+        """쓰기가 반영됐을 수 있는 오류는 중복 저장을 막기 위해 바로 실패 처리하는지 확인"""
+        calls = []
+
+        def handler(_payload):
+            calls.append(1)
+            raise RuntimeError("append failed")
+
+        job_id = self.store.enqueue({"title": "a"})
+        worker = OutboxWorker(self.store, handler, max_attempts=5)
+
+        worker.run_once()
+
+        job = self.store.get(job_id)
+        self.assertEqual(job["status"], STATUS_FAILED)
+        self.assertEqual(job["attempts"], 1)
+        self.assertFalse(worker.run_once())
+        self.assertEqual(len(calls), 1)
+
+    def test_connection_errors_are_retryable(self):
+        """요청이 전송되지 않은 연결 실패와 429만 재시도 대상으로 분류하는지 확인"""
+        request = httpx.Request("POST", "https://api.notion.com/v1/pages")
+
+        self.assertTrue(is_pre_write_error(_RateLimitedError("rate limited")))
+        self.assertTrue(is_pre_write_error(httpx.ConnectError("refused", request=request)))
+        self.assertFalse(is_pre_write_error(httpx.ReadTimeout("timeout", request=request)))
+        self.assertFalse(is_pre_write_error(RuntimeError("boom")))
+
+    def test_only_expired_leases_are_requeued(self):
+        """다른 워커가 임대 중인 작업은 두고, 임대가 만료된 작업만 다시 큐에 넣는지 확인"""
+        job_id = self.store.enqueue({"title": "a"})
+        self.store.claim_next("worker-a", lease_seconds=60)
+
+        reopened = OutboxStore(self.store.path)
+        self.assertEqual(reopened.requeue_stale(), 0)
+        self.assertIsNone(reopened.claim_next("worker-b"))
+        self.assertEqual(reopened.get(job_id)["status"], STATUS_PROCESSING)
+
+        with self.store._connect() as conn:
+            conn.execute("UPDATE jobs SET lease_expires_at = 0")
+        self.assertEqual(reopened.requeue_stale(), 1)
+        self.assertEqual(reopened.get(job_id)["status"], STATUS_QUEUED)
+
+    def test_expired_lease_is_claimed_by_another_worker(self):
+        """갱신이 끊긴 작업은 재시작을 기다리지 않고 다른 워커가 가져가는지 확인"""
+        job_id = self.store.enqueue({"title": "a"})
+        self.store.claim_next("worker-a", lease_seconds=60)
+        self.assertFalse(self.store.renew_lease(job_id, "worker-b", 60))
+
+        with self.store._connect() as conn:
+            conn.execute("UPDATE jobs SET lease_expires_at = 0")
+        claimed = self.store.claim_next("worker-b")
+
+        self.assertEqual(claimed[0], job_id)
+        self.assertFalse(self.store.renew_lease(job_id, "worker-a", 60))
+
+    def test_lease_is_renewed_while_handler_runs(self):
+        """처리 시간이 임대 기간보다 길어도 갱신되어 다른 워커가 가져가지 못하는지 확인"""
+        stolen = []
+
+        def handler(_payload):
+            deadline = time.monotonic() + 0.5
+            while time.monotonic() < deadline:
+                stolen.append(self.store.claim_next("worker-b", lease_seconds=0.15))
+                time.sleep(0.05)
+            return "page-a", "https://notion.so/a"
+
+        job_id = self.store.enqueue({"title": "a"})
+        worker = OutboxWorker(self.store, handler, lease_seconds=0.15)
+
+        worker.run_once()
+
+        self.assertEqual([claim for claim in stolen if claim], [])
+        job = self.store.get(job_id)
+        self.assertEqual(job["status"], STATUS_SUCCEEDED)
+        self.assertEqual(job["attempts"], 1)
+
+    def test_existing_outbox_file_gets_lease_columns(self):
+        """임대 컬럼이 없던 이전 아웃박스 파일도 열 때 컬럼을 추가하는지 확인"""
+        path = os.path.join(self.tmpdir.name, "legacy.sqlite3")
+        with closing(sqlite3.connect(path)) as conn:
+            conn.execute(
+                "CREATE TABLE jobs (id TEXT PRIMARY KEY, payload TEXT NOT NULL,"
+                " status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,"
+                " available_at REAL NOT NULL, page_id TEXT, url TEXT, error TEXT,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO jobs (id, payload, status, available_at, created_at, updated_at)"
+                " VALUES ('old', '{}', ?, 0, 0, 0)",
+                (STATUS_PROCESSING,),
+            )
+            conn.commit()
+
+        store = OutboxStore(path)
+
+        # 임대 정보가 없는 이전 processing 작업은 만료된 것으로 보고 되돌림
+        self.assertEqual(store.requeue_stale(), 1)
+        self.assertEqual(store.claim_next("worker-a")[0], "old")
+
+
+class _StubNotionClient:
+    def __init__(self):
+        self.created: list[str] = []
+
+    def create_daily_log(self, **kwargs) -> dict:
+        self.created.append(kwargs["title"])
+        return {"id": str(uuid.uuid4())}
+
+
+class AsyncIngestApiTestCase(unittest.TestCase):
+    """Prefer: respond-async 요청의 202 응답과 작업 조회를 검증"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.environ["API_OUTBOX_PATH"] = os.path.join(self.tmpdir.name, "o.sqlite3")
+        os.environ.pop("API_AUTH_TOKEN", None)
+        self.stub_notion = _StubNotionClient()
+        app.dependency_overrides[get_notion_client] = lambda: self.stub_notion
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        stop_outbox_worker()
+        app.dependency_overrides.clear()
+        os.environ.pop("API_OUTBOX_PATH", None)
+        self.tmpdir.cleanup()
+
+    def test_async_request_is_accepted_and_processed(self):
+        """202로 접수한 요청을 워커가 저장하고 상태 조회에 반영하는지 확인"""
+        payload = {
+            "title": "비동기 로그",
+            "context": "### Situation\n비동기 저장",
+            "category": "기타",
+            "impact_level": "Low",
+            "tech_stack": ["Python"],
+        }
+
+        response = self.client.post(
+            "/daily-logs", json=payload, headers={"Prefer": "respond-async"}
+        )
+
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+        self.assertEqual(response.headers["Location"], f"/jobs/{job_id}")
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            job = self.client.get(f"/jobs/{job_id}").json()
+            if job["status"] == STATUS_SUCCEEDED:
+                break
+            time.sleep(0.05)
+
+        self.assertEqual(job["status"], STATUS_SUCCEEDED)
+        self.assertTrue(job["page_id"])
+        self.assertEqual(self.stub_notion.created, ["비동기 로그"])
+
+    def test_unknown_job_returns_404(self):
+        """존재하지 않는 작업 ID 조회 시 404를 반환하는지 확인"""
+        response = self.client.get("/jobs/does-not-exist")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_job_lookup_does_not_start_worker(self):
+        """동기 모드에서 작업을 조회해도 데이터 디렉터리를 만들거나 워커를 시작하지 않는지 확인"""
+        path = os.path.join(self.tmpdir.name, "missing", "o.sqlite3")
+        os.environ["API_OUTBOX_PATH"] = path
+
+        response = self.client.get("/jobs/does-not-exist")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(os.path.exists(os.path.dirname(path)))
+        self.assertIsNone(app_module._outbox_worker)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+
+import httpx
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from scripts.utils.rate_limiter import RequestScheduler, TokenBucket
+
+
+class _FakeClock:
+    """sleep 호출만큼 시간이 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _api_error(status: int, headers: dict | None = None) -> APIResponseError:
+    response = httpx.Response(status, headers=headers or {})
+    code = APIErrorCode.RateLimited if status == 429 else APIErrorCode.InternalServerError
+    return APIResponseError(response, "error", code)
+
+
+class TokenBucketTestCase(unittest.TestCase):
+    """토큰 버킷 대기 시간 계산을 검증하는 테스트 케이스"""
+
+    def test_burst_then_steady_rate(self):
+        """버스트 한도까지는 즉시 통과하고 이후에는 rate에 맞춰 대기하는지 확인"""
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=3, capacity=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(6)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        for wait in waits[3:]:
+            self.assertAlmostEqual(wait, 1 / 3)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+
+class RequestSchedulerTestCase(unittest.TestCase):
+    """재시도/백오프 정책을 검증하는 테스트 케이스"""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.scheduler = RequestScheduler(
+            rate=1000,
+            burst=1000,
+            max_retries=3,
+            base_delay=1.0,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+            jitter=lambda: 0.5,
+        )
+
+    def test_retries_server_errors_with_backoff(self):
+        """5xx 오류를 지수 백오프로 재시도한 뒤 성공 결과를 반환하는지 확인"""
+        outcomes = [_api_error(502), _api_error(503), {"id": "ok"}]
+
+        def request():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        result = self.scheduler.call(request)
+
+        self.assertEqual(result, {"id": "ok"})
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0])
+        stats = self.scheduler.stats
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["failures"], 0)
+
+    def test_honours_retry_after(self):
+        """429 응답의 Retry-After가 백오프보다 길면 그만큼 기다리는지 확인"""
+        outcomes = [_api_error(429, {"Retry-After": "7"}), {"id": "ok"}]
+
+        def request():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.scheduler.call(request, idempotent=False)
+
+        self.assertEqual(self.clock.sleeps, [7.0])
+
+    def test_write_requests_skip_server_error_retry(self):
+        """쓰기 요청은 5xx에서 재시도하지 않는지 확인"""
+        calls = []
+
+        def request():
+            calls.append(1)
+            raise _api_error(500)
+
+        with self.assertRaises(APIResponseError):
+            self.scheduler.call(request, idempotent=False)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.scheduler.stats["failures"], 1)
+
+    def test_gives_up_after_max_retries(self):
+        """재시도 횟수를 모두 소진하면 마지막 예외를 그대로 던지는지 확인"""
+        calls = []
+
+        def request():
+            calls.append(1)
+            raise _api_error(429)
+
+        with self.assertRaises(APIResponseError):
+            self.scheduler.call(request)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(self.scheduler.stats["retries"], 3)
+
+    def test_client_errors_are_not_retried(self):
+        """400번대 검증 오류는 즉시 실패하는지 확인"""
+        calls = []
+
+        def request():
+            calls.append(1)
+            raise ValueError("validation")
+
+        with self.assertRaises(ValueError):
+            self.scheduler.call(request)
+
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from scripts.utils import settings as settings_module
+from scripts.utils.notion_client import NotionClientWrapper
+from scripts.utils.settings import Settings, get_settings, reset_settings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class SettingsTestCase(unittest.TestCase):
+    """공용 설정 캐시와 지연 import 테스트"""
+
+    def tearDown(self):
+        reset_settings()
+
+    def test_settings_are_loaded_once_until_reset(self):
+        """설정은 한 번만 읽고, 초기화하면 바뀐 환경 변수를 다시 읽는지 확인"""
+        reset_settings()
+        with patch.dict(os.environ, {"LLM_PROVIDER": "OpenAI"}):
+            with patch.object(
+                settings_module, "load_env", wraps=settings_module.load_env
+            ) as load_env:
+                first = get_settings()
+                self.assertIs(get_settings(), first)
+                self.assertEqual(load_env.call_count, 1)
+        self.assertEqual(first.llm_provider, "openai")
+
+        with patch.dict(os.environ, {"LLM_PROVIDER": "gemini"}):
+            self.assertEqual(get_settings().llm_provider, "openai")
+            reset_settings()
+            self.assertEqual(get_settings().llm_provider, "gemini")
+
+    def test_pool_sizes_are_read_from_env_file(self):
+        """.env에만 있는 NOTION_POOL_* 값이 공용 Notion 클라이언트의 커넥션 풀에 반영되는지 확인"""
+        from scripts.api import app
+
+        env_file = {
+            "NOTION_POOL_MAX_CONNECTIONS": "7",
+            "NOTION_POOL_MAX_KEEPALIVE": "3",
+            "NOTION_POOL_KEEPALIVE_EXPIRY": "12.5",
+        }
+
+        def fake_load_env():
+            for key, value in env_file.items():
+                os.environ.setdefault(key, value)
+
+        reset_settings()
+        app.close_notion_client()
+        with (
+            patch.dict(os.environ, {}),
+            patch.object(settings_module, "load_env", side_effect=fake_load_env),
+            patch.object(app, "create_pooled_http_client") as create_pool,
+            patch.object(app, "NotionClientWrapper"),
+        ):
+            app.get_notion_client()
+            settings = create_pool.call_args.kwargs["settings"]
+            app._notion_client = None
+
+        self.assertEqual(settings.notion_pool_max_connections, 7)
+        self.assertEqual(settings.notion_pool_max_keepalive, 3)
+        self.assertEqual(settings.notion_pool_keepalive_expiry, 12.5)
+
+    def test_notion_sdk_client_is_created_on_first_use(self):
+        """래퍼를 만들 때는 SDK 클라이언트를 만들지 않고 첫 접근 시 생성하는지 확인"""
+        wrapper = NotionClientWrapper(
+            settings=Settings(notion_api_key="secret", notion_daily_db="daily-db")
+        )
+        self.assertIsNone(wrapper._client)
+
+        client = wrapper.client
+
+        self.assertIs(wrapper.client, client)
+        wrapper.close()
+
+    def test_cli_entry_points_do_not_import_sdks(self):
+        """CLI/API 진입 모듈을 import해도 Notion SDK, httpx, dotenv가 로드되지 않는지 확인"""
+        script = (
+            "import json, sys\n"
+            "import scripts.daily_logger, scripts.weekly_processor\n"
+            "import scripts.monthly_processor\n"
+            "print(json.dumps([m for m in ('notion_client', 'httpx', 'dotenv')"
+            " if m in sys.modules]))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            env=dict(os.environ, PYTHONPATH=PROJECT_ROOT),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(json.loads(result.stdout), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
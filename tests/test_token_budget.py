@@ -0,0 +1,116 @@
+import threading
+import unittest
+
+from scripts.utils.llm_client import BaseLLMClient
+from scripts.utils.token_budget import (
+    estimate_tokens,
+    split_by_budget,
+    truncate_to_budget,
+)
+
+
+class _RecordingLLMClient(BaseLLMClient):
+    """받은 프롬프트를 기록하는 테스트용 클라이언트"""
+
+    provider_name = "fake"
+
+    def __init__(self, budget: int):
+        self.model = "fake-model"
+        self.max_tokens = 2000
+        self.input_token_budget = budget
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
+        with self._lock:
+            self.prompts.append(user_prompt)
+        if "부분 결과" in user_prompt:
+            return "## 주간 성과 요약\n통합 성과\n## 핵심 하이라이트\n통합 하이라이트"
+        return "## 주간 성과 요약\n부분 성과\n## 핵심 하이라이트\n부분 하이라이트"
+
+
+def _log(idx: int, context: str) -> dict:
+    return {
+        "properties": {"Title": {"title": [{"text": {"content": f"작업 {idx}"}}]}},
+        "content": context,
+    }
+
+
+class TokenBudgetTestCase(unittest.TestCase):
+    """토큰 추정 및 예산 분할 테스트"""
+
+    def test_estimate_counts_korean_denser_than_ascii(self):
+        """같은 글자 수라면 한글이 영문보다 토큰을 더 많이 차지하는지 확인"""
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("a" * 40), 10)
+        self.assertGreater(estimate_tokens("가" * 40), estimate_tokens("a" * 40))
+
+    def test_split_keeps_order_and_budget(self):
+        """분할 결과가 입력 순서를 유지하고 묶음마다 예산을 넘지 않는지 확인"""
+        parts = [f"part-{idx} " + "x" * 36 for idx in range(10)]
+
+        chunks = split_by_budget(parts, budget=35)
+
+        self.assertEqual([part for chunk in chunks for part in chunk], parts)
+        for chunk in chunks:
+            self.assertLessEqual(sum(estimate_tokens(part) for part in chunk), 35)
+
+    def test_oversized_part_is_truncated(self):
+        """예산보다 큰 단일 조각은 잘려서 단독 묶음이 되는지 확인"""
+        chunks = split_by_budget(["짧은 조각", "가" * 300], budget=50)
+
+        self.assertEqual(len(chunks), 2)
+        self.assertLessEqual(estimate_tokens(chunks[1][0]), 50)
+        self.assertLessEqual(estimate_tokens(truncate_to_budget("가" * 300, 20)), 20)
+
+
+class MapReduceSummaryTestCase(unittest.TestCase):
+    """입력이 예산을 넘을 때 나눠 요약하고 합치는지 검증"""
+
+    def test_small_input_uses_single_call(self):
+        """예산 안에 들어가는 입력은 한 번만 호출하는지 확인"""
+        client = _RecordingLLMClient(budget=60_000)
+
+        result = client.generate_weekly_summary([_log(1, "짧은 본문")])
+
+        self.assertEqual(len(client.prompts), 1)
+        self.assertEqual(result["bullet_points"], "부분 성과")
+
+    def test_empty_input_uses_single_call(self):
+        """입력이 없으면 부분 요약 없이 빈 템플릿으로 한 번만 호출하는지 확인"""
+        client = _RecordingLLMClient(budget=60_000)
+
+        result = client.generate_weekly_summary([])
+
+        self.assertEqual(len(client.prompts), 1)
+        self.assertNotIn("부분 결과", client.prompts[0])
+        self.assertEqual(result["bullet_points"], "부분 성과")
+
+    def test_large_input_is_mapped_then_reduced(self):
+        """예산을 넘는 입력은 묶음별로 요약한 뒤 통합 호출로 마무리하는지 확인"""
+        from scripts.utils.prompts import (
+            WEEKLY_SUMMARY_SYSTEM_PROMPT,
+            WEEKLY_SUMMARY_USER_TEMPLATE,
+        )
+
+        overhead = estimate_tokens(WEEKLY_SUMMARY_SYSTEM_PROMPT + WEEKLY_SUMMARY_USER_TEMPLATE)
+        client = _RecordingLLMClient(budget=overhead + 400)
+        logs = [_log(idx, "성능 개선 작업 상세 " * 40) for idx in range(6)]
+
+        result = client.generate_weekly_summary(logs)
+
+        map_prompts = [p for p in client.prompts if "부분 결과" not in p]
+        reduce_prompts = [p for p in client.prompts if "부분 결과" in p]
+        self.assertGreater(len(map_prompts), 1)
+        self.assertEqual(len(reduce_prompts), 1)
+        for idx in range(6):
+            self.assertEqual(
+                sum(f"작업 {idx}" in prompt for prompt in map_prompts),
+                1,
+            )
+        self.assertEqual(result["bullet_points"], "통합 성과")
+        self.assertEqual(result["key_highlights"], "통합 하이라이트")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from scripts.weekly_processor import WeeklyProcessor
+from scripts.weekly_processor import WeeklyProcessor, split_iso_weeks
 
 
 class WeeklyProcessorTestCase(unittest.TestCase):
@@ -14,7 +14,7 @@ class WeeklyProcessorTestCase(unittest.TestCase):
         self.mock_notion = MagicMock()
         self.mock_claude = MagicMock()
         self.processor = WeeklyProcessor(
-            notion_client=self.mock_notion, claude_client=self.mock_claude
+            notion_client=self.mock_notion, llm_client=self.mock_claude
         )
 
     def test_run_with_no_logs(self):
@@ -42,16 +42,20 @@ class WeeklyProcessorTestCase(unittest.TestCase):
         }
 
         self.mock_notion.get_daily_logs_with_content.return_value = sample_logs
-        self.mock_claude.generate_weekly_summary.return_value = summary_result
+        self.mock_claude.stream_weekly_summary.return_value = iter(["• 샘플 불릿"])
+        self.mock_claude.parse_weekly_response.return_value = summary_result
 
-        result = self.processor.run(
-            start_date=self.start_date,
-            end_date=self.end_date,
-            status_filter=None,
-            dry_run=True,
-        )
+        with patch("builtins.print"):
+            result = self.processor.run(
+                start_date=self.start_date,
+                end_date=self.end_date,
+                status_filter=None,
+                dry_run=True,
+            )
 
         self.assertEqual(result, summary_result)
+        self.mock_claude.stream_weekly_summary.assert_called_once_with(sample_logs)
+        self.mock_claude.generate_weekly_summary.assert_not_called()
         self.mock_notion.create_weekly_achievement.assert_not_called()
 
     def test_run_with_persist(self):
@@ -84,5 +88,210 @@ class WeeklyProcessorTestCase(unittest.TestCase):
         )
 
 
+def _daily_log(page_id: str, logged_date: str) -> dict:
+    return {
+        "id": page_id,
+        "properties": {"Logged Date": {"date": {"start": logged_date}}},
+    }
+
+
+class WeeklyBackfillTestCase(unittest.TestCase):
+    """여러 주를 한 번에 처리하는 백필 모드 테스트"""
+
+    def setUp(self):
+        self.mock_notion = MagicMock()
+        self.mock_llm = MagicMock()
+        self.mock_llm.generate_weekly_summary.side_effect = lambda logs: {
+            "bullet_points": ",".join(log["id"] for log in logs),
+            "key_highlights": "핵심",
+        }
+        self.mock_notion.attach_content.side_effect = lambda pages: [
+            {**page, "content": "본문"} for page in pages
+        ]
+        self.mock_notion.create_weekly_achievement.side_effect = lambda **kwargs: {
+            "id": f"weekly-{kwargs['period_start'].date()}"
+        }
+        self.processor = WeeklyProcessor(notion_client=self.mock_notion, llm_client=self.mock_llm)
+
+    def test_split_iso_weeks_clips_range(self):
+        """기간을 월~일 단위로 나누고 양 끝 주는 기간에 맞춰 자르는지 확인"""
+        weeks = split_iso_weeks(datetime(2025, 11, 5), datetime(2025, 11, 18))
+
+        self.assertEqual(
+            [(start.date().isoformat(), end.date().isoformat()) for start, end in weeks],
+            [
+                ("2025-11-05", "2025-11-09"),
+                ("2025-11-10", "2025-11-16"),
+                ("2025-11-17", "2025-11-18"),
+            ],
+        )
+
+    def test_backfill_queries_once_and_skips_existing_weeks(self):
+        """한 번의 조회로 주별로 나누고, 이미 저장된 주와 빈 주는 건너뛰는지 확인"""
+        self.mock_notion.iter_daily_logs.return_value = iter(
+            [
+                _daily_log("log-1", "2025-11-03T09:00:00"),
+                _daily_log("log-2", "2025-11-05T09:00:00"),
+                _daily_log("log-3", "2025-11-11T09:00:00"),
+                _daily_log("log-4", "2025-11-25T09:00:00"),
+            ]
+        )
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [{"properties": {"Period Start": {"date": {"start": "2025-11-10"}}}}]
+        )
+
+        results = self.processor.run_backfill(
+            datetime(2025, 11, 3), datetime(2025, 11, 30), max_workers=2
+        )
+
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["created", "skipped", "empty", "created"],
+        )
+        self.mock_notion.iter_daily_logs.assert_called_once()
+        self.mock_notion.attach_content.assert_called_once()
+        self.assertEqual(
+            [log["id"] for log in self.mock_notion.attach_content.call_args.args[0]],
+            ["log-1", "log-2", "log-4"],
+        )
+        self.assertEqual(self.mock_llm.generate_weekly_summary.call_count, 2)
+        self.mock_notion.create_weekly_achievement.assert_any_call(
+            period_start=datetime(2025, 11, 3),
+            period_end=datetime(2025, 11, 9),
+            bullet_points="log-1,log-2",
+            key_highlights="핵심",
+            source_log_ids=["log-1", "log-2"],
+        )
+
+    def test_backfill_compares_stored_period_ranges(self):
+        """기존 페이지가 주의 일부만 덮으면 덮이지 않은 날짜의 로그는 요약하는지 확인"""
+        self.mock_notion.iter_daily_logs.return_value = iter(
+            [
+                _daily_log("log-1", "2025-11-04T09:00:00"),
+                _daily_log("log-2", "2025-11-11T09:00:00"),
+                _daily_log("log-3", "2025-11-18T09:00:00"),
+            ]
+        )
+        # 일요일에 시작해 다음 주 대부분을 덮는 페이지 (ISO 주 기준이면 앞 주로 분류됨)
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                {
+                    "properties": {
+                        "Period Start": {"date": {"start": "2025-11-16"}},
+                        "Period End": {"date": {"start": "2025-11-22"}},
+                    }
+                }
+            ]
+        )
+
+        results = self.processor.run_backfill(datetime(2025, 11, 3), datetime(2025, 11, 23))
+
+        self.assertEqual(
+            [result["status"] for result in results], ["created", "created", "skipped"]
+        )
+        self.assertEqual(self.mock_llm.generate_weekly_summary.call_count, 2)
+        # 이미 덮인 11-16은 빼고 11-11 로그만 요약해 저장
+        self.mock_notion.create_weekly_achievement.assert_any_call(
+            period_start=datetime(2025, 11, 10),
+            period_end=datetime(2025, 11, 15),
+            bullet_points="log-2",
+            key_highlights="핵심",
+            source_log_ids=["log-2"],
+        )
+        query_start, query_end = self.mock_notion.iter_weekly_achievements.call_args.args
+        self.assertLessEqual(query_start, datetime(2025, 10, 27))
+        self.assertGreaterEqual(query_end, datetime(2025, 11, 30))
+
+    def test_backfill_summarizes_only_uncovered_logs(self):
+        """저장된 기간이 덮는 로그는 빼고 나머지 로그만 같은 주에서 요약하는지 확인"""
+        self.mock_notion.iter_daily_logs.return_value = iter(
+            [
+                _daily_log("log-1", "2025-11-10T09:00:00"),
+                _daily_log("log-2", "2025-11-12T09:00:00"),
+                _daily_log("log-3", "2025-11-14T09:00:00"),
+            ]
+        )
+        self.mock_notion.iter_weekly_achievements.return_value = iter(
+            [
+                {
+                    "properties": {
+                        "Period Start": {"date": {"start": "2025-11-10"}},
+                        "Period End": {"date": {"start": "2025-11-12"}},
+                    }
+                }
+            ]
+        )
+
+        results = self.processor.run_backfill(datetime(2025, 11, 10), datetime(2025, 11, 16))
+
+        self.assertEqual([result["status"] for result in results], ["created"])
+        self.assertEqual(
+            [log["id"] for log in self.mock_notion.attach_content.call_args.args[0]],
+            ["log-3"],
+        )
+        self.assertEqual(results[0]["week_start"], datetime(2025, 11, 13))
+        self.assertEqual(results[0]["week_end"], datetime(2025, 11, 16))
+
+    def test_backfill_reports_failed_week_without_stopping(self):
+        """한 주의 요약이 실패해도 나머지 주는 계속 처리되는지 확인"""
+        self.mock_notion.iter_daily_logs.return_value = iter(
+            [
+                _daily_log("log-1", "2025-11-03T09:00:00"),
+                _daily_log("log-2", "2025-11-10T09:00:00"),
+            ]
+        )
+        self.mock_notion.iter_weekly_achievements.return_value = iter([])
+
+        def summarize(logs):
+            if logs[0]["id"] == "log-1":
+                raise RuntimeError("LLM 오류")
+            return {"bullet_points": "성과", "key_highlights": "핵심"}
+
+        self.mock_llm.generate_weekly_summary.side_effect = summarize
+
+        results = self.processor.run_backfill(datetime(2025, 11, 3), datetime(2025, 11, 16))
+
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(results[0]["error"], "LLM 오류")
+        self.assertEqual(results[1]["status"], "created")
+
+    def test_failed_content_fetch_is_not_summarized(self):
+        """본문 조회에 실패한 로그가 있는 주는 요약/저장하지 않고 실패로 보고하는지 확인"""
+        self.mock_notion.iter_daily_logs.return_value = iter(
+            [
+                _daily_log("log-1", "2025-11-03T09:00:00"),
+                _daily_log("log-2", "2025-11-10T09:00:00"),
+            ]
+        )
+        self.mock_notion.iter_weekly_achievements.return_value = iter([])
+        self.mock_notion.attach_content.side_effect = lambda pages: [
+            {**page, "content": "", "content_error": "timeout"}
+            if page["id"] == "log-1"
+            else {**page, "content": "본문"}
+            for page in pages
+        ]
+
+        results = self.processor.run_backfill(datetime(2025, 11, 3), datetime(2025, 11, 16))
+
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertIn("log-1", results[0]["error"])
+        self.assertEqual(results[1]["status"], "created")
+        self.mock_llm.generate_weekly_summary.assert_called_once()
+        self.mock_notion.create_weekly_achievement.assert_called_once()
+
+    def test_run_aborts_when_content_fetch_failed(self):
+        """단일 주 실행에서 본문 조회 실패가 있으면 요약 없이 예외를 발생시키는지 확인"""
+        self.mock_notion.get_daily_logs_with_content.return_value = [
+            {"id": "log-1", "content": "", "content_error": "timeout"},
+            {"id": "log-2", "content": "본문"},
+        ]
+
+        with self.assertRaises(RuntimeError):
+            self.processor.run(datetime(2025, 11, 3), datetime(2025, 11, 9))
+
+        self.mock_llm.generate_weekly_summary.assert_not_called()
+        self.mock_notion.create_weekly_achievement.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()